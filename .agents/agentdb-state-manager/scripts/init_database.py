@@ -17,15 +17,30 @@ Constants:
   Rationale: Single source of truth for state definitions
 """
 
+from __future__ import annotations
+
 import argparse
-import hashlib
+import contextlib
+import io
 import json
+import re
 import sys
+from collections.abc import Mapping
 from datetime import UTC, datetime
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import duckdb
 
-import duckdb
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
 
 # Add workflow-utilities to path for worktree_context
 sys.path.insert(
@@ -33,25 +48,51 @@ sys.path.insert(
     str(Path(__file__).parent.parent.parent / "workflow-utilities" / "scripts"),
 )
 
+try:
+    from worktree_context import get_state_dir
+except ImportError:
+    # Fallback for missing module; resolved once at import
+    get_state_dir = None
+
 # Constants with documented rationale
 SCHEMA_VERSION = "1.0.0"  # Current schema version for migrations
 WORKFLOW_STATES_PATH = Path(__file__).parent.parent / "templates" / "workflow-states.json"
 SYNC_SCHEMA_PATH = Path(__file__).parent.parent / "schemas" / "agentdb_sync_schema.sql"
 
+# Statement separator: a semicolon that ends a line (keeps inline ";" in literals intact)
+_STMT_SEP = re.compile(r";[ \t]*(?:\r?\n|\Z)")
+
+
+def _get_duckdb() -> Any:
+    """Import duckdb on first use.
+
+    Deferring the import keeps --help and static imports of this module from
+    loading the native extension. Tests can patch this shim instead of the module.
+
+    Returns:
+        The duckdb module
+    """
+    import duckdb
+
+    return duckdb
+
 
+@cache
 def get_default_db_path() -> Path:
     """Get default database path in worktree state directory.
 
+    The result is cached because worktree detection shells out to git.
+
     Returns:
         Path to agentdb.duckdb in .claude-state/ directory.
         Falls back to current directory if worktree detection fails.
     """
+    if get_state_dir is None:
+        return Path("agentdb.duckdb")
     try:
-        from worktree_context import get_state_dir
-
         return get_state_dir() / "agentdb.duckdb"
-    except (ImportError, RuntimeError):
-        # Fallback for non-git environments or missing module
+    except RuntimeError:
+        # Fallback for non-git environments
         return Path("agentdb.duckdb")
 
 
@@ -67,6 +108,18 @@ class Colors:
     END = "\033[0m"
 
 
+# Skip escape sequences when stdout is not a terminal (CI logs, pipes)
+if not sys.stdout.isatty():
+    for _name in ("BLUE", "GREEN", "YELLOW", "RED", "BOLD", "END"):
+        setattr(Colors, _name, "")
+
+# Message prefixes, built once
+_PREFIX_ERR = f"{Colors.RED}✗ Error:{Colors.END} "
+_PREFIX_OK = f"{Colors.GREEN}✓{Colors.END} "
+_PREFIX_INFO = f"{Colors.BLUE}ℹ{Colors.END} "
+_PREFIX_WARN = f"{Colors.YELLOW}⚠{Colors.END} "
+
+
 def error_exit(message: str, code: int = 1) -> None:
     """Print error message and exit.
 
@@ -74,7 +127,7 @@ def error_exit(message: str, code: int = 1) -> None:
         message: Error message to display
         code: Exit code (default 1)
     """
-    print(f"{Colors.RED}✗ Error:{Colors.END} {message}", file=sys.stderr)
+    print(_PREFIX_ERR + message, file=sys.stderr)
     sys.exit(code)
 
 
@@ -84,7 +137,7 @@ def success(message: str) -> None:
     Args:
         message: Success message to display
     """
-    print(f"{Colors.GREEN}✓{Colors.END} {message}")
+    print(_PREFIX_OK + message)
 
 
 def info(message: str) -> None:
@@ -93,7 +146,7 @@ def info(message: str) -> None:
     Args:
         message: Info message to display
     """
-    print(f"{Colors.BLUE}ℹ{Colors.END} {message}")
+    print(_PREFIX_INFO + message)
 
 
 def warning(message: str) -> None:
@@ -102,7 +155,7 @@ def warning(message: str) -> None:
     Args:
         message: Warning message to display
     """
-    print(f"{Colors.YELLOW}⚠{Colors.END} {message}")
+    print(_PREFIX_WARN + message)
 
 
 def generate_session_id() -> str:
@@ -112,17 +165,24 @@ def generate_session_id() -> str:
         16-character hex session ID
 
     Rationale: Timestamp-based IDs are reproducible within a timeframe,
-    providing a balance between uniqueness and consistency.
+    providing a balance between uniqueness and consistency. BLAKE2b is used
+    instead of MD5 so the ID can be generated on FIPS-restricted systems.
     """
+    import hashlib
+
     current_time = datetime.now(UTC).isoformat()
-    return hashlib.md5(current_time.encode()).hexdigest()[:16]
+    return hashlib.blake2b(current_time.encode(), digest_size=8).hexdigest()
 
 
-def load_workflow_states() -> dict[str, Any]:
+@lru_cache(maxsize=1)
+def load_workflow_states() -> Mapping[str, Any]:
     """Load canonical state definitions from workflow-states.json.
 
+    The file is parsed once per process; later calls return the cached
+    result as a read-only mapping so callers cannot mutate shared state.
+
     Returns:
-        Dictionary of state definitions
+        Read-only mapping of state definitions
 
     Raises:
         FileNotFoundError: If workflow-states.json not found
@@ -134,103 +194,165 @@ def load_workflow_states() -> dict[str, Any]:
     info(f"Loading state definitions from {WORKFLOW_STATES_PATH.name}...")
 
     try:
-        with open(WORKFLOW_STATES_PATH, encoding="utf-8") as f:
-            states = json.load(f)
+        states = _json_loads(WORKFLOW_STATES_PATH.read_bytes())
         success(f"Loaded {len(states.get('states', {}))} object types")
-        return states
+        return MappingProxyType(states)
     except json.JSONDecodeError as e:
         error_exit(f"Invalid JSON in workflow-states.json: {e}")
     except Exception as e:
         error_exit(f"Failed to load workflow-states.json: {e}")
 
 
-def create_schema(session_id: str, workflow_states: dict[str, Any], db_path: Path) -> bool:
+def _strip_sql_comments(sql: str) -> str:
+    """Remove single-line SQL comments (-- ...).
+
+    A line is left untouched when an odd number of quotes precedes the
+    ``--``, since the marker then sits inside a string literal.
+
+    Args:
+        sql: SQL script text
+
+    Returns:
+        SQL text with single-line comments removed
+    """
+    lines = []
+    for line in sql.splitlines(keepends=False):
+        idx = line.find("--")
+        if idx != -1 and line.count("'", 0, idx) % 2 == 0:
+            line = line[:idx]
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _schema_signature(schema_sql: str) -> str:
+    """Compute a fingerprint of the sync schema and schema version.
+
+    Args:
+        schema_sql: Sync schema SQL text
+
+    Returns:
+        32-character hex digest
+    """
+    import hashlib
+
+    return hashlib.blake2b((schema_sql + SCHEMA_VERSION).encode(), digest_size=16).hexdigest()
+
+
+def _stored_schema_signature(conn: duckdb.DuckDBPyConnection) -> str | None:
+    """Read the schema signature recorded by a previous initialization.
+
+    Args:
+        conn: Open DuckDB connection (outside a transaction)
+
+    Returns:
+        Stored signature, or None for a new database or one initialized
+        before signatures were recorded
+    """
+    duckdb = _get_duckdb()
+
+    try:
+        row = conn.execute("SELECT value FROM session_metadata WHERE key = 'schema_signature'").fetchone()
+    except duckdb.Error:
+        # session_metadata does not exist yet
+        return None
+    return row[0] if row else None
+
+
+def create_schema(conn: duckdb.DuckDBPyConnection, session_id: str, workflow_version: str) -> bool:
     """Create AgentDB schema with tables and indexes.
 
     Args:
+        conn: Open DuckDB connection
         session_id: AgentDB session identifier
-        workflow_states: State definitions from workflow-states.json
-        db_path: Path to DuckDB database file
+        workflow_version: Version string from workflow-states.json
 
     Returns:
         True if schema created successfully, False otherwise
     """
+    duckdb = _get_duckdb()
+
     info("Creating AgentDB schema...")
 
     try:
-        # Ensure parent directory exists
-        db_path.parent.mkdir(parents=True, exist_ok=True)
+        schema_sql = SYNC_SCHEMA_PATH.read_text() if SYNC_SCHEMA_PATH.exists() else None
+        signature = _schema_signature(schema_sql) if schema_sql is not None else None
+
+        # Skip all DDL when the database already carries this exact schema
+        schema_current = signature is not None and _stored_schema_signature(conn) == signature
 
-        # Connect to DuckDB
-        conn = duckdb.connect(str(db_path))
+        # Run all DDL and metadata writes in one transaction (one commit instead of one per statement)
+        conn.execute("BEGIN TRANSACTION")
 
         # Load and execute the sync schema SQL file
-        if SYNC_SCHEMA_PATH.exists():
+        if schema_current:
+            info(f"Sync schema unchanged, skipping {SYNC_SCHEMA_PATH.name}")
+        elif schema_sql is not None:
             print(f"\n{Colors.BOLD}Executing sync schema from {SYNC_SCHEMA_PATH.name}:{Colors.END}")
-            schema_sql = SYNC_SCHEMA_PATH.read_text()
 
-            # Remove SQL comments
-            import re
-
-            # Remove single-line comments (-- ...)
-            schema_sql = re.sub(r"--[^\n]*\n", "\n", schema_sql)
-
-            # Split by semicolons
-            statements = [s.strip() for s in schema_sql.split(";") if s.strip()]
-
-            # Execute all statements
-            success_count = 0
-            for i, stmt in enumerate(statements, 1):
-                if stmt:
+            # Execute the whole script as one batch; DuckDB's parser handles comments and separators
+            try:
+                conn.execute(schema_sql)
+                print("  ✓ Executed schema in a single batch")
+            except duckdb.Error:
+                conn.execute("ROLLBACK")
+
+                # Fall back to per-statement autocommit execution to tolerate "already exists" errors
+                # and report which statement failed
+                stripped_sql = _strip_sql_comments(schema_sql)
+                success_count = 0
+                for i, stmt in enumerate(filter(None, map(str.strip, _STMT_SEP.split(stripped_sql))), 1):
                     try:
                         conn.execute(stmt)
                         success_count += 1
                     except Exception as e:
-                        if "already exists" not in str(e).lower():
-                            # Only warn for non-trivial errors
-                            if "SELECT" not in stmt[:20]:  # Skip validation queries
-                                warning(f"  Statement {i}: {str(e)[:60]}")
-            print(f"  ✓ Executed {success_count} statements")
+                        message = str(e)
+                        # Only warn for non-trivial errors, skipping validation queries
+                        if "already exists" not in message.lower() and "SELECT" not in stmt[:20].upper():
+                            warning(f"  Statement {i}: {message[:60]}")
+                print(f"  ✓ Executed {success_count} statements")
+                conn.execute("BEGIN TRANSACTION")
         else:
             warning(f"Sync schema not found: {SYNC_SCHEMA_PATH}")
 
         # Create session metadata table
         print(f"\n{Colors.BOLD}Creating session metadata:{Colors.END}")
 
-        session_statements = [
+        conn.execute(
             """
             CREATE TABLE IF NOT EXISTS session_metadata (
                 key VARCHAR PRIMARY KEY,
                 value VARCHAR
-            );
-            """,
-            f"""
-            INSERT INTO session_metadata (key, value)
-            VALUES
-                ('session_id', '{session_id}'),
-                ('schema_version', '{SCHEMA_VERSION}'),
-                ('workflow_version', '{workflow_states.get("version", "unknown")}'),
-                ('initialized_at', current_timestamp)
-            ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value;
-            """,
+            )
+            """
+        )
+        metadata = [
+            ("session_id", session_id),
+            ("schema_version", SCHEMA_VERSION),
+            ("workflow_version", workflow_version),
+            ("initialized_at", datetime.now(UTC).isoformat()),
         ]
-
-        for stmt in session_statements:
-            conn.execute(stmt.strip())
-
-        conn.close()
-        success(f"Schema created in {db_path}")
+        if signature is not None:
+            metadata.append(("schema_signature", signature))
+        conn.executemany(
+            "INSERT INTO session_metadata (key, value) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value",
+            metadata,
+        )
+
+        conn.execute("COMMIT")
+        success("Schema created")
         return True
 
     except Exception as e:
+        with contextlib.suppress(duckdb.Error):
+            conn.execute("ROLLBACK")
         error_exit(f"Schema creation failed: {e}")
 
 
-def validate_schema(db_path: Path) -> bool:
+def validate_schema(conn: duckdb.DuckDBPyConnection) -> bool:
     """Validate that schema was created correctly.
 
     Args:
-        db_path: Path to DuckDB database file
+        conn: Open DuckDB connection
 
     Returns:
         True if validation passed, False otherwise
@@ -238,23 +360,18 @@ def validate_schema(db_path: Path) -> bool:
     info("Validating schema...")
 
     try:
-        conn = duckdb.connect(str(db_path))
-
         # Check tables exist
-        tables = conn.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'main'").fetchall()
-        table_names = [t[0] for t in tables]
-
-        required_tables = ["session_metadata", "agent_synchronizations"]
-        for table in required_tables:
-            if table not in table_names:
-                error_exit(f"{table} table not found")
+        missing = conn.execute(
+            "SELECT t FROM (VALUES ('session_metadata'), ('agent_synchronizations')) v(t) "
+            "WHERE t NOT IN (SELECT table_name FROM duckdb_tables() WHERE schema_name = 'main')"
+        ).fetchall()
+        if missing:
+            error_exit(f"{missing[0][0]} table not found")
 
         # Check session metadata
-        count = conn.execute("SELECT COUNT(*) FROM session_metadata").fetchone()[0]
-        if count < 4:
-            warning(f"Expected 4 metadata rows, found {count}")
+        if not conn.execute("SELECT COUNT(*) >= 4 FROM session_metadata").fetchone()[0]:
+            warning("Expected at least 4 metadata rows")
 
-        conn.close()
         success("Schema validation passed")
         return True
 
@@ -262,46 +379,60 @@ def validate_schema(db_path: Path) -> bool:
         error_exit(f"Schema validation failed: {e}")
 
 
-def print_summary(session_id: str, workflow_states: dict[str, Any], db_path: Path) -> None:
+def print_summary(
+    session_id: str,
+    workflow_version: str,
+    object_types: Mapping[str, str],
+    states: Mapping[str, Any],
+    db_path: Path,
+) -> None:
     """Print initialization summary.
 
     Args:
         session_id: AgentDB session identifier
-        workflow_states: Loaded state definitions
+        workflow_version: Version string from workflow-states.json
+        object_types: Object type descriptions keyed by object type
+        states: State definitions keyed by object type
         db_path: Path to DuckDB database file
     """
-    print(f"\n{Colors.BOLD}{'=' * 70}{Colors.END}")
-    print(f"{Colors.BOLD}AgentDB Initialization Complete{Colors.END}")
-    print(f"{Colors.BOLD}{'=' * 70}{Colors.END}\n")
+    # Render into one buffer and write it once instead of one print() per line
+    buf = io.StringIO()
+
+    print(f"\n{Colors.BOLD}{'=' * 70}{Colors.END}", file=buf)
+    print(f"{Colors.BOLD}AgentDB Initialization Complete{Colors.END}", file=buf)
+    print(f"{Colors.BOLD}{'=' * 70}{Colors.END}\n", file=buf)
 
-    print(f"{Colors.BLUE}Database:{Colors.END} {db_path}")
-    print(f"{Colors.BLUE}Session ID:{Colors.END} {session_id}")
-    print(f"{Colors.BLUE}Schema Version:{Colors.END} {SCHEMA_VERSION}")
-    print(f"{Colors.BLUE}Workflow Version:{Colors.END} {workflow_states.get('version', 'unknown')}")
+    print(f"{Colors.BLUE}Database:{Colors.END} {db_path}", file=buf)
+    print(f"{Colors.BLUE}Session ID:{Colors.END} {session_id}", file=buf)
+    print(f"{Colors.BLUE}Schema Version:{Colors.END} {SCHEMA_VERSION}", file=buf)
+    print(f"{Colors.BLUE}Workflow Version:{Colors.END} {workflow_version}", file=buf)
 
-    print(f"\n{Colors.BOLD}Loaded State Definitions:{Colors.END}")
-    for obj_type, description in workflow_states.get("object_types", {}).items():
-        state_count = len(workflow_states.get("states", {}).get(obj_type, {}))
-        print(f"  • {obj_type}: {state_count} states - {description}")
+    print(f"\n{Colors.BOLD}Loaded State Definitions:{Colors.END}", file=buf)
+    for obj_type, description in object_types.items():
+        state_count = len(states.get(obj_type, ()))
+        print(f"  • {obj_type}: {state_count} states - {description}", file=buf)
 
-    print(f"\n{Colors.BOLD}Created Tables:{Colors.END}")
-    print("  ✓ session_metadata (session configuration)")
-    print("  ✓ schema_metadata (schema versioning)")
-    print("  ✓ agent_synchronizations (workflow sync events)")
-    print("  ✓ sync_executions (execution details)")
-    print("  ✓ sync_audit_trail (HIPAA compliance audit)")
+    print(f"\n{Colors.BOLD}Created Tables:{Colors.END}", file=buf)
+    print("  ✓ session_metadata (session configuration)", file=buf)
+    print("  ✓ schema_metadata (schema versioning)", file=buf)
+    print("  ✓ agent_synchronizations (workflow sync events)", file=buf)
+    print("  ✓ sync_executions (execution details)", file=buf)
+    print("  ✓ sync_audit_trail (HIPAA compliance audit)", file=buf)
 
-    print(f"\n{Colors.BOLD}Created Views:{Colors.END}")
-    print("  ✓ v_current_sync_status (latest sync state)")
-    print("  ✓ v_phi_access_audit (HIPAA compliance)")
-    print("  ✓ v_sync_performance (metrics)")
+    print(f"\n{Colors.BOLD}Created Views:{Colors.END}", file=buf)
+    print("  ✓ v_current_sync_status (latest sync state)", file=buf)
+    print("  ✓ v_phi_access_audit (HIPAA compliance)", file=buf)
+    print("  ✓ v_sync_performance (metrics)", file=buf)
 
-    print(f"\n{Colors.BOLD}Next Steps:{Colors.END}")
-    print("  1. Record workflow transition: python record_sync.py --pattern phase_1_specify")
-    print("  2. Query workflow state: python query_workflow_state.py")
-    print("  3. Analyze metrics: python analyze_metrics.py")
+    print(f"\n{Colors.BOLD}Next Steps:{Colors.END}", file=buf)
+    print("  1. Record workflow transition: python record_sync.py --pattern phase_1_specify", file=buf)
+    print("  2. Query workflow state: python query_workflow_state.py", file=buf)
+    print("  3. Analyze metrics: python analyze_metrics.py", file=buf)
 
-    print(f"\n{Colors.GREEN}🎉 AgentDB ready for workflow state tracking!{Colors.END}\n")
+    print(f"\n{Colors.GREEN}🎉 AgentDB ready for workflow state tracking!{Colors.END}\n", file=buf)
+
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 def main() -> None:
@@ -327,9 +458,8 @@ Examples:
 
     args = parser.parse_args()
 
-    print(f"\n{Colors.BOLD}{'=' * 70}{Colors.END}")
-    print(f"{Colors.BOLD}AgentDB Initialization{Colors.END}")
-    print(f"{Colors.BOLD}{'=' * 70}{Colors.END}\n")
+    rule = f"{Colors.BOLD}{'=' * 70}{Colors.END}"
+    print(f"\n{rule}\n{Colors.BOLD}AgentDB Initialization{Colors.END}\n{rule}\n")
 
     # Get database path
     db_path = Path(args.db_path) if args.db_path else get_default_db_path()
@@ -342,19 +472,30 @@ Examples:
     else:
         info(f"Using provided session ID: {session_id}")
 
-    # Load canonical state definitions
+    # Load canonical state definitions (cached by load_workflow_states)
     workflow_states = load_workflow_states()
+    workflow_version = workflow_states.get("version", "unknown")
+    object_types = workflow_states.get("object_types", {})
+    states = workflow_states.get("states", {})
 
-    # Create schema
-    if not create_schema(session_id, workflow_states, db_path):
-        error_exit("Schema creation failed")
+    # Ensure parent directory exists
+    db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Validate schema
-    if not validate_schema(db_path):
-        error_exit("Schema validation failed")
+    # Share one connection across schema creation and validation
+    conn = _get_duckdb().connect(str(db_path))
+    try:
+        # Create schema
+        if not create_schema(conn, session_id, workflow_version):
+            error_exit("Schema creation failed")
+
+        # Validate schema
+        if not validate_schema(conn):
+            error_exit("Schema validation failed")
+    finally:
+        conn.close()
 
     # Print summary
-    print_summary(session_id, workflow_states, db_path)
+    print_summary(session_id, workflow_version, object_types, states, db_path)
 
 
 if __name__ == "__main__":
@@ -14,23 +14,47 @@ Supports both local CPU-only deployment and GCP cloud-native deployment.
 __version__ = "0.1.0"
 __author__ = "Harrold Holdings GmbH"
 
-# Local deployment imports (optional - may not be available in GCP mode)
-try:
-    from .diarization import DiarizationConfig, Diarizer  # noqa: F401
-    from .process_audio import AudioProcessor  # noqa: F401
-    from .situation import SituationClassifier as LocalSituationClassifier  # noqa: F401
-    from .situation import SituationConfig  # noqa: F401
-    from .transcription import Transcriber, WhisperConfig  # noqa: F401
-except ImportError:
-    pass
-
-# GCP deployment imports (optional - may not be available in local mode)
-try:
-    from .audio_processor import AudioProcessor as GCPAudioProcessor  # noqa: F401
-    from .audio_processor import ProcessingResult  # noqa: F401
-    from .situation_classifier import SituationClassifier as GCPSituationClassifier  # noqa: F401
-    from .situation_classifier import SituationPrediction, SituationResult  # noqa: F401
-    from .speech_client import SpeechClient, TranscriptionResult, TranscriptSegment  # noqa: F401
-    from .storage_manager import StorageManager  # noqa: F401
-except ImportError:
-    pass
+import importlib
+from typing import Any
+
+# Public symbols resolved lazily (PEP 562): name -> (submodule, attribute).
+# Local deployment symbols need torch/whisper/pyannote and GCP symbols need the
+# google-cloud clients, so submodules are only imported on first access.
+_LAZY: dict[str, tuple[str, str]] = {
+    # Local deployment
+    "DiarizationConfig": ("diarization", "DiarizationConfig"),
+    "Diarizer": ("diarization", "Diarizer"),
+    "AudioProcessor": ("process_audio", "AudioProcessor"),
+    "LocalSituationClassifier": ("situation", "SituationClassifier"),
+    "SituationConfig": ("situation", "SituationConfig"),
+    "Transcriber": ("transcription", "Transcriber"),
+    "WhisperConfig": ("transcription", "WhisperConfig"),
+    # GCP deployment
+    "GCPAudioProcessor": ("audio_processor", "AudioProcessor"),
+    "ProcessingResult": ("audio_processor", "ProcessingResult"),
+    "GCPSituationClassifier": ("situation_classifier", "SituationClassifier"),
+    "SituationPrediction": ("situation_classifier", "SituationPrediction"),
+    "SituationResult": ("situation_classifier", "SituationResult"),
+    "SpeechClient": ("speech_client", "SpeechClient"),
+    "TranscriptionResult": ("speech_client", "TranscriptionResult"),
+    "TranscriptSegment": ("speech_client", "TranscriptSegment"),
+    "StorageManager": ("storage_manager", "StorageManager"),
+}
+
+# No __all__: ``from src import *`` would resolve every lazy name and so load
+# (or fail on) every backend. Without it, star-imports skip the lazy names.
+
+
+def __getattr__(name: str) -> Any:
+    """Import the backing submodule on first access to a public symbol."""
+    target = _LAZY.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -2,29 +2,71 @@
 Main audio processing orchestrator for the Media Intelligence Pipeline.
 """
 
+import contextlib
+import io
 import logging
+import os
+import shutil
 import tempfile
+import threading
 import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
+from pathlib import Path
 from typing import Any
 
+from google.api_core import exceptions
+
 from .gcp_utils import (
+    CostModel,
+    duration_cache,
     estimate_cost,
-    format_timestamp,
+    format_timestamps,
     generate_file_id,
     get_audio_duration,
     get_file_extension,
+    get_header_duration,
     is_supported_format,
     load_config,
     validate_audio_duration,
 )
 from .situation_classifier import SituationClassifier, SituationPrediction, SituationResult
-from .speech_client import SpeechClient, TranscriptionResult, TranscriptSegment
+from .speech_client import SegmentColumns, SpeechClient, TranscriptionResult, TranscriptSegment
 from .storage_manager import StorageManager
 
 logger = logging.getLogger(__name__)
 
+# Number of files probed ahead beyond the files currently being processed
+_PREFETCH_SLOTS = 2
+
+# Bytes fetched from the start of a file to read its duration from the header
+_HEADER_PROBE_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ProcessingParams:
+    """Processing settings resolved once per file from config and overrides."""
+
+    supported_formats: tuple[str, ...]
+    language_code: str
+    model: str
+    diarization_enabled: bool
+    min_speakers: int
+    max_speakers: int
+    situation_enabled: bool
+    segment_duration: float
+    max_duration_minutes: float
+    json_enabled: bool
+    txt_enabled: bool
+    txt_include_speakers: bool
+    txt_include_timestamps: bool
+    results_prefix: str
+    transcripts_prefix: str
+    speech_output_gcs_prefix: str | None
+
 
 @dataclass
 class ProcessingResult:
@@ -44,16 +86,33 @@ class ProcessingResult:
     metadata: dict[str, Any] = field(default_factory=dict)
     transcript_uri: str | None = None
     error: str | None = None
+    # Columnar copy of transcript_segments, built on first use when not supplied
+    transcript_columns: SegmentColumns | None = field(default=None, repr=False, compare=False)
+
+    # Serialized segments and predictions, built on the first to_dict call
+    _segment_dicts: list[dict[str, Any]] | None = field(default=None, init=False, repr=False, compare=False)
+    _prediction_dicts: list[dict[str, Any]] | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
+        """
+        Convert to dictionary for JSON serialization.
+
+        Segment and prediction dicts are built once and reused by later calls,
+        so transcript_segments and situation_predictions should not be modified
+        after the first call.
+        """
+        if self._segment_dicts is None:
+            self._segment_dicts = [s.to_dict() for s in self.transcript_segments]
+        if self._prediction_dicts is None:
+            self._prediction_dicts = [p.to_dict() for p in self.situation_predictions]
+
         return {
             "gcs_input_uri": self.gcs_input_uri,
             "gcs_output_uri": self.gcs_output_uri,
             "file_id": self.file_id,
             "duration": self.duration,
-            "transcript_segments": [s.to_dict() for s in self.transcript_segments],
-            "situation_predictions": [p.to_dict() for p in self.situation_predictions],
+            "transcript_segments": self._segment_dicts,
+            "situation_predictions": self._prediction_dicts,
             "speaker_count": self.speaker_count,
             "overall_situation": self.overall_situation,
             "overall_situation_confidence": self.overall_situation_confidence,
@@ -64,6 +123,13 @@ class ProcessingResult:
             "error": self.error,
         }
 
+    @property
+    def columns(self) -> SegmentColumns:
+        """Columnar view of the transcript segments."""
+        if self.transcript_columns is None:
+            self.transcript_columns = SegmentColumns.from_segments(self.transcript_segments)
+        return self.transcript_columns
+
     def get_transcript_text(
         self,
         include_speakers: bool = True,
@@ -79,29 +145,32 @@ class ProcessingResult:
         Returns:
             Formatted transcript string.
         """
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
         current_speaker = None
+        columns = self.columns
+        timestamps = format_timestamps(columns.starts) if include_timestamps else None
 
-        for segment in self.transcript_segments:
-            parts = []
+        for i, (speaker_tag, text) in enumerate(zip(columns.speakers.tolist(), columns.texts.tolist(), strict=True)):
+            if i:
+                write("\n")
 
             # Add timestamp
-            if include_timestamps:
-                ts = format_timestamp(segment.start_time)
-                parts.append(f"[{ts}]")
+            if timestamps is not None:
+                write("[")
+                write(timestamps[i])
+                write("] ")
 
             # Add speaker label
-            if include_speakers and segment.speaker_tag is not None:
-                if segment.speaker_tag != current_speaker:
-                    current_speaker = segment.speaker_tag
-                    parts.append(f"Speaker {current_speaker + 1}:")
+            if include_speakers and speaker_tag is not None:
+                if speaker_tag != current_speaker:
+                    current_speaker = speaker_tag
+                    write(f"Speaker {current_speaker + 1}: ")
 
             # Add text
-            parts.append(segment.text)
-
-            lines.append(" ".join(parts))
+            write(text)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
 
 class AudioProcessor:
@@ -134,25 +203,42 @@ class AudioProcessor:
         self._situation_classifier = situation_classifier
         self._storage_manager = storage_manager
 
+        # Guards lazy component creation when files are processed concurrently
+        self._init_lock = threading.Lock()
+
+        # Reusable scratch space for duration-probe downloads: on disk, plus an
+        # in-memory directory used for files that fit in its free space
+        self._scratch_dir = Path(tempfile.mkdtemp(prefix="mi-"))
+        weakref.finalize(self, shutil.rmtree, self._scratch_dir, ignore_errors=True)
+        self._shm_scratch_dir = Path(tempfile.mkdtemp(prefix="mi-", dir="/dev/shm")) if os.path.isdir("/dev/shm") else None
+        if self._shm_scratch_dir is not None:
+            weakref.finalize(self, shutil.rmtree, self._shm_scratch_dir, ignore_errors=True)
+
     @property
     def speech_client(self) -> SpeechClient:
         """Lazy initialization of Speech client."""
         if self._speech_client is None:
-            self._speech_client = SpeechClient()
+            with self._init_lock:
+                if self._speech_client is None:
+                    self._speech_client = SpeechClient()
         return self._speech_client
 
     @property
     def situation_classifier(self) -> SituationClassifier:
         """Lazy initialization of Situation classifier."""
         if self._situation_classifier is None:
-            self._situation_classifier = SituationClassifier()
+            with self._init_lock:
+                if self._situation_classifier is None:
+                    self._situation_classifier = SituationClassifier()
         return self._situation_classifier
 
     @property
     def storage_manager(self) -> StorageManager:
         """Lazy initialization of Storage manager."""
         if self._storage_manager is None:
-            self._storage_manager = StorageManager()
+            with self._init_lock:
+                if self._storage_manager is None:
+                    self._storage_manager = StorageManager()
         return self._storage_manager
 
     def process_file(
@@ -175,34 +261,33 @@ class AudioProcessor:
         start_time = time.time()
         file_id = generate_file_id()
 
-        # Merge configuration
-        processing_config = self._merge_config(config)
+        # Resolve configuration
+        params = self._resolve_params(config)
 
-        logger.info(f"Processing {gcs_uri} (file_id: {file_id})")
+        logger.info("Processing %s (file_id: %s)", gcs_uri, file_id)
 
         try:
             # Validate input
-            self._validate_input(gcs_uri, processing_config)
+            metadata = self._validate_input(gcs_uri, params)
 
             # Get audio duration
-            duration = self._get_duration(gcs_uri)
+            duration = self._get_duration(gcs_uri, metadata)
 
             # Validate duration
-            max_duration = processing_config.get("processing", {}).get("max_duration_minutes", 480)
-            validate_audio_duration(duration, max_duration)
+            validate_audio_duration(duration, params.max_duration_minutes)
 
             # Run transcription
-            transcription_result = self._transcribe(gcs_uri, processing_config)
+            transcription_result = self._transcribe(gcs_uri, params)
 
             # Run situation classification
-            situation_result = self._classify_situations(gcs_uri, duration, processing_config)
+            situation_result = self._classify_situations(gcs_uri, duration, params)
 
             # Calculate cost estimate
             cost = estimate_cost(
                 duration,
-                self.config,
-                enable_diarization=processing_config.get("speech", {}).get("diarization", {}).get("enabled", True),
-                enable_situation_detection=processing_config.get("situation", {}).get("enabled", True),
+                enable_diarization=params.diarization_enabled,
+                enable_situation_detection=params.situation_enabled,
+                cost_model=self._cost_model,
             )
 
             # Build result
@@ -214,6 +299,7 @@ class AudioProcessor:
                 file_id=file_id,
                 duration=duration,
                 transcript_segments=transcription_result.segments,
+                transcript_columns=transcription_result.columns,
                 situation_predictions=situation_result.predictions,
                 speaker_count=transcription_result.speaker_count,
                 overall_situation=situation_result.overall_situation,
@@ -224,25 +310,26 @@ class AudioProcessor:
                     gcs_uri,
                     transcription_result,
                     situation_result,
-                    processing_config,
+                    params,
                 ),
             )
 
             # Save outputs
-            result = self._save_outputs(result, output_bucket, processing_config)
+            result = self._save_outputs(result, output_bucket, params)
 
             logger.info(
-                f"Processing complete for {gcs_uri}: "
-                f"{len(result.transcript_segments)} segments, "
-                f"{result.speaker_count} speakers, "
-                f"{result.overall_situation} situation, "
-                f"{processing_time:.2f}s processing time"
+                "Processing complete for %s: %s segments, %s speakers, %s situation, %.2fs processing time",
+                gcs_uri,
+                len(result.transcript_segments),
+                result.speaker_count,
+                result.overall_situation,
+                processing_time,
             )
 
             return result
 
         except Exception as e:
-            logger.error(f"Processing failed for {gcs_uri}: {e}", exc_info=True)
+            logger.error("Processing failed for %s: %s", gcs_uri, e, exc_info=True)
 
             # Return error result
             return ProcessingResult(
@@ -260,65 +347,170 @@ class AudioProcessor:
                 error=str(e),
             )
 
-    def _merge_config(self, overrides: dict[str, Any] | None) -> dict[str, Any]:
-        """Merge override configuration with defaults."""
-        if overrides is None:
-            return self.config
-
-        merged = self.config.copy()
+    @cached_property
+    def _default_params(self) -> ProcessingParams:
+        """Parameters for the loaded configuration without overrides."""
+        return self._resolve_params({})
 
-        # Simple shallow merge for common overrides
-        if "language_code" in overrides:
-            merged.setdefault("speech", {})["language_codes"] = [overrides["language_code"]]
+    @cached_property
+    def _cost_model(self) -> CostModel:
+        """Cost rates for the loaded configuration."""
+        return CostModel.from_config(self.config)
 
-        if "model" in overrides:
-            merged.setdefault("speech", {})["model"] = overrides["model"]
-
-        if "min_speakers" in overrides:
-            merged.setdefault("speech", {}).setdefault("diarization", {})["min_speaker_count"] = overrides["min_speakers"]
+    def _resolve_params(self, overrides: dict[str, Any] | None) -> ProcessingParams:
+        """Resolve configuration and per-request overrides into ProcessingParams."""
+        if overrides is None:
+            return self._default_params
 
-        if "max_speakers" in overrides:
-            merged.setdefault("speech", {}).setdefault("diarization", {})["max_speaker_count"] = overrides["max_speakers"]
+        config = self.config
+        speech_config = config.get("speech", {})
+        diarization_config = speech_config.get("diarization", {})
+        situation_config = config.get("situation", {})
+        processing_config = config.get("processing", {})
+        output_config = config.get("output", {})
+        json_config = output_config.get("json", {})
+        txt_config = output_config.get("txt", {})
+        storage_config = config.get("storage", {})
 
-        return merged
+        language_code = overrides.get("language_code")
+        if language_code is None:
+            language_code = speech_config.get("language_codes", ["en-US"])[0]
+
+        return ProcessingParams(
+            supported_formats=tuple(config.get("supported_formats", ())),
+            language_code=language_code,
+            model=overrides.get("model", speech_config.get("model", "long")),
+            diarization_enabled=diarization_config.get("enabled", True),
+            min_speakers=overrides.get("min_speakers", diarization_config.get("min_speaker_count", 2)),
+            max_speakers=overrides.get("max_speakers", diarization_config.get("max_speaker_count", 6)),
+            situation_enabled=situation_config.get("enabled", True),
+            segment_duration=processing_config.get("segment_duration", 30),
+            max_duration_minutes=processing_config.get("max_duration_minutes", 480),
+            json_enabled=json_config.get("enabled", True),
+            txt_enabled=txt_config.get("enabled", True),
+            txt_include_speakers=txt_config.get("include_speaker_labels", True),
+            txt_include_timestamps=txt_config.get("include_timestamps", True),
+            results_prefix=storage_config.get("results_prefix", "results/"),
+            transcripts_prefix=storage_config.get("transcripts_prefix", "transcripts/"),
+            speech_output_gcs_prefix=speech_config.get("output_gcs_prefix") or None,
+        )
 
-    def _validate_input(self, gcs_uri: str, config: dict[str, Any]) -> None:
-        """Validate input file."""
+    def _validate_input(self, gcs_uri: str, params: ProcessingParams) -> dict[str, Any]:
+        """Validate input file and return its GCS metadata."""
         # Check format
-        supported = config.get("supported_formats", [])
+        supported = list(params.supported_formats)
         if supported and not is_supported_format(gcs_uri, supported):
             ext = get_file_extension(gcs_uri)
             raise ValueError(f"Unsupported audio format: {ext}")
 
-        # Check file exists
-        if not self.storage_manager.file_exists(gcs_uri):
-            raise FileNotFoundError(f"File not found: {gcs_uri}")
+        # Check file exists, keeping the metadata for the duration probe
+        try:
+            return self.storage_manager.get_file_metadata(gcs_uri)
+        except exceptions.NotFound:
+            raise FileNotFoundError(f"File not found: {gcs_uri}") from None
 
-    def _get_duration(self, gcs_uri: str) -> float:
-        """Get audio duration, downloading if necessary."""
-        with tempfile.NamedTemporaryFile(suffix=f".{get_file_extension(gcs_uri)}", delete=True) as tmp:
-            local_path = self.storage_manager.download_file(gcs_uri, tmp.name)
-            return get_audio_duration(local_path)
+    def _get_duration(self, gcs_uri: str, metadata: dict[str, Any] | None = None) -> float:
+        """
+        Get audio duration, avoiding a full download where possible.
 
-    def _transcribe(self, gcs_uri: str, config: dict[str, Any]) -> TranscriptionResult:
-        """Run transcription."""
-        speech_config = config.get("speech", {})
-        diarization_config = speech_config.get("diarization", {})
+        Checks, in order: durations already probed in this process, a
+        ``duration`` custom metadata field on the object, and the container
+        header from a ranged read. Only if all of those fail
+        is the whole file downloaded. Cached durations are keyed by the object
+        generation, so an overwritten file is probed again.
 
+        Args:
+            gcs_uri: GCS URI of the audio file.
+            metadata: Object metadata from get_file_metadata, if already fetched.
+        """
+        if metadata is None:
+            try:
+                metadata = self.storage_manager.get_file_metadata(gcs_uri)
+            except Exception as e:
+                logger.debug("No metadata for %s: %s", gcs_uri, e)
+                metadata = {}
+
+        generation = metadata.get("generation")
+        duration = duration_cache.get(gcs_uri, generation)
+        if duration is not None:
+            return duration
+
+        duration = self._probe_duration(gcs_uri, metadata)
+        if duration is None:
+            duration = self._download_duration(gcs_uri, metadata.get("size"))
+
+        duration_cache.put(gcs_uri, generation, duration)
+
+        return duration
+
+    def _download_duration(self, gcs_uri: str, size: int | None) -> float:
+        """
+        Download a file to scratch space and read its duration.
+
+        The in-memory scratch directory is only used when the object size is
+        known and fits comfortably in its free space (container /dev/shm is
+        often just 64 MB); otherwise, or if writing there fails, the file goes
+        to the on-disk scratch directory.
+        """
+        if self._shm_scratch_dir is not None and isinstance(size, int) and size < self._free_bytes(self._shm_scratch_dir) // 2:
+            try:
+                return self._download_duration_to(gcs_uri, self._shm_scratch_dir)
+            except OSError as e:
+                logger.debug("In-memory probe download failed for %s, retrying on disk: %s", gcs_uri, e)
+
+        return self._download_duration_to(gcs_uri, self._scratch_dir)
+
+    def _download_duration_to(self, gcs_uri: str, scratch_dir: Path) -> float:
+        """Download a file into scratch_dir and read its duration."""
+        # One probe file per thread, overwritten by each download and
+        # truncated afterwards so it holds no data between files
+        probe_path = scratch_dir / f"probe-{threading.get_ident()}.{get_file_extension(gcs_uri)}"
+        try:
+            return get_audio_duration(self.storage_manager.download_file(gcs_uri, str(probe_path)))
+        finally:
+            with contextlib.suppress(OSError):
+                os.truncate(probe_path, 0)
+
+    @staticmethod
+    def _free_bytes(path: Path) -> int:
+        """Free space on the filesystem holding path, or 0 if it cannot be read."""
+        try:
+            return shutil.disk_usage(path).free
+        except OSError:
+            return 0
+
+    def _probe_duration(self, gcs_uri: str, metadata: dict[str, Any]) -> float | None:
+        """Read duration from object metadata or the file header without a full download."""
+        value = (metadata.get("metadata") or {}).get("duration")
+        if isinstance(value, str | int | float):
+            try:
+                return float(value)
+            except ValueError:
+                logger.debug("Invalid duration metadata for %s: %r", gcs_uri, value)
+
+        try:
+            header = self.storage_manager.download_range(gcs_uri, 0, _HEADER_PROBE_BYTES - 1)
+            return get_header_duration(header, get_file_extension(gcs_uri))
+        except Exception as e:
+            logger.debug("Header duration probe failed for %s: %s", gcs_uri, e)
+            return None
+
+    def _transcribe(self, gcs_uri: str, params: ProcessingParams) -> TranscriptionResult:
+        """Run transcription."""
         return self.speech_client.transcribe_gcs(
             gcs_uri=gcs_uri,
-            language_code=speech_config.get("language_codes", ["en-US"])[0],
-            model=speech_config.get("model", "long"),
-            enable_diarization=diarization_config.get("enabled", True),
-            min_speaker_count=diarization_config.get("min_speaker_count", 2),
-            max_speaker_count=diarization_config.get("max_speaker_count", 6),
+            language_code=params.language_code,
+            model=params.model,
+            enable_diarization=params.diarization_enabled,
+            min_speaker_count=params.min_speakers,
+            max_speaker_count=params.max_speakers,
+            output_gcs_prefix=params.speech_output_gcs_prefix,
+            storage_manager=self.storage_manager,
         )
 
-    def _classify_situations(self, gcs_uri: str, duration: float, config: dict[str, Any]) -> SituationResult:
+    def _classify_situations(self, gcs_uri: str, duration: float, params: ProcessingParams) -> SituationResult:
         """Run situation classification."""
-        situation_config = config.get("situation", {})
-
-        if not situation_config.get("enabled", True):
+        if not params.situation_enabled:
             # Return empty result if disabled
             return SituationResult(
                 predictions=[],
@@ -327,11 +519,9 @@ class AudioProcessor:
                 segment_duration=30.0,
             )
 
-        segment_duration = config.get("processing", {}).get("segment_duration", 30)
-
         return self.situation_classifier.classify_audio(
             gcs_uri=gcs_uri,
-            segment_duration=segment_duration,
+            segment_duration=params.segment_duration,
             total_duration=duration,
             storage_manager=self.storage_manager,
         )
@@ -341,7 +531,7 @@ class AudioProcessor:
         gcs_uri: str,
         transcription_result: TranscriptionResult,
         situation_result: SituationResult,
-        config: dict[str, Any],
+        params: ProcessingParams,
     ) -> dict[str, Any]:
         """Build metadata dictionary."""
         return {
@@ -349,8 +539,8 @@ class AudioProcessor:
             "processed_at": datetime.utcnow().isoformat(),
             "model_used": transcription_result.model_used,
             "language_code": transcription_result.language_code,
-            "diarization_enabled": config.get("speech", {}).get("diarization", {}).get("enabled", True),
-            "situation_classification_enabled": config.get("situation", {}).get("enabled", True),
+            "diarization_enabled": params.diarization_enabled,
+            "situation_classification_enabled": params.situation_enabled,
             "segment_duration": situation_result.segment_duration,
         }
 
@@ -358,18 +548,15 @@ class AudioProcessor:
         self,
         result: ProcessingResult,
         output_bucket: str | None,
-        config: dict[str, Any],
+        params: ProcessingParams,
     ) -> ProcessingResult:
         """Save output files to GCS."""
         if output_bucket is None:
             output_bucket = self.storage_manager.output_bucket
 
-        output_config = config.get("output", {})
-        storage_config = config.get("storage", {})
-
         # Save JSON result
-        if output_config.get("json", {}).get("enabled", True):
-            json_path = f"{storage_config.get('results_prefix', 'results/')}{result.file_id}.json"
+        if params.json_enabled:
+            json_path = f"{params.results_prefix}{result.file_id}.json"
             result.gcs_output_uri = self.storage_manager.upload_json(
                 result.to_dict(),
                 bucket_name=output_bucket,
@@ -377,13 +564,13 @@ class AudioProcessor:
             )
 
         # Save plain text transcript
-        if output_config.get("txt", {}).get("enabled", True):
-            txt_config = output_config.get("txt", {})
+        if params.txt_enabled:
             transcript_text = result.get_transcript_text(
-                include_speakers=txt_config.get("include_speaker_labels", True),
-                include_timestamps=txt_config.get("include_timestamps", True),
+                include_speakers=params.txt_include_speakers,
+                include_timestamps=params.txt_include_timestamps,
             )
-            txt_path = f"{storage_config.get('transcripts_prefix', 'transcripts/')}{result.file_id}.txt"
+
+            txt_path = f"{params.transcripts_prefix}{result.file_id}.txt"
             result.transcript_uri = self.storage_manager.upload_text(
                 transcript_text,
                 bucket_name=output_bucket,
@@ -397,22 +584,74 @@ class AudioProcessor:
         gcs_uris: list[str],
         output_bucket: str | None = None,
         config: dict[str, Any] | None = None,
+        max_workers: int = 4,
     ) -> list[ProcessingResult]:
         """
-        Process multiple audio files.
+        Process multiple audio files concurrently.
+
+        Files are processed on a thread pool since each one spends most of its
+        time waiting on GCS and Speech-to-Text RPCs. Execution is overlapped but
+        results are returned in the same order as gcs_uris.
+
+        A single background thread probes the durations of upcoming files
+        while earlier files are still transcribing, so process_file finds them
+        cached. The probe reads object metadata or the file header, and only
+        downloads a file (one at a time) when neither has the duration.
 
         Args:
             gcs_uris: List of GCS URIs to process.
             output_bucket: Bucket for output files.
             config: Optional processing configuration.
+            max_workers: Maximum number of files processed at once.
 
         Returns:
             List of ProcessingResult objects.
         """
-        results = []
-
-        for gcs_uri in gcs_uris:
-            result = self.process_file(gcs_uri, output_bucket, config)
-            results.append(result)
+        if not gcs_uris:
+            return []
+
+        params = self._resolve_params(config)
+        workers = min(max_workers, len(gcs_uris))
+        lookahead = workers + _PREFETCH_SLOTS
+        prefetches: dict[int, Future[None]] = {}
+        claimed: set[int] = set()
+        lock = threading.Lock()
+
+        with (
+            ThreadPoolExecutor(max_workers=1) as prefetcher,
+            ThreadPoolExecutor(max_workers=workers) as executor,
+        ):
+
+            def prefetch(index: int) -> None:
+                if index < len(gcs_uris) and index not in claimed:
+                    prefetches[index] = prefetcher.submit(self._prefetch_duration, gcs_uris[index], params)
+
+            def run(index: int) -> ProcessingResult:
+                with lock:
+                    claimed.add(index)
+                    future = prefetches.pop(index, None)
+                    prefetch(index + lookahead)
+
+                # Probe ourselves rather than queue behind the prefetcher, but
+                # let a probe that has already started finish first
+                if future is not None and not future.cancel():
+                    future.result()
+                return self.process_file(gcs_uris[index], output_bucket, config)
+
+            for index in range(lookahead):
+                prefetch(index)
+
+            return list(executor.map(run, range(len(gcs_uris))))
+
+    def _prefetch_duration(self, gcs_uri: str, params: ProcessingParams) -> None:
+        """
+        Probe a file's duration ahead of processing so process_file finds it cached.
 
-        return results
+        Failures are ignored here; process_file reports them when it reaches
+        the file.
+        """
+        try:
+            metadata = self._validate_input(gcs_uri, params)
+            self._get_duration(gcs_uri, metadata=metadata)
+        except Exception as e:
+            logger.debug("Duration prefetch skipped for %s: %s", gcs_uri, e)
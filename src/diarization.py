@@ -9,16 +9,50 @@ Identifies and labels different speakers in audio recordings.
 Requires a HuggingFace token with access to pyannote models.
 """
 
+import hashlib
 import logging
 import os
+import threading
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from functools import cached_property
 
 import numpy as np
 
 from .utils import TranscriptSegment
 
+# torch is imported on first use (see _load_torch), so importing this module stays cheap
+torch = None
+_from_numpy = None
+
 logger = logging.getLogger("media_intelligence.diarization")
 
+# Loaded pipelines shared by Diarizer instances, keyed by model, device, token
+# digest and pipeline settings; oldest entries are evicted first
+_PIPELINE_CACHE_SIZE = 4
+_pipeline_cache: dict[tuple, object] = {}
+_pipeline_cache_lock = threading.Lock()
+
+
+def _load_torch() -> bool:
+    """Import torch into this module on first use; return False when it is not installed."""
+    global torch, _from_numpy
+    if torch is None:
+        try:
+            import torch
+        except ImportError:  # torch is only required once a Diarizer is created
+            return False
+        _from_numpy = torch.from_numpy
+    return True
+
+
+def _default_device() -> str:
+    """Return "cuda" when torch can see a GPU, otherwise "cpu"."""
+    if not _load_torch():
+        return "cpu"
+
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
 
 @dataclass
 class DiarizationConfig:
@@ -27,7 +61,17 @@ class DiarizationConfig:
     pipeline: str = "pyannote/speaker-diarization-3.1"
     min_speakers: int | None = None
     max_speakers: int | None = None
-    device: str = "cpu"
+    # "auto" picks CUDA when available
+    device: str = "auto"
+    # Sliding windows per forward pass; None keeps the pipeline defaults
+    segmentation_batch_size: int | None = None
+    embedding_batch_size: int | None = None
+    # torch.compile the segmentation model when running on CUDA
+    compile: bool = True
+
+    def __post_init__(self) -> None:
+        if self.device == "auto":
+            self.device = _default_device()
 
 
 class SpeakerSegment:
@@ -42,6 +86,42 @@ class SpeakerSegment:
         return f"SpeakerSegment({self.start:.2f}-{self.end:.2f}, {self.speaker})"
 
 
+@dataclass
+class SpeakerTracks:
+    """
+    Speaker turns stored as parallel arrays, sorted by start time.
+
+    Iterating yields SpeakerSegment objects for code written against the
+    list-of-segments interface.
+    """
+
+    start: np.ndarray
+    end: np.ndarray
+    speaker: np.ndarray
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[SpeakerSegment]) -> "SpeakerTracks":
+        """Build tracks from SpeakerSegment objects, keeping their order."""
+        segments = list(segments)
+        return cls(
+            start=np.fromiter((s.start for s in segments), dtype=np.float64, count=len(segments)),
+            end=np.fromiter((s.end for s in segments), dtype=np.float64, count=len(segments)),
+            speaker=np.array([s.speaker for s in segments], dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @cached_property
+    def num_speakers(self) -> int:
+        """Number of distinct speakers, counted once per tracks object."""
+        return len(set(self.speaker.tolist()))
+
+    def __iter__(self) -> Iterator[SpeakerSegment]:
+        for start, end, speaker in zip(self.start.tolist(), self.end.tolist(), self.speaker.tolist(), strict=True):
+            yield SpeakerSegment(start, end, speaker)
+
+
 class Diarizer:
     """
     Speaker diarization using pyannote-audio.
@@ -81,14 +161,37 @@ class Diarizer:
                 "4. Set HUGGINGFACE_TOKEN environment variable or pass to constructor"
             )
 
+        _load_torch()
         self._load_pipeline()
 
     def _load_pipeline(self) -> None:
-        """Load the pyannote diarization pipeline."""
-        import torch
+        """Load the pyannote diarization pipeline, reusing one already loaded in this process."""
+        key = (
+            self.config.pipeline,
+            self.config.device,
+            hashlib.sha256(self.hf_token.encode()).hexdigest(),
+            self.config.segmentation_batch_size,
+            self.config.embedding_batch_size,
+            self.config.compile,
+        )
+
+        with _pipeline_cache_lock:
+            cached = _pipeline_cache.get(key)
+            if cached is not None:
+                logger.info("Reusing loaded diarization pipeline: %s", self.config.pipeline)
+                self.pipeline = cached
+                return
+
+            self._create_pipeline()
+            _pipeline_cache[key] = self.pipeline
+            if len(_pipeline_cache) > _PIPELINE_CACHE_SIZE:
+                del _pipeline_cache[next(iter(_pipeline_cache))]
+
+    def _create_pipeline(self) -> None:
+        """Create the pyannote diarization pipeline and move it to the configured device."""
         from pyannote.audio import Pipeline
 
-        logger.info(f"Loading diarization pipeline: {self.config.pipeline}")
+        logger.info("Loading diarization pipeline: %s", self.config.pipeline)
 
         self.pipeline = Pipeline.from_pretrained(self.config.pipeline, use_auth_token=self.hf_token)
 
@@ -98,15 +201,38 @@ class Diarizer:
         else:
             self.pipeline.to(torch.device(self.config.device))
 
+        # pyannote already slides fixed-size windows over the audio; larger
+        # batches push more of them through each model forward pass
+        for attr in ("segmentation_batch_size", "embedding_batch_size"):
+            value = getattr(self.config, attr)
+            if value is not None and hasattr(self.pipeline, attr):
+                setattr(self.pipeline, attr, value)
+
+        if self.config.compile and self.config.device.startswith("cuda"):
+            self._compile_segmentation()
+
         logger.info("Diarization pipeline loaded successfully")
 
+    def _compile_segmentation(self) -> None:
+        """Compile the segmentation model, keeping the eager model if unsupported."""
+        segmentation = getattr(self.pipeline, "_segmentation", None)
+        model = getattr(segmentation, "model", None)
+        if model is None or not hasattr(torch, "compile"):
+            return
+
+        try:
+            # Segmentation windows have a fixed size, so CUDA graphs are reused
+            segmentation.model = torch.compile(model, mode="reduce-overhead", fullgraph=False, dynamic=False)
+        except Exception as e:
+            logger.warning("torch.compile failed, using eager segmentation model: %s", e)
+
     def diarize(
         self,
         audio: np.ndarray,
         sample_rate: int = 16000,
         min_speakers: int | None = None,
         max_speakers: int | None = None,
-    ) -> list[SpeakerSegment]:
+    ) -> SpeakerTracks:
         """
         Perform speaker diarization on audio.
 
@@ -117,7 +243,7 @@ class Diarizer:
             max_speakers: Maximum number of speakers (None for auto)
 
         Returns:
-            List of SpeakerSegment objects
+            SpeakerTracks sorted by start time
 
         Raises:
             RuntimeError: If pipeline not loaded
@@ -125,23 +251,16 @@ class Diarizer:
         if self.pipeline is None:
             raise RuntimeError("Pipeline not loaded")
 
-        import torch
-
         # Use config defaults if not specified
         min_speakers = min_speakers or self.config.min_speakers
         max_speakers = max_speakers or self.config.max_speakers
 
-        logger.debug(f"Diarizing {len(audio)/sample_rate:.2f}s of audio " f"(min_speakers={min_speakers}, max_speakers={max_speakers})")
-
-        # Prepare audio tensor
-        if audio.dtype != np.float32:
-            audio = audio.astype(np.float32)
+        logger.debug("Diarizing %.2fs of audio (min_speakers=%s, max_speakers=%s)", len(audio) / sample_rate, min_speakers, max_speakers)
 
-        # Ensure audio is 1D
-        if audio.ndim > 1:
-            audio = audio.mean(axis=0)
+        # Prepare 1D float32 audio tensor
+        audio = _prepare_waveform(audio)
 
-        waveform = torch.from_numpy(audio).unsqueeze(0)
+        waveform = _from_numpy(audio).unsqueeze_(0)
 
         # Create audio dict for pyannote
         audio_dict = {"waveform": waveform, "sample_rate": sample_rate}
@@ -153,27 +272,42 @@ class Diarizer:
         if max_speakers is not None:
             kwargs["max_speakers"] = max_speakers
 
-        # Run diarization
-        diarization = self.pipeline(audio_dict, **kwargs)
-
-        # Convert to SpeakerSegment list
-        segments = []
+        # Run diarization, with FP16 autocast on GPU
+        use_cuda = self.config.device.startswith("cuda")
+        with (
+            torch.inference_mode(),
+            torch.autocast(device_type="cuda" if use_cuda else "cpu", dtype=torch.float16, enabled=use_cuda),
+        ):
+            diarization = self.pipeline(audio_dict, **kwargs)
+
+        # Collect turns into parallel arrays
+        starts: list[float] = []
+        ends: list[float] = []
+        speakers: list[str] = []
         for turn, _, speaker in diarization.itertracks(yield_label=True):
-            segments.append(SpeakerSegment(start=turn.start, end=turn.end, speaker=speaker))
+            starts.append(turn.start)
+            ends.append(turn.end)
+            speakers.append(speaker)
 
         # Sort by start time
-        segments.sort(key=lambda x: x.start)
+        start = np.asarray(starts, dtype=np.float64)
+        order = np.argsort(start, kind="stable")
+        tracks = SpeakerTracks(
+            start=start[order],
+            end=np.asarray(ends, dtype=np.float64)[order],
+            speaker=np.array(speakers, dtype=object)[order],
+        )
 
-        logger.info(f"Diarization complete: {len(segments)} turns, " f"{len(set(s.speaker for s in segments))} speakers")
+        logger.info("Diarization complete: %s turns, %s speakers", len(tracks), tracks.num_speakers)
 
-        return segments
+        return tracks
 
     def diarize_file(
         self,
         file_path: str,
         min_speakers: int | None = None,
         max_speakers: int | None = None,
-    ) -> list[SpeakerSegment]:
+    ) -> SpeakerTracks:
         """
         Diarize an audio file.
 
@@ -183,7 +317,7 @@ class Diarizer:
             max_speakers: Maximum number of speakers
 
         Returns:
-            List of SpeakerSegment objects
+            SpeakerTracks sorted by start time
         """
         from .utils import load_audio
 
@@ -191,8 +325,110 @@ class Diarizer:
         return self.diarize(audio, sr, min_speakers, max_speakers)
 
 
+def _prepare_waveform(audio: np.ndarray) -> np.ndarray:
+    """
+    Convert audio to a contiguous 1D float32 waveform.
+
+    Contiguous float32 mono input is returned as-is. Multi-channel input
+    (channels first) is averaged straight into a float32 buffer, and signed
+    integer PCM is scaled to [-1, 1] in place on that buffer, so at most one
+    full-size array is allocated.
+    """
+    if audio.ndim > 1:
+        mono = audio.mean(axis=0, dtype=np.float32)
+    elif audio.dtype == np.float32:
+        return np.ascontiguousarray(audio)
+    else:
+        mono = audio.astype(np.float32)
+
+    if audio.dtype.kind == "i":
+        mono *= np.float32(1.0 / (np.iinfo(audio.dtype).max + 1))
+
+    return mono
+
+
+# Upper bound on transcript x speaker pairs materialized at once by _best_overlap
+_MAX_OVERLAP_PAIRS = 1 << 20
+
+# Below this many segments plain dict accumulation beats NumPy setup cost
+_VECTORIZE_MIN_SEGMENTS = 32
+
+
+def _best_overlap(t_start: np.ndarray, t_end: np.ndarray, s_start: np.ndarray, s_end: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the speaker segment with the largest overlap for each transcript segment.
+
+    Speaker segments are swept in start order: a transcript segment is only
+    compared with speakers that start before it ends and are not finished
+    before it starts (found via a running maximum of end times), so the work
+    follows the number of candidate pairs instead of N x M. Candidate pairs
+    are expanded in blocks of at most _MAX_OVERLAP_PAIRS to bound memory.
+
+    Args:
+        t_start: Transcript segment start times, shape (N,)
+        t_end: Transcript segment end times, shape (N,)
+        s_start: Speaker segment start times, shape (M,)
+        s_end: Speaker segment end times, shape (M,)
+
+    Returns:
+        Tuple of (best speaker index, best overlap ratio), each of shape (N,).
+        Ties resolve to the earliest speaker segment.
+    """
+    n = len(t_start)
+    m = len(s_start)
+    best_idx = np.zeros(n, dtype=np.intp)
+    best_ratio = np.zeros(n, dtype=np.float64)
+
+    order = np.argsort(s_start, kind="stable")
+    ss = s_start[order]
+    se = s_end[order]
+
+    # Candidates for transcript segment i are sorted speakers lo[i] <= j < hi[i]
+    lo = np.searchsorted(np.maximum.accumulate(se), t_start, side="right")
+    hi = np.searchsorted(ss, t_end, side="left")
+    counts = np.maximum(hi - lo, 0)
+    cum_counts = np.cumsum(counts)
+
+    row_lo = 0
+    while row_lo < n:
+        # Take as many rows as fit within the pair budget, and at least one
+        budget = cum_counts[row_lo] - counts[row_lo] + _MAX_OVERLAP_PAIRS
+        row_hi = max(row_lo + 1, int(np.searchsorted(cum_counts, budget, side="right")))
+        block_counts = counts[row_lo:row_hi]
+        rows = np.flatnonzero(block_counts) + row_lo
+        row_lo = row_hi
+        if not len(rows):
+            continue
+
+        # Flatten (row, candidate) pairs; each row's pairs are contiguous
+        row_counts = counts[rows]
+        starts = np.cumsum(row_counts) - row_counts
+        pair_row = np.repeat(rows, row_counts)
+        j = np.repeat(lo[rows] - starts, row_counts) + np.arange(int(row_counts.sum()))
+
+        ts = t_start[pair_row]
+        te = t_end[pair_row]
+
+        # Overlap ratio relative to transcript segment duration (zero for empty segments)
+        overlap = np.maximum(0.0, np.minimum(te, se[j]) - np.maximum(ts, ss[j]))
+        duration = te - ts
+        ratio = np.divide(overlap, duration, out=np.zeros_like(overlap), where=duration > 0)
+
+        row_best = np.maximum.reduceat(ratio, starts)
+        best_ratio[rows] = row_best
+
+        # Among equally good candidates keep the earliest original speaker segment
+        winners = np.where((ratio == np.repeat(row_best, row_counts)) & (ratio > 0), order[j], m)
+        row_idx = np.minimum.reduceat(winners, starts)
+        best_idx[rows] = np.where(row_idx < m, row_idx, 0)
+
+    return best_idx, best_ratio
+
+
 def assign_speakers_to_segments(
-    transcript_segments: list[TranscriptSegment], speaker_segments: list[SpeakerSegment], overlap_threshold: float = 0.5
+    transcript_segments: list[TranscriptSegment],
+    speaker_segments: SpeakerTracks | list[SpeakerSegment],
+    overlap_threshold: float = 0.5,
 ) -> list[TranscriptSegment]:
     """
     Assign speaker labels to transcript segments based on diarization.
@@ -202,7 +438,7 @@ def assign_speakers_to_segments(
 
     Args:
         transcript_segments: List of transcript segments
-        speaker_segments: List of speaker segments from diarization
+        speaker_segments: SpeakerTracks (or a list of SpeakerSegment) from diarization
         overlap_threshold: Minimum overlap ratio to assign speaker
 
     Returns:
@@ -212,32 +448,25 @@ def assign_speakers_to_segments(
         logger.warning("No speaker segments provided, skipping speaker assignment")
         return transcript_segments
 
-    for t_seg in transcript_segments:
-        best_speaker = None
-        best_overlap = 0.0
-
-        for s_seg in speaker_segments:
-            # Calculate overlap
-            overlap_start = max(t_seg.start, s_seg.start)
-            overlap_end = min(t_seg.end, s_seg.end)
-            overlap_duration = max(0, overlap_end - overlap_start)
-
-            # Calculate overlap ratio relative to transcript segment duration
-            t_duration = t_seg.end - t_seg.start
-            if t_duration > 0:
-                overlap_ratio = overlap_duration / t_duration
-                if overlap_ratio > best_overlap:
-                    best_overlap = overlap_ratio
-                    best_speaker = s_seg.speaker
-
-        if best_overlap >= overlap_threshold:
-            t_seg.speaker = best_speaker
+    if not transcript_segments:
+        return transcript_segments
+
+    t_start = np.fromiter((t.start for t in transcript_segments), dtype=np.float64)
+    t_end = np.fromiter((t.end for t in transcript_segments), dtype=np.float64)
+    tracks = speaker_segments if isinstance(speaker_segments, SpeakerTracks) else SpeakerTracks.from_segments(speaker_segments)
+    speaker_ids = tracks.speaker.tolist()
+
+    best_idx, best_overlap = _best_overlap(t_start, t_end, tracks.start, tracks.end)
+
+    for t_seg, idx, overlap_ratio in zip(transcript_segments, best_idx.tolist(), best_overlap.tolist(), strict=True):
+        if overlap_ratio >= overlap_threshold:
+            t_seg.speaker = speaker_ids[idx] if overlap_ratio > 0 else None
         else:
             t_seg.speaker = "UNKNOWN"
 
     # Count speakers
     speakers = set(s.speaker for s in transcript_segments if s.speaker and s.speaker != "UNKNOWN")
-    logger.debug(f"Assigned {len(speakers)} unique speakers to transcript segments")
+    logger.debug("Assigned %s unique speakers to transcript segments", len(speakers))
 
     return transcript_segments
 
@@ -252,11 +481,23 @@ def get_speaker_statistics(segments: list[TranscriptSegment]) -> dict[str, float
     Returns:
         Dict mapping speaker ID to total speaking time in seconds
     """
-    stats: dict[str, float] = {}
+    if len(segments) < _VECTORIZE_MIN_SEGMENTS:
+        stats: dict[str, float] = {}
+
+        for seg in segments:
+            speaker = seg.speaker or "UNKNOWN"
+            duration = seg.end - seg.start
+            stats[speaker] = stats.get(speaker, 0.0) + duration
+
+        return stats
+
+    durations = np.fromiter((seg.end - seg.start for seg in segments), dtype=np.float64, count=len(segments))
+    speakers = np.array([seg.speaker or "UNKNOWN" for seg in segments], dtype=object)
 
-    for seg in segments:
-        speaker = seg.speaker or "UNKNOWN"
-        duration = seg.end - seg.start
-        stats[speaker] = stats.get(speaker, 0.0) + duration
+    uniq, first_index, inverse = np.unique(speakers, return_index=True, return_inverse=True)
+    totals = np.zeros(len(uniq))
+    np.add.at(totals, inverse, durations)
 
-    return stats
+    # Keep speakers in order of first appearance, as the loop above does
+    order = np.argsort(first_index)
+    return dict(zip(uniq[order].tolist(), totals[order].tolist(), strict=True))
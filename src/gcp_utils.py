@@ -2,27 +2,71 @@
 Utility functions for the Media Intelligence Pipeline (GCP deployment).
 """
 
+import copy
 import logging
 import math
 import os
-import uuid
-from datetime import UTC, datetime
+import secrets
+import struct
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Collection
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 # Load environment variables
 load_dotenv()
 
+# Parsed config files keyed by path, with the mtime they were parsed at
+_config_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+# Config keys that environment variables override
+_ENV_OVERRIDES = (
+    ("project_id", "PROJECT_ID"),
+    ("region", "REGION"),
+    ("input_bucket", "INPUT_BUCKET"),
+    ("output_bucket", "OUTPUT_BUCKET"),
+    ("vertex_ai_endpoint_id", "VERTEX_AI_ENDPOINT_ID"),
+)
+
+# Audio formats accepted when no explicit list is configured
+_DEFAULT_FORMATS = frozenset({"wav", "mp3", "m4a", "flac", "opus", "ogg", "aac"})
+_DEFAULT_SUFFIXES = tuple(f".{ext}" for ext in sorted(_DEFAULT_FORMATS))
+_MAX_SUFFIX_LEN = max(map(len, _DEFAULT_SUFFIXES))
+
+# Rich colors for situation labels in CLI output
+_SITUATION_COLORS = {
+    "airplane": "blue",
+    "car": "yellow",
+    "walking": "green",
+    "meeting": "magenta",
+    "office": "cyan",
+    "outdoor": "bright_green",
+    "restaurant": "red",
+    "quiet": "white",
+}
+
 
 def load_config(config_path: str | None = None) -> dict[str, Any]:
     """
     Load configuration from YAML file.
 
+    The parsed file is cached until its modification time changes; each call
+    returns a fresh copy with environment overrides applied.
+
     Args:
         config_path: Path to config file. If None, looks for config.yaml
                     in the project root.
@@ -35,23 +79,22 @@ def load_config(config_path: str | None = None) -> dict[str, Any]:
         project_root = Path(__file__).parent.parent
         config_path = project_root / "config.yaml"
 
+    cache_key = str(config_path)
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        mtime = os.stat(config_path).st_mtime
+        cached = _config_cache.get(cache_key)
+        if cached is None or cached[0] != mtime:
+            with open(config_path, "rb") as f:
+                cached = (mtime, yaml.load(f, Loader=_YamlLoader) or {})
+            _config_cache[cache_key] = cached
+        config = copy.deepcopy(cached[1])
     except FileNotFoundError:
-        logger.warning(f"Config file not found: {config_path}, using defaults")
+        logger.warning("Config file not found: %s, using defaults", config_path)
         config = {}
 
     # Override with environment variables
-    env_overrides = {
-        "project_id": os.getenv("PROJECT_ID"),
-        "region": os.getenv("REGION"),
-        "input_bucket": os.getenv("INPUT_BUCKET"),
-        "output_bucket": os.getenv("OUTPUT_BUCKET"),
-        "vertex_ai_endpoint_id": os.getenv("VERTEX_AI_ENDPOINT_ID"),
-    }
-
-    for key, value in env_overrides.items():
+    for key, env_var in _ENV_OVERRIDES:
+        value = os.environ.get(env_var)
         if value is not None:
             config[key] = value
 
@@ -65,32 +108,141 @@ def generate_file_id() -> str:
     Returns:
         Unique file ID string.
     """
-    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-    unique_id = uuid.uuid4().hex[:8]
-    return f"{timestamp}_{unique_id}"
+    return f"{time.strftime('%Y%m%d_%H%M%S', time.gmtime())}_{secrets.token_hex(4)}"
 
 
 def get_audio_duration(file_path: str) -> float:
     """
     Get the duration of an audio file in seconds.
 
+    Formats libsndfile understands (WAV, FLAC, OGG, ...) are measured from
+    their headers; librosa is only imported for the rest.
+
     Args:
         file_path: Path to the audio file.
 
     Returns:
         Duration in seconds.
     """
+    import soundfile as sf
+
     try:
+        with sf.SoundFile(file_path) as f:
+            return f.frames / f.samplerate
+    except Exception:
+        # Fallback to librosa's decoders for containers libsndfile cannot open
         import librosa
 
-        duration = librosa.get_duration(filename=file_path)
-        return duration
-    except Exception:
-        # Fallback using soundfile
-        import soundfile as sf
+        return librosa.get_duration(path=file_path)
 
-        with sf.SoundFile(file_path) as f:
-            return len(f) / f.samplerate
+
+def get_header_duration(header: bytes, extension: str) -> float | None:
+    """
+    Get the duration of an audio file from the start of its contents.
+
+    Only containers that record their length up front are supported: WAV
+    (``data`` chunk size over byte rate) and FLAC (STREAMINFO total samples).
+
+    Args:
+        header: Leading bytes of the audio file.
+        extension: File extension without the dot (e.g. "wav").
+
+    Returns:
+        Duration in seconds, or None if it cannot be read from the header.
+    """
+    ext = extension.lower()
+
+    if ext == "wav":
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+
+        byte_rate = 0
+        pos = 12
+        while pos + 8 <= len(header):
+            chunk_id = header[pos : pos + 4]
+            (chunk_size,) = struct.unpack_from("<I", header, pos + 4)
+            if chunk_id == b"fmt " and pos + 20 <= len(header):
+                (byte_rate,) = struct.unpack_from("<I", header, pos + 16)
+            elif chunk_id == b"data":
+                # Streamed WAVs leave the size as 0 or 0xFFFFFFFF
+                if byte_rate and 0 < chunk_size < 0xFFFFFFFF:
+                    return chunk_size / byte_rate
+                return None
+            pos += 8 + chunk_size + (chunk_size & 1)
+        return None
+
+    if ext == "flac":
+        # STREAMINFO is always the first metadata block
+        if len(header) < 26 or header[:4] != b"fLaC" or header[4] & 0x7F != 0:
+            return None
+        packed = int.from_bytes(header[18:26], "big")
+        sample_rate = packed >> 44
+        total_samples = packed & ((1 << 36) - 1)
+        if sample_rate and total_samples:
+            return total_samples / sample_rate
+        return None
+
+    return None
+
+
+class DurationCache:
+    """Thread-safe LRU of probed audio durations keyed by GCS URI and object generation."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, Any], float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, gcs_uri: str, generation: Any) -> float | None:
+        """Return the cached duration, or None if this generation was never probed."""
+        key = (gcs_uri, generation)
+        with self._lock:
+            duration = self._entries.get(key)
+            if duration is not None:
+                self._entries.move_to_end(key)
+            return duration
+
+    def put(self, gcs_uri: str, generation: Any, duration: float) -> None:
+        """Cache a probed duration, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[(gcs_uri, generation)] = duration
+            self._entries.move_to_end((gcs_uri, generation))
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached durations."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Per-process duration cache shared by the pipeline and the situation classifier
+duration_cache = DurationCache()
+
+
+@dataclass(frozen=True, slots=True)
+class CostModel:
+    """Per-unit GCP rates used by the cost estimates, resolved once from config."""
+
+    speech_enhanced_per_15s: float = 0.009
+    speech_standard_per_15s: float = 0.006
+    vertex_per_1000_predictions: float = 0.30
+    segment_duration: float = 30
+    storage: float = 0.001
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> "CostModel":
+        """Build a cost model from the ``cost`` and ``processing`` config sections."""
+        if config is None:
+            config = {}
+
+        cost_config = config.get("cost", {})
+        return cls(
+            speech_enhanced_per_15s=cost_config.get("speech_enhanced_per_15s", 0.009),
+            speech_standard_per_15s=cost_config.get("speech_standard_per_15s", 0.006),
+            vertex_per_1000_predictions=cost_config.get("vertex_per_1000_predictions", 0.30),
+            segment_duration=config.get("processing", {}).get("segment_duration", 30),
+        )
 
 
 def estimate_cost(
@@ -98,6 +250,7 @@ def estimate_cost(
     config: dict[str, Any] | None = None,
     enable_diarization: bool = True,
     enable_situation_detection: bool = True,
+    cost_model: CostModel | None = None,
 ) -> dict[str, float]:
     """
     Estimate GCP costs for processing an audio file.
@@ -117,35 +270,32 @@ def estimate_cost(
         config: Configuration dictionary with cost overrides.
         enable_diarization: Whether diarization is enabled.
         enable_situation_detection: Whether situation detection is enabled.
+        cost_model: Pre-resolved rates; when given, config is not consulted.
 
     Returns:
         Dictionary with cost breakdown.
     """
-    if config is None:
-        config = {}
-
-    cost_config = config.get("cost", {})
+    if cost_model is None:
+        cost_model = CostModel.from_config(config)
 
     # Speech-to-Text cost
     blocks_15s = math.ceil(audio_duration_seconds / 15)
 
     if enable_diarization:
-        speech_rate = cost_config.get("speech_enhanced_per_15s", 0.009)
+        speech_rate = cost_model.speech_enhanced_per_15s
     else:
-        speech_rate = cost_config.get("speech_standard_per_15s", 0.006)
+        speech_rate = cost_model.speech_standard_per_15s
 
     speech_cost = blocks_15s * speech_rate
 
     # Vertex AI cost (30s segments)
     vertex_cost = 0.0
     if enable_situation_detection:
-        segment_duration = config.get("processing", {}).get("segment_duration", 30)
-        num_predictions = math.ceil(audio_duration_seconds / segment_duration)
-        vertex_rate = cost_config.get("vertex_per_1000_predictions", 0.30)
-        vertex_cost = num_predictions * vertex_rate / 1000
+        num_predictions = math.ceil(audio_duration_seconds / cost_model.segment_duration)
+        vertex_cost = num_predictions * cost_model.vertex_per_1000_predictions / 1000
 
     # Storage cost (negligible for small files)
-    storage_cost = 0.001
+    storage_cost = cost_model.storage
 
     total_cost = speech_cost + vertex_cost + storage_cost
 
@@ -167,12 +317,29 @@ def format_timestamp(seconds: float) -> str:
     Returns:
         Formatted timestamp string.
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = seconds % 60
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
     return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
 
 
+def format_timestamps(seconds: np.ndarray) -> list[str]:
+    """
+    Format many times as HH:MM:SS.mmm timestamps at once.
+
+    Produces the same strings as calling format_timestamp on each value, with
+    the hour/minute/second arithmetic done in a single NumPy pass.
+
+    Args:
+        seconds: Times in seconds.
+
+    Returns:
+        Formatted timestamp strings, in input order.
+    """
+    minutes, secs = np.divmod(np.asarray(seconds, dtype=np.float64), 60)
+    hours, minutes = np.divmod(minutes.astype(np.int64), 60)
+    return [f"{h:02d}:{m:02d}:{s:06.3f}" for h, m, s in zip(hours.tolist(), minutes.tolist(), secs.tolist(), strict=True)]
+
+
 def parse_gcs_uri(gcs_uri: str) -> tuple[str, str]:
     """
     Parse a GCS URI into bucket and blob path.
@@ -186,16 +353,11 @@ def parse_gcs_uri(gcs_uri: str) -> tuple[str, str]:
     Raises:
         ValueError: If URI is not a valid GCS URI.
     """
-    if not gcs_uri.startswith("gs://"):
-        raise ValueError(f"Invalid GCS URI: {gcs_uri}")
-
-    uri_without_prefix = gcs_uri[5:]
-    parts = uri_without_prefix.split("/", 1)
-
-    if len(parts) != 2:
+    slash = gcs_uri.find("/", 5) if gcs_uri.startswith("gs://") else -1
+    if slash < 0:
         raise ValueError(f"Invalid GCS URI: {gcs_uri}")
 
-    return parts[0], parts[1]
+    return gcs_uri[5:slash], gcs_uri[slash + 1 :]
 
 
 def get_file_extension(file_path: str) -> str:
@@ -208,25 +370,32 @@ def get_file_extension(file_path: str) -> str:
     Returns:
         File extension without the dot (lowercase).
     """
-    if file_path.startswith("gs://"):
-        file_path = file_path.split("/")[-1]
+    # Same rules as Path.suffix on the final path component, without building a Path
+    name_start = file_path.rfind("/") + 1
+    dot = file_path.rfind(".")
+    if dot <= name_start or dot == len(file_path) - 1:
+        return ""
+    return file_path[dot + 1 :].lower()
 
-    return Path(file_path).suffix.lower().lstrip(".")
 
-
-def is_supported_format(file_path: str, supported_formats: list[str] | None = None) -> bool:
+def is_supported_format(file_path: str, supported_formats: Collection[str] | None = None) -> bool:
     """
     Check if a file format is supported.
 
     Args:
         file_path: Local file path or GCS URI.
-        supported_formats: List of supported formats. If None, uses defaults.
+        supported_formats: Collection of supported formats. If None, uses defaults.
 
     Returns:
         True if format is supported.
     """
     if supported_formats is None:
-        supported_formats = ["wav", "mp3", "m4a", "flac", "opus", "ogg", "aac"]
+        # Match the default suffixes on the lowercased tail without slicing out the extension;
+        # a name that is only the suffix (a dotfile such as ".wav") has no extension
+        if not file_path[-_MAX_SUFFIX_LEN:].lower().endswith(_DEFAULT_SUFFIXES):
+            return False
+        dot = file_path.rfind(".")
+        return dot > 0 and file_path[dot - 1] != "/"
 
     extension = get_file_extension(file_path)
     return extension in supported_formats
@@ -262,14 +431,8 @@ def get_situation_color(situation: str) -> str:
     Returns:
         Color name for rich library.
     """
-    colors = {
-        "airplane": "blue",
-        "car": "yellow",
-        "walking": "green",
-        "meeting": "magenta",
-        "office": "cyan",
-        "outdoor": "bright_green",
-        "restaurant": "red",
-        "quiet": "white",
-    }
-    return colors.get(situation.lower(), "white")
+    # Labels from the classifier are already lowercase, so try them as-is before folding
+    color = _SITUATION_COLORS.get(situation)
+    if color is None:
+        color = _SITUATION_COLORS.get(situation.casefold(), "white")
+    return color
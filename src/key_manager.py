@@ -27,7 +27,9 @@ Usage:
 """
 
 import os
+import time
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Literal
 
 
@@ -103,8 +105,10 @@ class GCPKMSBackend(KeyBackend):
             raise ValueError("GCP project ID required. Set GOOGLE_CLOUD_PROJECT or pass project_id.")
 
         try:
+            from google.api_core import exceptions
             from google.cloud import secretmanager
 
+            self._exceptions = exceptions
             self._client = secretmanager.SecretManagerServiceClient()
         except ImportError as e:
             raise ImportError("google-cloud-secret-manager required for GCP key management. " "Install with: pip install google-cloud-secret-manager") from e
@@ -119,18 +123,14 @@ class GCPKMSBackend(KeyBackend):
 
     def get_secret(self, key_name: str) -> str | None:
         """Retrieve a secret from GCP Secret Manager."""
-        from google.api_core import exceptions
-
         try:
             response = self._client.access_secret_version(name=self._secret_path(key_name))
             return response.payload.data.decode("UTF-8")
-        except exceptions.NotFound:
+        except self._exceptions.NotFound:
             return None
 
     def set_secret(self, key_name: str, value: str) -> None:
         """Store a secret in GCP Secret Manager."""
-        from google.api_core import exceptions
-
         parent = f"projects/{self.project_id}"
         secret_id = key_name
 
@@ -143,7 +143,7 @@ class GCPKMSBackend(KeyBackend):
                     "secret": {"replication": {"automatic": {}}},
                 }
             )
-        except exceptions.AlreadyExists:
+        except self._exceptions.AlreadyExists:
             pass  # Secret exists, we'll add a new version
 
         # Add the secret version
@@ -156,12 +156,10 @@ class GCPKMSBackend(KeyBackend):
 
     def delete_secret(self, key_name: str) -> bool:
         """Delete a secret from GCP Secret Manager."""
-        from google.api_core import exceptions
-
         try:
             self._client.delete_secret(name=self._secret_parent(key_name))
             return True
-        except exceptions.NotFound:
+        except self._exceptions.NotFound:
             return False
 
 
@@ -172,6 +170,9 @@ class EnvironmentBackend(KeyBackend):
     Maps key names to environment variables:
     - huggingface_token -> HUGGINGFACE_TOKEN
     - gcp_project -> GOOGLE_CLOUD_PROJECT
+
+    Reads are served from a snapshot of the environment taken at construction;
+    call refresh() to pick up variables changed outside this backend.
     """
 
     ENV_MAPPING = {
@@ -180,25 +181,47 @@ class EnvironmentBackend(KeyBackend):
         "gcp_region": "GOOGLE_CLOUD_REGION",
     }
 
+    def __init__(self):
+        """Initialize environment backend."""
+        self._env = dict(os.environ)
+
+    def refresh(self) -> None:
+        """Re-read the process environment."""
+        self._env = dict(os.environ)
+
     def get_secret(self, key_name: str) -> str | None:
         """Retrieve a secret from environment variables."""
         env_var = self.ENV_MAPPING.get(key_name, key_name.upper())
-        return os.environ.get(env_var)
+        return self._env.get(env_var)
 
     def set_secret(self, key_name: str, value: str) -> None:
         """Set an environment variable (current process only)."""
         env_var = self.ENV_MAPPING.get(key_name, key_name.upper())
         os.environ[env_var] = value
+        self._env[env_var] = value
 
     def delete_secret(self, key_name: str) -> bool:
         """Remove an environment variable."""
         env_var = self.ENV_MAPPING.get(key_name, key_name.upper())
+        self._env.pop(env_var, None)
         if env_var in os.environ:
             del os.environ[env_var]
             return True
         return False
 
 
+@lru_cache(maxsize=1)
+def _keyring_available() -> bool:
+    """Check once per process whether a functional OS keyring is installed."""
+    try:
+        import keyring
+
+        keyring.get_keyring()
+        return True
+    except Exception:
+        return False
+
+
 BackendType = Literal["keyring", "gcp-kms", "env", "auto"]
 
 
@@ -216,6 +239,7 @@ class KeyManager:
         backend: BackendType = "auto",
         project_id: str | None = None,
         fallback_to_env: bool = True,
+        cache_ttl: float = 300.0,
     ):
         """
         Initialize key manager.
@@ -224,8 +248,11 @@ class KeyManager:
             backend: Backend to use ("keyring", "gcp-kms", "env", "auto")
             project_id: GCP project ID (for gcp-kms backend)
             fallback_to_env: Fall back to environment variables if secret not found
+            cache_ttl: Seconds a retrieved secret is served from memory (0 disables)
         """
         self.fallback_to_env = fallback_to_env
+        self.cache_ttl = cache_ttl
+        self._cache: dict[str, tuple[str, float]] = {}
         self._env_backend = EnvironmentBackend() if fallback_to_env else None
 
         if backend == "auto":
@@ -236,12 +263,22 @@ class KeyManager:
         elif backend == "gcp-kms":
             self._backend = GCPKMSBackend(project_id=project_id)
         elif backend == "env":
-            self._backend = EnvironmentBackend()
+            # Share the fallback backend so both see the same snapshot
+            self._backend = self._env_backend or EnvironmentBackend()
         else:
             raise ValueError(f"Unknown backend: {backend}")
 
         self._backend_type = backend
 
+        # Bind backend methods once so each call skips the attribute lookups
+        self._get = self._backend.get_secret
+        self._set = self._backend.set_secret
+        self._delete = self._backend.delete_secret
+
+        # The env backend needs no second lookup when it is also the primary backend
+        use_fallback = self._env_backend is not None and self._env_backend is not self._backend
+        self._fallback_get = self._env_backend.get_secret if use_fallback else None
+
     def _detect_backend(self) -> BackendType:
         """Auto-detect the appropriate backend."""
         # If GCP project is set, assume cloud deployment
@@ -249,14 +286,7 @@ class KeyManager:
             return "gcp-kms"
 
         # Try keyring, fall back to env
-        try:
-            import keyring
-
-            # Test that keyring is functional
-            keyring.get_keyring()
-            return "keyring"
-        except Exception:
-            return "env"
+        return "keyring" if _keyring_available() else "env"
 
     @property
     def backend_type(self) -> str:
@@ -273,11 +303,19 @@ class KeyManager:
         Returns:
             Secret value or None if not found
         """
-        value = self._backend.get_secret(key_name)
+        cached = self._cache.get(key_name)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        value = self._get(key_name)
 
         # Fallback to environment if enabled and secret not found
-        if value is None and self.fallback_to_env and self._env_backend:
-            value = self._env_backend.get_secret(key_name)
+        if value is None and self._fallback_get is not None:
+            value = self._fallback_get(key_name)
+
+        # Only found secrets are cached, so a missing one is looked up again
+        if value is not None and self.cache_ttl > 0:
+            self._cache[key_name] = (value, time.monotonic() + self.cache_ttl)
 
         return value
 
@@ -289,7 +327,8 @@ class KeyManager:
             key_name: Name of the secret
             value: Secret value
         """
-        self._backend.set_secret(key_name, value)
+        self._cache.pop(key_name, None)
+        self._set(key_name, value)
 
     def delete_secret(self, key_name: str) -> bool:
         """
@@ -301,7 +340,8 @@ class KeyManager:
         Returns:
             True if deleted, False if not found
         """
-        return self._backend.delete_secret(key_name)
+        self._cache.pop(key_name, None)
+        return self._delete(key_name)
 
     def get_huggingface_token(self) -> str | None:
         """Convenience method to get HuggingFace token."""
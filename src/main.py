@@ -7,15 +7,25 @@ This module provides both HTTP endpoints (for Cloud Run) and event handlers
 
 import logging
 import os
+import sys
+import threading
+from typing import Any
 
-import functions_framework
-from flask import Flask, jsonify, request
-from google.cloud import error_reporting
-from google.cloud import logging as cloud_logging
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+from .audio_processor import AudioProcessor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to Flask's stdlib encoder
+    orjson = None
 
 # Configure logging
 if os.getenv("ENABLE_STRUCTURED_LOGGING", "true").lower() == "true":
     try:
+        from google.cloud import logging as cloud_logging
+
         logging_client = cloud_logging.Client()
         logging_client.setup_logging()
     except Exception:
@@ -27,22 +37,95 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize error reporting
-error_client = None
-try:
-    error_client = error_reporting.Client()
-except Exception:
-    logger.warning("Error reporting client not available")
+# Error Reporting client, created on first error so startup does not wait on it
+_error_client = None
+_error_client_checked = False
+_error_client_lock = threading.Lock()
+
+# functions-framework is already imported when it loads this module as a Cloud
+# Function; under gunicorn (Cloud Run) the entry-point decorators are not needed
+if "functions_framework" in sys.modules:
+    import functions_framework
+
+    cloud_event = functions_framework.cloud_event
+    http_function = functions_framework.http
+else:
+
+    def cloud_event(func):
+        return func
+
+    http_function = cloud_event
+
+
+def get_error_client():
+    """Get the Error Reporting client, or None if it is unavailable."""
+    global _error_client, _error_client_checked
+    if not _error_client_checked:
+        with _error_client_lock:
+            if not _error_client_checked:
+                try:
+                    from google.cloud import error_reporting
+
+                    _error_client = error_reporting.Client()
+                except Exception:
+                    logger.warning("Error reporting client not available")
+                _error_client_checked = True
+    return _error_client
+
+
+def _report_error(message: str) -> None:
+    """Send an error message to Error Reporting if it is available."""
+    error_client = get_error_client()
+    if error_client:
+        error_client.report(message)
+
+
+def _report_exception() -> None:
+    """Send the exception being handled to Error Reporting if it is available."""
+    error_client = get_error_client()
+    if error_client:
+        error_client.report_exception()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson."""
+
+    # Datetimes pass through to Flask's default handler so output matches the stdlib provider
+    _options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME if orjson is not None else 0
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._options).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._options | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 
 # Flask app for Cloud Run
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
+# Shared processor so its API clients are created once per instance, not per request
+_processor: AudioProcessor | None = None
+_processor_lock = threading.Lock()
 
-def get_processor():
-    """Get or create AudioProcessor instance."""
-    from .audio_processor import AudioProcessor
+# Files processed concurrently per /batch request; work is bound by GCS and Speech API waits
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", 8))
 
-    return AudioProcessor()
+
+def get_processor() -> AudioProcessor:
+    """Get the shared AudioProcessor instance, creating it on first use."""
+    global _processor
+    if _processor is None:
+        with _processor_lock:
+            if _processor is None:
+                _processor = AudioProcessor()
+    return _processor
 
 
 @app.route("/process", methods=["POST"])
@@ -88,21 +171,35 @@ def process_audio():
         "error": "Error message"
     }
     """
-    try:
-        # Parse request
-        data = request.get_json()
+    body, status = _process_request(request.get_json(silent=True))
+    return jsonify(body), status
+
 
+def _process_request(data: dict[str, Any] | None) -> tuple[dict[str, Any], int]:
+    """
+    Process a single-file request payload.
+
+    Shared by the /process route and the HTTP Cloud Function so the body is
+    parsed once by the caller.
+
+    Args:
+        data: Decoded request JSON, or None if the body was missing or invalid.
+
+    Returns:
+        Tuple of (response body, HTTP status code).
+    """
+    try:
         if not data:
-            return jsonify({"status": "error", "error": "No JSON data provided"}), 400
+            return {"status": "error", "error": "No JSON data provided"}, 400
 
         gcs_uri = data.get("gcs_uri")
         if not gcs_uri:
-            return jsonify({"status": "error", "error": "gcs_uri is required"}), 400
+            return {"status": "error", "error": "gcs_uri is required"}, 400
 
         output_bucket = data.get("output_bucket")
         config = data.get("config", {})
 
-        logger.info(f"Processing request for {gcs_uri}")
+        logger.info("Processing request for %s", gcs_uri)
 
         # Process file
         processor = get_processor()
@@ -114,47 +211,41 @@ def process_audio():
 
         # Check for errors
         if result.error:
-            logger.error(f"Processing failed: {result.error}")
-            if error_client:
-                error_client.report(result.error)
+            logger.error("Processing failed: %s", result.error)
+            _report_error(result.error)
             return (
-                jsonify(
-                    {
-                        "status": "error",
-                        "error": result.error,
-                        "file_id": result.file_id,
-                    }
-                ),
+                {
+                    "status": "error",
+                    "error": result.error,
+                    "file_id": result.file_id,
+                },
                 500,
             )
 
         # Return success response
         return (
-            jsonify(
-                {
-                    "status": "success",
-                    "file_id": result.file_id,
-                    "result_uri": result.gcs_output_uri,
-                    "transcript_uri": result.transcript_uri,
-                    "processing_time": round(result.processing_time, 2),
-                    "cost_estimate": result.cost_estimate,
-                    "summary": {
-                        "duration": round(result.duration, 2),
-                        "speaker_count": result.speaker_count,
-                        "overall_situation": result.overall_situation,
-                        "overall_situation_confidence": round(result.overall_situation_confidence, 2),
-                        "segment_count": len(result.transcript_segments),
-                    },
-                }
-            ),
+            {
+                "status": "success",
+                "file_id": result.file_id,
+                "result_uri": result.gcs_output_uri,
+                "transcript_uri": result.transcript_uri,
+                "processing_time": round(result.processing_time, 2),
+                "cost_estimate": result.cost_estimate,
+                "summary": {
+                    "duration": round(result.duration, 2),
+                    "speaker_count": result.speaker_count,
+                    "overall_situation": result.overall_situation,
+                    "overall_situation_confidence": round(result.overall_situation_confidence, 2),
+                    "segment_count": len(result.transcript_segments),
+                },
+            },
             200,
         )
 
     except Exception as e:
-        logger.error(f"Request failed: {str(e)}", exc_info=True)
-        if error_client:
-            error_client.report_exception()
-        return jsonify({"status": "error", "error": str(e)}), 500
+        logger.error("Request failed: %s", e, exc_info=True)
+        _report_exception()
+        return {"status": "error", "error": str(e)}, 500
 
 
 @app.route("/batch", methods=["POST"])
@@ -162,6 +253,8 @@ def process_batch():
     """
     Process multiple audio files.
 
+    Files are processed concurrently, up to BATCH_MAX_WORKERS at a time.
+
     Request JSON:
     {
         "gcs_uris": [
@@ -199,13 +292,14 @@ def process_batch():
         output_bucket = data.get("output_bucket")
         config = data.get("config", {})
 
-        logger.info(f"Processing batch of {len(gcs_uris)} files")
+        logger.info("Processing batch of %s files", len(gcs_uris))
 
         processor = get_processor()
         results = processor.process_batch(
             gcs_uris=gcs_uris,
             output_bucket=output_bucket,
             config=config,
+            max_workers=BATCH_MAX_WORKERS,
         )
 
         # Build response
@@ -251,9 +345,8 @@ def process_batch():
         )
 
     except Exception as e:
-        logger.error(f"Batch request failed: {str(e)}", exc_info=True)
-        if error_client:
-            error_client.report_exception()
+        logger.error("Batch request failed: %s", e, exc_info=True)
+        _report_exception()
         return jsonify({"status": "error", "error": str(e)}), 500
 
 
@@ -270,6 +363,18 @@ def ready():
     return jsonify({"status": "ready"}), 200
 
 
+@app.route("/_ah/warmup", methods=["GET"])
+def warmup():
+    """Warmup endpoint that creates the processor and its clients before real traffic."""
+    try:
+        processor = get_processor()
+        processor.storage_manager  # noqa: B018
+        processor.speech_client  # noqa: B018
+    except Exception as e:
+        logger.warning("Warmup incomplete: %s", e)
+    return jsonify({"status": "warm"}), 200
+
+
 @app.route("/", methods=["GET"])
 def root():
     """Root endpoint with API info."""
@@ -291,7 +396,7 @@ def root():
 
 
 # Cloud Functions entry point
-@functions_framework.cloud_event
+@cloud_event
 def process_audio_gcs(cloud_event):
     """
     Cloud Function triggered by Cloud Storage upload.
@@ -316,13 +421,13 @@ def process_audio_gcs(cloud_event):
             return
 
         gcs_uri = f"gs://{bucket}/{name}"
-        logger.info(f"Cloud Function triggered for {gcs_uri}")
+        logger.info("Cloud Function triggered for %s", gcs_uri)
 
         # Check if file should be processed
         from .gcp_utils import is_supported_format
 
         if not is_supported_format(gcs_uri):
-            logger.info(f"Skipping unsupported format: {gcs_uri}")
+            logger.info("Skipping unsupported format: %s", gcs_uri)
             return
 
         # Get output bucket from environment
@@ -339,40 +444,63 @@ def process_audio_gcs(cloud_event):
         )
 
         if result.error:
-            logger.error(f"Processing failed: {result.error}")
-            if error_client:
-                error_client.report(result.error)
+            logger.error("Processing failed: %s", result.error)
+            _report_error(result.error)
         else:
-            logger.info(f"Processing complete: {result.gcs_output_uri}, " f"transcript: {result.transcript_uri}")
+            logger.info("Processing complete: %s, transcript: %s", result.gcs_output_uri, result.transcript_uri)
 
     except Exception as e:
-        logger.error(f"Cloud Function failed: {str(e)}", exc_info=True)
-        if error_client:
-            error_client.report_exception()
+        logger.error("Cloud Function failed: %s", e, exc_info=True)
+        _report_exception()
         raise
 
 
 # HTTP Cloud Function entry point
-@functions_framework.http
+@http_function
 def process_audio_http(request):
     """
     HTTP Cloud Function for processing audio.
 
     Same interface as /process endpoint.
     """
-    # Reuse Flask app logic
-    with app.test_request_context(
-        path="/process",
-        method="POST",
-        data=request.get_data(),
-        content_type="application/json",
-    ):
-        response = process_audio()
-        return response
+    return _process_request(request.get_json(force=True, silent=True))
+
+
+def serve(port: int) -> None:
+    """
+    Serve the Flask app with gunicorn's threaded workers.
+
+    Uses the same settings as the container image (one worker, eight threads,
+    long timeout for multi-hour audio); WEB_CONCURRENCY and THREADS override
+    the worker and thread counts.
+    """
+    from gunicorn.app.base import BaseApplication
+
+    options = {
+        "bind": f"0.0.0.0:{port}",
+        "workers": int(os.getenv("WEB_CONCURRENCY", 1)),
+        "threads": int(os.getenv("THREADS", 8)),
+        "worker_class": "gthread",
+        "timeout": 3600,
+    }
+
+    class _Server(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    _Server().run()
 
 
 # Main entry point for Cloud Run
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8080))
-    logger.info(f"Starting server on port {port}")
-    app.run(host="0.0.0.0", port=port, debug=False)
+    logger.info("Starting server on port %s", port)
+    try:
+        serve(port)
+    except ImportError:
+        logger.warning("gunicorn not available, falling back to the Flask development server")
+        app.run(host="0.0.0.0", port=port, debug=False, threaded=True)
@@ -18,11 +18,15 @@ Usage:
 
 import argparse
 import logging
+import multiprocessing
 import os
 import sys
 import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 from dotenv import load_dotenv
 
 from .diarization import DiarizationConfig, Diarizer
@@ -47,11 +51,50 @@ from .utils import (
     validate_memory_for_file,
 )
 
-# Load environment variables
-load_dotenv()
-
 logger = logging.getLogger("media_intelligence")
 
+# Processor owned by each directory-processing worker process
+_worker_processor: "AudioProcessor | None" = None
+
+
+def _init_worker(processor_kwargs: dict[str, Any], log_level: str, log_file: str | None) -> None:
+    """Configure logging and load the models once in a directory-processing worker process."""
+    global _worker_processor
+    setup_logging(log_level, log_file)
+    _worker_processor = AudioProcessor(**processor_kwargs)
+
+
+def _logging_settings() -> tuple[str, str | None]:
+    """Return the level and log file configured by setup_logging in this process."""
+    log_file = next((h.baseFilename for h in logger.handlers if isinstance(h, logging.FileHandler)), None)
+    return logging.getLevelName(logger.getEffectiveLevel()), log_file
+
+
+def _process_one(audio_path: Path, output_dir: Path, language: str, beam_size: int, quiet: bool) -> "ProcessingResult":
+    """Process one file with the worker's processor."""
+    return _worker_processor._process_file_prepared(audio_path, output_dir, language, beam_size, quiet=quiet)
+
+
+def _set_thread_env(num_threads: int) -> None:
+    """Set the OpenMP/MKL thread counts, which are only read when those libraries initialize."""
+    value = str(num_threads)
+    for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        if os.environ.get(name) != value:
+            os.environ[name] = value
+
+
+def _set_torch_threads(num_threads: int) -> None:
+    """Apply the thread counts to torch at runtime, if a model has imported it."""
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return
+    if torch.get_num_threads() != num_threads:
+        torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(max(1, num_threads // 2))
+    except RuntimeError:
+        pass  # Already set, or inter-op work has started; it can only be set once
+
 
 class AudioProcessor:
     """
@@ -77,6 +120,8 @@ class AudioProcessor:
         enable_diarization: bool = True,
         enable_situation: bool = True,
         timeout: int | None = None,
+        quiet: bool = False,
+        processes: int = 1,
     ):
         """
         Initialize the audio processor.
@@ -90,58 +135,106 @@ class AudioProcessor:
             enable_diarization: Enable speaker diarization
             enable_situation: Enable situation classification
             timeout: Processing timeout in seconds (None for no limit)
+            quiet: Log one summary line per file instead of rich console output
+            processes: Worker processes for directory runs on CPU. Each one
+                loads its own copy of the models, so memory grows with this;
+                with more than one, this process only loads models if it
+                processes a file itself
         """
         self.timeout = timeout
+        self.quiet = quiet
         self.device = device
+        self.compute_type = compute_type
         self.num_workers = num_workers
+        self.processes = max(1, processes)
         self.hf_token = hf_token or os.environ.get("HUGGINGFACE_TOKEN")
         self.enable_diarization = enable_diarization
         self.whisper_model = whisper_model
         self.enable_situation = enable_situation
 
-        # Set thread limits
-        os.environ["OMP_NUM_THREADS"] = str(num_workers)
-        os.environ["MKL_NUM_THREADS"] = str(num_workers)
+        # Constructor arguments, for building the same processor in worker processes
+        self._init_kwargs = {
+            "whisper_model": whisper_model,
+            "device": device,
+            "compute_type": compute_type,
+            "num_workers": num_workers,
+            "hf_token": hf_token,
+            "enable_diarization": enable_diarization,
+            "enable_situation": enable_situation,
+            "timeout": timeout,
+            "quiet": quiet,
+            "processes": self.processes,
+        }
+
+        # Writer thread for deferred output files, created on first use
+        self._writer: ThreadPoolExecutor | None = None
+        self._pending_writes: list[tuple[Path, Future]] = []
+
+        # Set thread limits before any model library initializes OpenMP/MKL. On
+        # CUDA the heavy math runs on the GPU, so the libraries keep their defaults
+        if device == "cpu":
+            _set_thread_env(num_workers)
+
+        self.transcriber = None
+        self.diarizer = None
+        self.classifier = None
+        self._models_loaded = False
+
+        # Directory runs over several processes load models in the workers
+        # only; keeping an idle copy here would add one more set to memory
+        if not (device == "cpu" and self.processes > 1):
+            self._load_models()
+
+    def _load_models(self) -> None:
+        """Load the transcription, diarization and situation models."""
+        if self._models_loaded:
+            return
 
         # Initialize transcriber
         logger.info("Initializing transcription model...")
         whisper_config = WhisperConfig(
-            model_size=whisper_model,
-            device=device,
-            compute_type=compute_type,
+            model_size=self.whisper_model,
+            device=self.device,
+            compute_type=self.compute_type,
         )
         self.transcriber = Transcriber(whisper_config)
 
         # Initialize diarizer (optional)
-        self.diarizer = None
-        if enable_diarization and self.hf_token:
+        if self.enable_diarization and self.hf_token:
             logger.info("Initializing diarization model...")
             try:
-                diarization_config = DiarizationConfig(device=device)
+                diarization_config = DiarizationConfig(device=self.device)
                 self.diarizer = Diarizer(diarization_config, self.hf_token)
             except Exception as e:
-                logger.warning(f"Failed to initialize diarization: {e}")
+                logger.warning("Failed to initialize diarization: %s", e)
                 print_warning(f"Diarization disabled: {e}")
-        elif enable_diarization and not self.hf_token:
+        elif self.enable_diarization and not self.hf_token:
             print_warning("Speaker diarization disabled: No HuggingFace token provided.\n" "Set HUGGINGFACE_TOKEN environment variable to enable.")
 
         # Initialize situation classifier (optional)
-        self.classifier = None
-        if enable_situation:
+        if self.enable_situation:
             logger.info("Initializing situation classifier...")
             try:
-                situation_config = SituationConfig(device=device)
+                situation_config = SituationConfig(device=self.device, compute_type=self.compute_type)
                 self.classifier = SituationClassifier(situation_config)
             except Exception as e:
-                logger.warning(f"Failed to initialize situation classifier: {e}")
+                logger.warning("Failed to initialize situation classifier: %s", e)
                 print_warning(f"Situation classification disabled: {e}")
 
+        if self.device == "cpu":
+            _set_torch_threads(self.num_workers)
+
+        self._models_loaded = True
+
     def process_file(
         self,
         audio_path: str,
         output_dir: str,
         language: str = "en",
         beam_size: int = 5,
+        audio: tuple[np.ndarray, int] | None = None,
+        quiet: bool | None = None,
+        defer_writes: bool = False,
     ) -> ProcessingResult:
         """
         Process a single audio file.
@@ -151,6 +244,10 @@ class AudioProcessor:
             output_dir: Directory for output files
             language: Language code for transcription
             beam_size: Beam size for Whisper decoding
+            audio: Already loaded (audio, sample_rate) for audio_path, if any
+            quiet: Override the processor's quiet setting for this file
+            defer_writes: Write output files on a background thread; call
+                flush_outputs() to wait for them
 
         Returns:
             ProcessingResult with complete analysis
@@ -164,6 +261,19 @@ class AudioProcessor:
         output_dir = sanitize_path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        return self._process_file_prepared(audio_path, output_dir, language, beam_size, audio=audio, quiet=quiet, defer_writes=defer_writes)
+
+    def _process_file_prepared(
+        self,
+        audio_path: Path,
+        output_dir: Path,
+        language: str,
+        beam_size: int,
+        audio: tuple[np.ndarray, int] | None = None,
+        quiet: bool | None = None,
+        defer_writes: bool = False,
+    ) -> ProcessingResult:
+        """Process a file whose paths are already sanitized, with output_dir already created."""
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
@@ -177,46 +287,51 @@ class AudioProcessor:
         if mem_msg:  # Warning message
             print_warning(mem_msg)
 
-        start_time = time.time()
-        filename = audio_path.stem
+        if quiet is None:
+            quiet = self.quiet
 
-        # Helper function to check timeout
-        def check_timeout():
-            if self.timeout and (time.time() - start_time) > self.timeout:
-                raise TimeoutError(f"Processing timeout after {self.timeout}s. " f"Consider using a smaller model or shorter audio files.")
+        self._load_models()
 
-        console.print(f"\nProcessing: [bold]{audio_path.name}[/bold]")
+        start_time = time.monotonic()
+        deadline = start_time + self.timeout if self.timeout else None
+        filename = audio_path.stem
 
         # Load audio
-        audio, sr = load_audio(audio_path)
+        audio, sr = audio if audio is not None else load_audio(audio_path)
         duration = len(audio) / sr
-        console.print(f"Duration: {duration:.2f}s")
+        if not quiet:
+            console.print(f"\nProcessing: [bold]{audio_path.name}[/bold]")
+            console.print(f"Duration: {duration:.2f}s")
 
         # Step 1: Transcription
         total_steps = 2 + (1 if self.diarizer else 0) + (1 if self.classifier else 0)
         current_step = 1
 
-        print_step(current_step, total_steps, "Transcribing audio...")
+        if not quiet:
+            print_step(current_step, total_steps, "Transcribing audio...")
         transcript_segments, trans_metadata = self.transcriber.transcribe(audio, sr, language=language, beam_size=beam_size)
-        console.print(f"  Found {len(transcript_segments)} segments")
-        check_timeout()
+        if not quiet:
+            console.print(f"  Found {len(transcript_segments)} segments")
+        self._check_timeout(deadline)
 
         # Step 2: Diarization (optional)
         speaker_segments = []
         num_speakers = 0
         if self.diarizer:
             current_step += 1
-            print_step(current_step, total_steps, "Identifying speakers...")
+            if not quiet:
+                print_step(current_step, total_steps, "Identifying speakers...")
             try:
                 from .diarization import assign_speakers_to_segments as assign_speakers
 
                 speaker_segments = self.diarizer.diarize(audio, sr)
                 transcript_segments = assign_speakers(transcript_segments, speaker_segments)
-                num_speakers = len(set(s.speaker for s in speaker_segments))
-                console.print(f"  Found {num_speakers} speakers")
-                check_timeout()
+                num_speakers = speaker_segments.num_speakers
+                if not quiet:
+                    console.print(f"  Found {num_speakers} speakers")
+                self._check_timeout(deadline)
             except Exception as e:
-                logger.error(f"Diarization failed: {e}")
+                logger.error("Diarization failed: %s", e)
                 print_warning(f"Diarization failed: {e}")
 
         # Step 3: Situation classification (optional)
@@ -224,21 +339,23 @@ class AudioProcessor:
         overall_situation = "unknown"
         if self.classifier:
             current_step += 1
-            print_step(current_step, total_steps, "Detecting situations...")
+            if not quiet:
+                print_step(current_step, total_steps, "Detecting situations...")
             try:
                 situation_segments, overall_situation = self.classifier.classify_audio(audio, sr)
-                console.print(f"  Overall situation: {overall_situation}")
-                check_timeout()
+                if not quiet:
+                    console.print(f"  Overall situation: {overall_situation}")
+                self._check_timeout(deadline)
             except Exception as e:
-                logger.error(f"Situation classification failed: {e}")
+                logger.error("Situation classification failed: %s", e)
                 print_warning(f"Situation classification failed: {e}")
 
         # Calculate processing time
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
 
         # Build result
         result = ProcessingResult(
-            file_path=str(audio_path.absolute()),
+            file_path=str(audio_path),  # Already absolute from sanitize_path
             duration=duration,
             transcript_segments=transcript_segments,
             situation_segments=situation_segments,
@@ -255,29 +372,64 @@ class AudioProcessor:
 
         # Step N: Save outputs
         current_step += 1
-        print_step(current_step, total_steps, "Saving outputs...")
+        if not quiet:
+            print_step(current_step, total_steps, "Saving outputs...")
 
-        # Save JSON
+        # JSON and transcript, plus situations when there are any
         json_path = output_dir / f"{filename}_results.json"
-        save_json_output(result, json_path)
-        console.print(f"  JSON: {json_path}")
-
-        # Save transcript
         txt_path = output_dir / f"{filename}_transcript.txt"
-        save_transcript_output(result, txt_path)
-        console.print(f"  Transcript: {txt_path}")
-
-        # Save situations
+        outputs = [(save_json_output, json_path), (save_transcript_output, txt_path)]
+        sit_path = None
         if situation_segments:
             sit_path = output_dir / f"{filename}_situations.txt"
-            save_situations_output(result, sit_path)
-            console.print(f"  Situations: {sit_path}")
+            outputs.append((save_situations_output, sit_path))
 
-        print_success("Processing complete")
-        print_results_table(result)
+        if defer_writes:
+            # Serialization and disk writes overlap whatever the caller does next
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="output-writer")
+            self._pending_writes.extend((path, self._writer.submit(save, result, path)) for save, path in outputs)
+        else:
+            for save, path in outputs:
+                save(result, path)
+
+        if quiet:
+            logger.info(
+                "Processed %s: %.2fs audio in %.2fs, %d segments, %d speakers, situation %s",
+                audio_path.name,
+                duration,
+                processing_time,
+                len(transcript_segments),
+                num_speakers,
+                overall_situation,
+            )
+        else:
+            console.print(f"  JSON: {json_path}")
+            console.print(f"  Transcript: {txt_path}")
+            if sit_path is not None:
+                console.print(f"  Situations: {sit_path}")
+            print_success("Processing complete")
+            # Tables are only worth rendering for a terminal, not for redirected output
+            if console.is_terminal:
+                print_results_table(result)
 
         return result
 
+    def _check_timeout(self, deadline: float | None) -> None:
+        """Raise TimeoutError once a process_file deadline (time.monotonic() based) has passed."""
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError(f"Processing timeout after {self.timeout}s. " f"Consider using a smaller model or shorter audio files.")
+
+    def flush_outputs(self) -> None:
+        """Wait for output files deferred by process_file, reporting any that failed."""
+        pending, self._pending_writes = self._pending_writes, []
+        for path, future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                print_error(f"Failed to write {path.name}: {e}")
+                logger.exception("Failed to write %s", path)
+
     def process_directory(
         self,
         input_dir: str,
@@ -288,6 +440,13 @@ class AudioProcessor:
         """
         Process all audio files in a directory.
 
+        By default files run one at a time against the shared models while
+        the next file's audio is decoded in the background. On CPU with
+        ``processes`` above 1, files are instead spread over that many worker
+        processes that each load the models once, with the worker thread
+        budget split between them. Runs of more than 10 files
+        are processed quietly, logging one line per file.
+
         Args:
             input_dir: Directory containing audio files
             output_dir: Directory for output files
@@ -305,16 +464,17 @@ class AudioProcessor:
             return []
 
         console.print(f"\nFound {len(audio_files)} audio files")
+        quiet = self.quiet or len(audio_files) > 10
 
-        results = []
-        for i, audio_path in enumerate(audio_files, 1):
-            console.print(f"\n[bold]File {i}/{len(audio_files)}[/bold]")
-            try:
-                result = self.process_file(str(audio_path), output_dir, language, beam_size)
-                results.append(result)
-            except Exception as e:
-                print_error(f"Failed to process {audio_path.name}: {e}")
-                logger.exception(f"Failed to process {audio_path}")
+        # Prepared once for the whole run rather than per file
+        output_dir = sanitize_path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        processes = min(len(audio_files), self.processes)
+        if self.device == "cpu" and processes > 1:
+            results = self._process_files_parallel(audio_files, output_dir, language, beam_size, quiet, processes)
+        else:
+            results = self._process_files_serial(audio_files, output_dir, language, beam_size, quiet)
 
         # Print summary
         console.print("\n[bold]Batch Processing Complete[/bold]")
@@ -322,6 +482,79 @@ class AudioProcessor:
 
         return results
 
+    def _process_files_serial(
+        self,
+        audio_files: list[Path],
+        output_dir: Path,
+        language: str,
+        beam_size: int,
+        quiet: bool,
+    ) -> list[ProcessingResult]:
+        """
+        Process files in order, decoding the next file's audio in the background.
+
+        Output files are written on the writer thread while later files are
+        processed, and all writes have finished when this returns.
+        """
+        results = []
+        try:
+            with ThreadPoolExecutor(max_workers=1) as loader:
+                next_audio: Future | None = loader.submit(self._preload_audio, audio_files[0])
+                for i, audio_path in enumerate(audio_files, 1):
+                    if not quiet:
+                        console.print(f"\n[bold]File {i}/{len(audio_files)}[/bold]")
+                    current_audio = next_audio
+                    next_audio = loader.submit(self._preload_audio, audio_files[i]) if i < len(audio_files) else None
+                    try:
+                        try:
+                            audio = current_audio.result()
+                        except Exception:
+                            audio = None  # Let process_file load, validate and report the file
+                        result = self._process_file_prepared(sanitize_path(audio_path), output_dir, language, beam_size, audio=audio, quiet=quiet, defer_writes=True)
+                        results.append(result)
+                    except Exception as e:
+                        print_error(f"Failed to process {audio_path.name}: {e}")
+                        logger.exception("Failed to process %s", audio_path)
+        finally:
+            self.flush_outputs()
+        return results
+
+    def _preload_audio(self, audio_path: Path) -> tuple[np.ndarray, int] | None:
+        """Decode a file ahead of time, unless memory is too tight to hold two files."""
+        mem_valid, mem_msg = validate_memory_for_file(audio_path, self.whisper_model)
+        if not mem_valid or mem_msg:
+            return None
+        return load_audio(audio_path)
+
+    def _process_files_parallel(
+        self,
+        audio_files: list[Path],
+        output_dir: Path,
+        language: str,
+        beam_size: int,
+        quiet: bool,
+        processes: int,
+    ) -> list[ProcessingResult]:
+        """Process files across spawned worker processes, keeping results in input order."""
+        worker_kwargs = {**self._init_kwargs, "num_workers": max(1, self.num_workers // processes), "processes": 1}
+        console.print(f"Processing with {processes} worker processes")
+
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(worker_kwargs, *_logging_settings()),
+        ) as executor:
+            futures = [executor.submit(_process_one, sanitize_path(audio_path), output_dir, language, beam_size, quiet) for audio_path in audio_files]
+            for audio_path, future in zip(audio_files, futures, strict=True):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print_error(f"Failed to process {audio_path.name}: {e}")
+                    logger.exception("Failed to process %s", audio_path)
+        return results
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -357,10 +590,18 @@ Examples:
     parser.add_argument("-c", "--compute-type", default="int8", choices=["int8", "float16", "float32"], help="Compute type (default: int8)")
     parser.add_argument("--hf-token", help="HuggingFace token for pyannote (or set HUGGINGFACE_TOKEN env var)")
     parser.add_argument("-w", "--workers", type=int, default=4, help="Number of CPU workers (default: 4)")
+    parser.add_argument(
+        "-p",
+        "--processes",
+        type=int,
+        default=1,
+        help="Worker processes for directory input on CPU; each loads its own models (default: 1)",
+    )
     parser.add_argument("-l", "--language", default="en", help="Language code (default: en, use 'auto' for detection)")
     parser.add_argument("-b", "--beam-size", type=int, default=5, help="Beam size for decoding (default: 5)")
     parser.add_argument("--no-diarization", action="store_true", help="Disable speaker diarization")
     parser.add_argument("--no-situation", action="store_true", help="Disable situation classification")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Log one summary line per file instead of progress output")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument("--log-file", help="Write logs to file")
     parser.add_argument("--timeout", type=int, default=None, help="Processing timeout in seconds (default: no limit)")
@@ -372,6 +613,9 @@ def main() -> int:
     """Main entry point."""
     args = parse_args()
 
+    # Load environment variables
+    load_dotenv()
+
     # Setup logging
     log_level = "DEBUG" if args.verbose else "INFO"
     setup_logging(log_level, args.log_file)
@@ -391,6 +635,8 @@ def main() -> int:
             enable_diarization=not args.no_diarization,
             enable_situation=not args.no_situation,
             timeout=args.timeout,
+            quiet=args.quiet,
+            processes=args.processes,
         )
 
         input_path = Path(args.input)
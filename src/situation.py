@@ -10,7 +10,11 @@ Uses the MIT AST model fine-tuned on AudioSet.
 """
 
 import logging
+import threading
+import weakref
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 
 import numpy as np
 
@@ -52,6 +56,235 @@ for situation, labels in SITUATION_MAPPING.items():
         LABEL_TO_SITUATION[label.lower()] = situation
 
 
+@lru_cache(maxsize=1024)
+def _situation_votes(label: str) -> tuple[tuple[str, float], ...]:
+    """
+    Situations a lowercased AudioSet label votes for, in scoring order.
+
+    A direct match votes with weight 1.0 and every substring match with 0.5.
+    The model has a fixed label set, so each label is only scanned once.
+    """
+    votes = []
+    if label in LABEL_TO_SITUATION:
+        votes.append((LABEL_TO_SITUATION[label], 1.0))
+    for sit_label, sit_name in LABEL_TO_SITUATION.items():
+        if sit_label in label or label in sit_label:
+            votes.append((sit_name, 0.5))
+    return tuple(votes)
+
+
+# Situation order for vote matrices
+_SITUATIONS = tuple(SITUATION_MAPPING)
+_SITUATION_INDEX = {situation: i for i, situation in enumerate(_SITUATIONS)}
+
+# Confidence given to windows labelled "quiet" by the silence gate. The label
+# is not a model prediction, so it is weighted like an uncertain one rather
+# than letting long silent gaps dominate the overall vote
+_SILENT_WINDOW_CONFIDENCE = 0.5
+
+
+def _situation_weight_matrix(id2label: dict[int, str]) -> np.ndarray:
+    """Summed vote weight of every model class for every situation, shape (classes, situations)."""
+    weights = np.zeros((max(id2label, default=-1) + 1, len(_SITUATIONS)))
+    for idx, label in id2label.items():
+        for situation, weight in _situation_votes(label.lower()):
+            weights[idx, _SITUATION_INDEX[situation]] += weight
+    return weights
+
+
+def _kaldi_fbank(feature_extractor):
+    """Return torchaudio's Kaldi fbank for an AST feature extractor, or None to use the extractor itself."""
+    try:
+        from torchaudio.compliance import kaldi
+        from transformers import ASTFeatureExtractor
+    except ImportError:
+        return None
+    return kaldi.fbank if isinstance(feature_extractor, ASTFeatureExtractor) else None
+
+
+def _full_scale(dtype: np.dtype) -> float:
+    """Magnitude of full-scale audio for a sample dtype: 32768 for int16, 1.0 for floats."""
+    return float(-np.iinfo(dtype).min) if np.issubdtype(dtype, np.signedinteger) else 1.0
+
+
+def _to_float32(audio: np.ndarray) -> np.ndarray:
+    """Return audio as float32, scaling signed integer PCM to [-1, 1)."""
+    if audio.dtype == np.float32:
+        return audio
+    converted = audio.astype(np.float32)
+    if np.issubdtype(audio.dtype, np.signedinteger):
+        converted *= np.float32(1.0 / _full_scale(audio.dtype))
+    return converted
+
+
+class _LoadedModel:
+    """Model, feature extractor and derived state shared by classifiers with the same settings."""
+
+    __slots__ = (
+        "model",
+        "forward",
+        "compiled",
+        "session",
+        "feature_extractor",
+        "id2label",
+        "situation_weights",
+        "device",
+        "dtype",
+        "fbank",
+        "__weakref__",
+    )
+
+
+# Loaded models keyed by (backend, model, device, compute_type, compile_model); entries go away once no classifier holds them
+_MODEL_CACHE: "weakref.WeakValueDictionary[tuple[str, str, str, str, bool], _LoadedModel]" = weakref.WeakValueDictionary()
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _load_shared_model(config: "SituationConfig") -> _LoadedModel:
+    """Load the AST model and feature extractor for a configuration."""
+    if config.backend == "onnx":
+        return _load_onnx_model(config)
+    if config.backend != "torch":
+        raise ValueError(f"Unknown backend: {config.backend}")
+
+    import torch
+    from transformers import ASTForAudioClassification, AutoFeatureExtractor
+
+    logger.info("Loading AST model: %s", config.model)
+
+    device = torch.device(config.device)
+    compute_type = config.compute_type
+
+    # Lower precision where it pays off; other combinations stay in float32
+    dtype = getattr(torch, compute_type) if device.type == "cuda" and compute_type in ("float16", "bfloat16") else None
+
+    loaded = _LoadedModel()
+    loaded.feature_extractor = AutoFeatureExtractor.from_pretrained(config.model)
+    # Loading straight into the reduced dtype avoids materializing a float32 copy first
+    model = ASTForAudioClassification.from_pretrained(config.model, torch_dtype=dtype)
+
+    # Move to device
+    model.to(device)
+    model.eval()
+
+    if device.type == "cpu" and compute_type == "int8":
+        # Dynamic int8 quantization of the encoder's linear layers
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    loaded.model = model
+
+    # Get label mapping
+    loaded.id2label = model.config.id2label
+    loaded.situation_weights = _situation_weight_matrix(loaded.id2label)
+
+    # Resolved once for the per-batch input transfer
+    param = next(model.parameters())
+    loaded.device = param.device
+    loaded.dtype = param.dtype
+    if device.type == "cuda":
+        # AST inputs have a fixed shape, so cuDNN's autotuned kernels are reused every batch
+        torch.backends.cudnn.benchmark = True
+
+    loaded.fbank = _kaldi_fbank(loaded.feature_extractor)
+
+    loaded.forward = model
+    loaded.compiled = False
+    loaded.session = None
+    if config.compile_model:
+        _compile_forward(loaded, config.batch_size)
+
+    logger.info("AST model loaded with %s classes", len(loaded.id2label))
+    return loaded
+
+
+def _load_onnx_model(config: "SituationConfig") -> _LoadedModel:
+    """
+    Load the AST model as an ONNX Runtime session.
+
+    The model is exported to ONNX under config.onnx_cache_dir on first use
+    (and dynamically quantized to int8 when compute_type is int8); later loads
+    reuse the exported file.
+    """
+    try:
+        import onnxruntime as ort
+        from optimum.exporters.onnx import main_export
+    except ImportError as e:
+        raise ImportError("onnxruntime and optimum required for the ONNX backend. Install with: pip install optimum[onnxruntime]") from e
+    from transformers import AutoConfig, AutoFeatureExtractor
+
+    logger.info("Loading AST model with ONNX Runtime: %s", config.model)
+
+    export_dir = Path(config.onnx_cache_dir).expanduser() / config.model.replace("/", "--")
+    model_path = export_dir / "model.onnx"
+    if not model_path.exists():
+        logger.info("Exporting %s to ONNX in %s", config.model, export_dir)
+        main_export(config.model, output=export_dir, task="audio-classification")
+
+    if config.compute_type == "int8":
+        # Dynamic int8 quantization of the weights, as in the torch backend
+        quantized_path = export_dir / "model_int8.onnx"
+        if not quantized_path.exists():
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            quantize_dynamic(model_path, quantized_path, weight_type=QuantType.QInt8)
+        model_path = quantized_path
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    providers = ["CPUExecutionProvider"]
+    if config.device.startswith("cuda"):
+        providers.insert(0, "CUDAExecutionProvider")
+
+    loaded = _LoadedModel()
+    loaded.session = ort.InferenceSession(str(model_path), sess_options=options, providers=providers)
+    loaded.feature_extractor = AutoFeatureExtractor.from_pretrained(config.model)
+    loaded.id2label = {int(idx): label for idx, label in AutoConfig.from_pretrained(config.model).id2label.items()}
+    loaded.situation_weights = _situation_weight_matrix(loaded.id2label)
+    loaded.model = loaded.forward = loaded.fbank = loaded.device = loaded.dtype = None
+    loaded.compiled = False
+
+    logger.info("AST model loaded with %s classes", len(loaded.id2label))
+    return loaded
+
+
+def _compile_forward(loaded: _LoadedModel, batch_size: int) -> None:
+    """
+    Replace the loaded model's forward with a torch.compile'd one and warm it up.
+
+    AST inputs have a fixed shape, so the forward is compiled for one static
+    batch shape (callers pad short batches to it); on CUDA it is also captured
+    as a CUDA graph. Any failure leaves the eager model in place.
+    """
+    import torch
+
+    extractor = loaded.feature_extractor
+    if not hasattr(torch, "compile") or not hasattr(extractor, "max_length"):
+        logger.warning("torch.compile unavailable for this model; running eagerly")
+        return
+
+    mode = "reduce-overhead" if loaded.device.type == "cuda" else "max-autotune-no-cudagraphs"
+    try:
+        forward = torch.compile(loaded.model, mode=mode, dynamic=False)
+        # Compile now, so the first real batch does not pay for it
+        example = torch.zeros((batch_size, extractor.max_length, extractor.num_mel_bins), dtype=loaded.dtype, device=loaded.device)
+        with torch.inference_mode():
+            forward(input_values=example)
+    except Exception as e:
+        logger.warning("torch.compile failed, running eagerly: %s", e)
+        return
+
+    loaded.forward = forward
+    loaded.compiled = True
+
+
+def _pad_batch(tensor, size: int):
+    """Zero-pad a batch tensor along its first dimension to size rows."""
+    import torch
+
+    if len(tensor) >= size:
+        return tensor
+    return torch.cat([tensor, tensor.new_zeros((size - len(tensor), *tensor.shape[1:]))])
+
+
 @dataclass
 class SituationConfig:
     """Configuration for situation classification."""
@@ -60,6 +293,12 @@ class SituationConfig:
     segment_duration: float = 30.0
     confidence_threshold: float = 0.3
     device: str = "cpu"
+    batch_size: int = 8
+    compute_type: str = "float32"  # float32, float16/bfloat16 (CUDA), int8 (CPU)
+    silence_rms_threshold: float = 1e-3  # Windows quieter than this skip the model (0 disables)
+    compile_model: bool = False  # torch.compile the forward for the fixed AST input shape
+    backend: str = "torch"  # torch, or onnx (ONNX Runtime; needs optimum and onnxruntime)
+    onnx_cache_dir: str = "~/.cache/media-intelligence/onnx"  # Exported ONNX models (onnx backend)
 
 
 class SituationClassifier:
@@ -86,27 +325,40 @@ class SituationClassifier:
         self.model = None
         self.feature_extractor = None
         self.id2label = None
+        self.situation_weights = None
+        self._device = None
+        self._dtype = None
+        self._pinned: dict = {}
+        self._fbank = None
+        self._features = None
+        self._loaded: _LoadedModel | None = None
+        self._forward = None
+        self._compiled = False
+        self._session = None
+        self.silent_windows_skipped = 0
         self._load_model()
 
     def _load_model(self) -> None:
-        """Load the AST model and feature extractor."""
-        import torch
-        from transformers import ASTForAudioClassification, AutoFeatureExtractor
-
-        logger.info(f"Loading AST model: {self.config.model}")
-
-        self.feature_extractor = AutoFeatureExtractor.from_pretrained(self.config.model)
-        self.model = ASTForAudioClassification.from_pretrained(self.config.model)
-
-        # Move to device
-        device = torch.device(self.config.device)
-        self.model.to(device)
-        self.model.eval()
-
-        # Get label mapping
-        self.id2label = self.model.config.id2label
-
-        logger.info(f"AST model loaded with {len(self.id2label)} classes")
+        """Load the AST model and feature extractor, sharing them with other classifiers of the same settings."""
+        key = (self.config.backend, self.config.model, self.config.device, self.config.compute_type, self.config.compile_model)
+        with _MODEL_CACHE_LOCK:
+            loaded = _MODEL_CACHE.get(key)
+            if loaded is None:
+                loaded = _load_shared_model(self.config)
+                _MODEL_CACHE[key] = loaded
+
+        # Holding the entry keeps it in the cache for as long as this classifier lives
+        self._loaded = loaded
+        self.model = loaded.model
+        self.feature_extractor = loaded.feature_extractor
+        self.id2label = loaded.id2label
+        self.situation_weights = loaded.situation_weights
+        self._device = loaded.device
+        self._dtype = loaded.dtype
+        self._fbank = loaded.fbank
+        self._forward = loaded.forward
+        self._compiled = loaded.compiled
+        self._session = loaded.session
 
     def classify_segment(
         self,
@@ -129,48 +381,170 @@ class SituationClassifier:
         Raises:
             RuntimeError: If model not loaded
         """
-        if self.model is None or self.feature_extractor is None:
+        return self._classify_batch([audio], sample_rate)[0]
+
+    def _classify_batch(
+        self,
+        segments: list[np.ndarray],
+        sample_rate: int = 16000,
+    ) -> list[tuple[str, float, list[dict[str, float]]]]:
+        """
+        Classify several audio segments with one forward pass.
+
+        The feature extractor pads or truncates every segment to the model's
+        fixed input length, so batching does not change per-segment results.
+
+        Args:
+            segments: Audio segments as numpy arrays
+            sample_rate: Sample rate of audio
+
+        Returns:
+            List of (situation, confidence, top_predictions), one per segment
+
+        Raises:
+            RuntimeError: If model not loaded
+        """
+        if (self.model is None and self._session is None) or self.feature_extractor is None:
             raise RuntimeError("Model not loaded")
 
-        import torch
+        batch = []
+        for audio in segments:
+            # Ensure audio is float32 (no-op for float32 windows from classify_audio)
+            audio = _to_float32(audio)
 
-        # Ensure audio is float32
-        if audio.dtype != np.float32:
-            audio = audio.astype(np.float32)
+            # Ensure mono
+            if audio.ndim > 1:
+                audio = audio.mean(axis=0)
 
-        # Ensure mono
-        if audio.ndim > 1:
-            audio = audio.mean(axis=0)
+            batch.append(audio)
+
+        top_k = 10
+        if self._session is not None:
+            top_probs, top_indices = self._top_k_onnx(batch, sample_rate, top_k)
+        else:
+            top_probs, top_indices = self._top_k_torch(batch, sample_rate, top_k)
+
+        # Map every segment to a situation at once: score = sum of confidence x vote weight
+        votes = self.situation_weights[top_indices]
+        scores = np.einsum("nk,nks->ns", top_probs, votes)
+        best = scores.argmax(axis=1).tolist()
+        has_votes = votes.any(axis=(1, 2)).tolist()
+
+        results = []
+        for row_probs, row_indices, situation_idx, voted in zip(top_probs.tolist(), top_indices.tolist(), best, has_votes, strict=True):
+            top_predictions = [{"label": self.id2label[idx], "confidence": prob} for prob, idx in zip(row_probs, row_indices, strict=True)]
+            situation = _SITUATIONS[situation_idx] if voted else "unknown"
+            confidence = top_predictions[0]["confidence"] if top_predictions else 0.0
+
+            results.append((situation, confidence, top_predictions))
+
+        return results
+
+    def _top_k_torch(self, batch: list[np.ndarray], sample_rate: int, top_k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Top-k class probabilities and indices, shape (N, top_k) each, from the torch model."""
+        import torch
 
         # Extract features
-        inputs = self.feature_extractor(audio, sampling_rate=sample_rate, return_tensors="pt", padding=True)
+        if self._fbank is not None and sample_rate == self.feature_extractor.sampling_rate:
+            inputs = {"input_values": self._extract_fbank(batch)}
+        else:
+            inputs = self.feature_extractor(batch, sampling_rate=sample_rate, return_tensors="pt", padding=True)
 
-        # Move to device
-        device = next(self.model.parameters()).device
-        inputs = {k: v.to(device) for k, v in inputs.items()}
+            # Move to device, matching the model's floating-point precision
+            inputs = {k: self._to_device(k, v) for k, v in inputs.items()}
 
         # Run inference
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            logits = outputs.logits
+        if self._compiled:
+            # The compiled forward is specialized to one batch shape
+            inputs = {k: _pad_batch(v, max(self.config.batch_size, len(batch))) for k, v in inputs.items()}
 
-        # Get probabilities
-        probs = torch.softmax(logits, dim=-1)[0]
+        with torch.inference_mode():
+            outputs = self._forward(**inputs)
+            logits = outputs.logits[: len(batch)]
 
-        # Get top predictions
-        top_k = 10
-        top_probs, top_indices = torch.topk(probs, top_k)
+        # Top predictions for every segment at once. Ranking logits equals ranking
+        # probabilities, so only the top-k are exponentiated: p = exp(logit - logsumexp)
+        logits = logits.float()
+        top_logits, top_indices = torch.topk(logits, top_k, dim=-1)
+        top_probs = torch.exp(top_logits - torch.logsumexp(logits, dim=-1, keepdim=True))
+
+        return top_probs.cpu().numpy().astype(np.float64), top_indices.cpu().numpy()
+
+    def _top_k_onnx(self, batch: list[np.ndarray], sample_rate: int, top_k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Top-k class probabilities and indices, shape (N, top_k) each, from the ONNX Runtime session."""
+        inputs = self.feature_extractor(batch, sampling_rate=sample_rate, return_tensors="np", padding=True)
+        feeds = {node.name: inputs[node.name] for node in self._session.get_inputs()}
+        logits = self._session.run(None, feeds)[0].astype(np.float64)
+
+        # Same exact probabilities as the torch path: p = exp(logit - logsumexp)
+        top_indices = np.argsort(-logits, axis=-1, kind="stable")[:, :top_k]
+        peak = logits.max(axis=-1, keepdims=True)
+        log_total = peak + np.log(np.exp(logits - peak).sum(axis=-1, keepdims=True))
+        top_probs = np.exp(np.take_along_axis(logits, top_indices, axis=-1) - log_total)
 
-        top_predictions = []
-        for prob, idx in zip(top_probs.tolist(), top_indices.tolist(), strict=True):
-            label = self.id2label[idx]
-            top_predictions.append({"label": label, "confidence": prob})
+        return top_probs, top_indices
 
-        # Map to situation
-        situation = self._map_to_situation(top_predictions)
-        confidence = top_predictions[0]["confidence"] if top_predictions else 0.0
+    def _extract_fbank(self, batch: list[np.ndarray]):
+        """
+        Compute AST input features on the model's device.
 
-        return situation, confidence, top_predictions
+        Mirrors ASTFeatureExtractor's torchaudio path (Kaldi fbank, zero-pad or
+        truncate to max_length frames, then mean/std normalization), but writes
+        every segment into one feature buffer reused across batches instead of
+        building per-segment numpy arrays and copying the batch to the device.
+        """
+        import torch
+
+        extractor = self.feature_extractor
+        max_length = extractor.max_length
+        shape = (len(batch), max_length, extractor.num_mel_bins)
+
+        features = self._features
+        if features is None or len(features) < len(batch):
+            features = torch.empty(shape, dtype=torch.float32, device=self._device)
+            self._features = features
+        features = features[: len(batch)]
+        features.zero_()
+
+        for row, audio in zip(features, batch, strict=True):
+            waveform = torch.from_numpy(audio).to(self._device).unsqueeze(0)
+            fbank = self._fbank(
+                waveform,
+                sample_frequency=extractor.sampling_rate,
+                window_type="hanning",
+                num_mel_bins=extractor.num_mel_bins,
+            )
+            frames = min(len(fbank), max_length)
+            row[:frames] = fbank[:frames]
+
+        if extractor.do_normalize:
+            features.sub_(extractor.mean).div_(extractor.std * 2)
+
+        return features.to(self._dtype)
+
+    def _to_device(self, name: str, tensor):
+        """
+        Move a model input to the model's device and floating-point precision.
+
+        CUDA transfers are staged through a pinned buffer kept per input and
+        reused across batches, so the copy can run asynchronously. Results are
+        read back to the host before the next batch, so the buffer is free again
+        by the time it is refilled.
+        """
+        import torch
+
+        dtype = self._dtype if tensor.is_floating_point() else tensor.dtype
+        if self._device.type != "cuda":
+            return tensor.to(self._device, dtype=dtype)
+
+        staging = self._pinned.get(name)
+        if staging is None or staging.dtype != tensor.dtype or staging.shape[1:] != tensor.shape[1:] or len(staging) < len(tensor):
+            staging = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+            self._pinned[name] = staging
+
+        view = staging[: len(tensor)]
+        view.copy_(tensor)
+        return view.to(self._device, non_blocking=True).to(dtype)
 
     def _map_to_situation(self, predictions: list[dict[str, float]]) -> str:
         """
@@ -188,24 +562,17 @@ class SituationClassifier:
         situation_scores: dict[str, float] = {}
 
         for pred in predictions:
-            label = pred["label"].lower()
             confidence = pred["confidence"]
 
-            # Check direct mapping
-            if label in LABEL_TO_SITUATION:
-                situation = LABEL_TO_SITUATION[label]
-                situation_scores[situation] = situation_scores.get(situation, 0.0) + confidence
-
-            # Check partial matches
-            for sit_label, sit_name in LABEL_TO_SITUATION.items():
-                if sit_label in label or label in sit_label:
-                    situation_scores[sit_name] = situation_scores.get(sit_name, 0.0) + confidence * 0.5
+            # Direct and partial matches, resolved once per label
+            for situation, weight in _situation_votes(pred["label"].lower()):
+                situation_scores[situation] = situation_scores.get(situation, 0.0) + confidence * weight
 
         # Return situation with highest score, or "unknown" if no matches
         if not situation_scores:
             return "unknown"
 
-        return max(situation_scores.items(), key=lambda x: x[1])[0]
+        return max(situation_scores, key=situation_scores.__getitem__)
 
     def classify_audio(
         self,
@@ -216,8 +583,15 @@ class SituationClassifier:
         """
         Classify full audio with sliding windows.
 
+        Windows whose level (RMS around their mean, so a DC offset does not
+        count as sound) is below config.silence_rms_threshold are labelled
+        "quiet" without running the model, at a neutral confidence so they do
+        not outweigh classified windows in the overall vote;
+        silent_windows_skipped counts them.
+
         Args:
-            audio: Audio data as numpy array
+            audio: Audio data as numpy array. Signed integer PCM (e.g. int16) is
+                accepted and converted to float one window at a time
             sample_rate: Sample rate of audio
             segment_duration: Duration of each segment (default from config)
 
@@ -227,39 +601,68 @@ class SituationClassifier:
         segment_duration = segment_duration or self.config.segment_duration
         segment_samples = int(segment_duration * sample_rate)
 
-        segments = []
-
-        # Process in windows
-        start_sample = 0
-        while start_sample < len(audio):
-            end_sample = min(start_sample + segment_samples, len(audio))
-            segment_audio = audio[start_sample:end_sample]
-
-            # Skip very short segments
-            if len(segment_audio) < sample_rate:  # Less than 1 second
-                break
-
-            start_time = start_sample / sample_rate
-            end_time = end_sample / sample_rate
-
-            situation, confidence, top_preds = self.classify_segment(segment_audio, sample_rate)
-
-            segments.append(
-                SituationSegment(
-                    start=start_time,
-                    end=end_time,
-                    situation=situation,
-                    confidence=confidence,
-                    top_predictions=top_preds[:5],  # Keep top 5
-                )
+        # Mono integer PCM stays compact and is converted one window at a time;
+        # anything else is converted once so every window is already float32 mono
+        if audio.ndim > 1:
+            audio = _to_float32(audio).mean(axis=0)
+        elif not np.issubdtype(audio.dtype, np.signedinteger):
+            audio = _to_float32(audio)
+        full_scale = _full_scale(audio.dtype)
+
+        # Non-overlapping windows: the full ones are rows of a single reshaped view,
+        # followed by the remainder when it lasts at least one second
+        n_full = len(audio) // segment_samples if segment_samples >= sample_rate else 0
+        full = audio[: n_full * segment_samples].reshape(n_full, segment_samples)
+        windows = list(full)
+        tail = audio[n_full * segment_samples :]
+        has_tail = segment_samples >= sample_rate and len(tail) >= sample_rate
+        if has_tail:
+            windows.append(tail)
+        starts = np.arange(len(windows)) * segment_samples
+        ends = np.minimum(starts + segment_samples, len(audio))
+
+        # Near-silent windows are always "quiet", so they skip the model
+        results: list[tuple[str, float, list[dict[str, float]]] | None] = [None] * len(windows)
+        threshold = self.config.silence_rms_threshold * full_scale
+        if threshold > 0:
+            levels = np.std(full, axis=1, dtype=np.float64).tolist()
+            if has_tail:
+                levels.append(float(np.std(tail, dtype=np.float64)))
+            silent = [level < threshold for level in levels]
+        else:
+            silent = [False] * len(windows)
+        pending = []
+        for i, is_silent in enumerate(silent):
+            if is_silent:
+                results[i] = ("quiet", _SILENT_WINDOW_CONFIDENCE, [{"label": "Silence", "confidence": _SILENT_WINDOW_CONFIDENCE}])
+            else:
+                pending.append(i)
+        skipped = len(windows) - len(pending)
+        self.silent_windows_skipped += skipped
+
+        # Classify windows in batches so each forward pass covers several segments
+        batch_size = max(1, self.config.batch_size)
+        for batch_start in range(0, len(pending), batch_size):
+            batch = pending[batch_start : batch_start + batch_size]
+            batch_results = self._classify_batch([windows[i] for i in batch], sample_rate)
+            for i, result in zip(batch, batch_results, strict=True):
+                results[i] = result
+
+        segments = [
+            SituationSegment(
+                start=start / sample_rate,
+                end=end / sample_rate,
+                situation=situation,
+                confidence=confidence,
+                top_predictions=top_preds[:5],  # Keep top 5
             )
-
-            start_sample = end_sample
+            for start, end, (situation, confidence, top_preds) in zip(starts.tolist(), ends.tolist(), results, strict=True)
+        ]
 
         # Determine overall situation by voting
         overall_situation = self._determine_overall_situation(segments)
 
-        logger.info(f"Situation classification complete: {len(segments)} segments, " f"overall={overall_situation}")
+        logger.info("Situation classification complete: %s segments (%s silent), overall=%s", len(segments), skipped, overall_situation)
 
         return segments, overall_situation
 
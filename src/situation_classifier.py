@@ -4,11 +4,14 @@ Vertex AI AutoML situation classifier for the Media Intelligence Pipeline.
 
 import logging
 import os
+import random
 import tempfile
-from collections import Counter
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from google.api_core import exceptions
 from google.cloud import aiplatform
 from tenacity import (
@@ -18,6 +21,11 @@ from tenacity import (
     wait_exponential,
 )
 
+from .gcp_utils import duration_cache, get_audio_duration, get_file_extension, get_header_duration
+
+if TYPE_CHECKING:
+    from .storage_manager import StorageManager
+
 logger = logging.getLogger(__name__)
 
 # Default situation labels
@@ -32,8 +40,17 @@ SITUATION_LABELS = [
     "quiet",
 ]
 
+# Segments sent to the endpoint per predict request
+DEFAULT_MAX_BATCH_SIZE = 64
+
+# Predict requests in flight at once for one audio file
+DEFAULT_MAX_WORKERS = 16
+
+# Bytes fetched from the start of a file to read its duration from the header
+_HEADER_PROBE_BYTES = 64 * 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class SituationPrediction:
     """A prediction for a segment of audio."""
 
@@ -54,7 +71,7 @@ class SituationPrediction:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SituationResult:
     """Result of situation classification."""
 
@@ -87,6 +104,8 @@ class SituationClassifier:
         endpoint_id: str | None = None,
         location: str = "us-central1",
         labels: list[str] | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         """
         Initialize the Situation Classifier.
@@ -96,11 +115,16 @@ class SituationClassifier:
             endpoint_id: Vertex AI endpoint ID. If None, uses VERTEX_AI_ENDPOINT_ID env var.
             location: GCP location for Vertex AI.
             labels: List of situation labels. If None, uses defaults.
+            max_batch_size: Maximum segments sent in one predict request.
+                Use 1 for endpoints that accept a single instance.
+            max_workers: Maximum predict requests sent concurrently.
         """
         self.project_id = project_id or os.getenv("PROJECT_ID")
         self.endpoint_id = endpoint_id or os.getenv("VERTEX_AI_ENDPOINT_ID")
         self.location = location or os.getenv("VERTEX_AI_LOCATION", "us-central1")
         self.labels = labels or SITUATION_LABELS
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_workers = max(1, max_workers)
 
         self._endpoint = None
         self._initialized = False
@@ -148,33 +172,27 @@ class SituationClassifier:
         Returns:
             SituationResult with predictions for each segment.
         """
-        logger.info(f"Classifying situations in {gcs_uri}")
+        logger.info("Classifying situations in %s", gcs_uri)
 
         # If no endpoint is configured, use mock classification
         if not self.endpoint_id:
             logger.warning("No Vertex AI endpoint configured, using mock classification")
             return self._mock_classify(gcs_uri, segment_duration, total_duration)
 
-        predictions = []
-
         # Calculate number of segments
         if total_duration is None:
             total_duration = self._get_audio_duration(gcs_uri, storage_manager)
 
         num_segments = max(1, int(total_duration / segment_duration))
+        segments = [(i * segment_duration, min((i + 1) * segment_duration, total_duration)) for i in range(num_segments)]
 
-        for i in range(num_segments):
-            start_time = i * segment_duration
-            end_time = min((i + 1) * segment_duration, total_duration)
-
-            # Get prediction from Vertex AI
-            prediction = self._predict_segment(gcs_uri, start_time, end_time)
-            predictions.append(prediction)
+        # Get predictions from Vertex AI, several segments per request
+        predictions = self._predict_segments(gcs_uri, segments)
 
         # Calculate overall situation
         overall_situation, overall_confidence = self._aggregate_predictions(predictions)
 
-        logger.info(f"Classification complete: {len(predictions)} segments, " f"overall situation: {overall_situation} ({overall_confidence:.2f})")
+        logger.info("Classification complete: %s segments, overall situation: %s (%.2f)", len(predictions), overall_situation, overall_confidence)
 
         return SituationResult(
             predictions=predictions,
@@ -200,20 +218,70 @@ class SituationClassifier:
         Returns:
             SituationPrediction for the segment.
         """
-        try:
-            # Prepare instance for prediction
-            instance = {
-                "gcs_uri": gcs_uri,
-                "start_time": start_time,
-                "end_time": end_time,
-            }
+        return self._predict_segments(gcs_uri, [(start_time, end_time)])[0]
+
+    def _predict_segments(
+        self,
+        gcs_uri: str,
+        segments: list[tuple[float, float]],
+    ) -> list[SituationPrediction]:
+        """
+        Get predictions for audio segments, up to max_batch_size per request.
+
+        Requests are sent concurrently on up to max_workers threads, so their
+        round trips overlap. A request that fails yields "unknown" predictions
+        for its segments only; the other requests are unaffected.
+
+        Args:
+            gcs_uri: GCS URI of the audio file.
+            segments: (start_time, end_time) of each segment.
+
+        Returns:
+            SituationPrediction for each segment, in order.
+        """
+        chunks = [segments[offset : offset + self.max_batch_size] for offset in range(0, len(segments), self.max_batch_size)]
+
+        if len(chunks) <= 1 or self.max_workers == 1:
+            results = [self._predict_chunk(gcs_uri, chunk) for chunk in chunks]
+        else:
+            _ = self.endpoint  # Create the endpoint before the worker threads share it
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+                results = list(executor.map(lambda chunk: self._predict_chunk(gcs_uri, chunk), chunks))
+
+        return [prediction for chunk_predictions in results for prediction in chunk_predictions]
+
+    def _predict_chunk(
+        self,
+        gcs_uri: str,
+        chunk: list[tuple[float, float]],
+    ) -> list[SituationPrediction]:
+        """Get predictions for segments sent in one predict request."""
+        instances = [{"gcs_uri": gcs_uri, "start_time": start_time, "end_time": end_time} for start_time, end_time in chunk]
 
+        try:
             # Call Vertex AI endpoint
-            response = self.endpoint.predict(instances=[instance])
+            response = self._predict(instances)
+            if len(response.predictions) != len(chunk):
+                raise ValueError(f"expected {len(chunk)} predictions, got {len(response.predictions)}")
+        except Exception as e:
+            logger.warning("Prediction failed for segments %s-%s: %s", chunk[0][0], chunk[-1][1], e)
+            return [SituationPrediction(situation="unknown", confidence=0.0, start_time=start, end_time=end) for start, end in chunk]
 
-            # Parse prediction
-            prediction = response.predictions[0]
+        return [self._parse_prediction(prediction, start, end) for prediction, (start, end) in zip(response.predictions, chunk, strict=True)]
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((exceptions.ServiceUnavailable, exceptions.TooManyRequests)),
+        reraise=True,
+    )
+    def _predict(self, instances: list[dict[str, Any]]):
+        """Send one predict request, retrying when the endpoint is overloaded."""
+        return self.endpoint.predict(instances=instances)
 
+    def _parse_prediction(self, prediction: Any, start_time: float, end_time: float) -> SituationPrediction:
+        """Build a SituationPrediction from one entry of an endpoint response."""
+        try:
             # Handle different response formats
             if isinstance(prediction, dict):
                 scores = prediction.get("confidences", prediction.get("scores", {}))
@@ -239,7 +307,7 @@ class SituationClassifier:
             )
 
         except Exception as e:
-            logger.warning(f"Prediction failed for segment {start_time}-{end_time}: {e}")
+            logger.warning("Prediction failed for segment %s-%s: %s", start_time, end_time, e)
             return SituationPrediction(
                 situation="unknown",
                 confidence=0.0,
@@ -271,13 +339,9 @@ class SituationClassifier:
         predictions = []
         num_segments = max(1, int(total_duration / segment_duration))
 
-        # Generate mock predictions with seeded random for deterministic tests
-        import hashlib
-        import random
-
-        # Seed based on GCS URI for deterministic results in tests
-        seed = int(hashlib.md5(gcs_uri.encode()).hexdigest()[:8], 16)
-        rng = random.Random(seed)
+        # Seed based on GCS URI for deterministic results in tests; the seed
+        # only needs to be stable, not cryptographic
+        rng = random.Random(zlib.crc32(gcs_uri.encode()))
 
         for i in range(num_segments):
             start_time = i * segment_duration
@@ -324,22 +388,21 @@ class SituationClassifier:
         if not predictions:
             return "unknown", 0.0
 
-        # Weighted voting
-        weighted_counts: Counter[str] = Counter()
-
-        for pred in predictions:
-            # Weight by confidence
-            weighted_counts[pred.situation] += pred.confidence
+        # Weighted voting: code situations in first-seen order so ties go to
+        # the earliest one, then sum confidences per code in one pass
+        index: dict[str, int] = {}
+        codes = np.fromiter((index.setdefault(p.situation, len(index)) for p in predictions), dtype=np.intp, count=len(predictions))
+        confidences = np.fromiter((p.confidence for p in predictions), dtype=np.float64, count=len(predictions))
+        weighted_counts = np.bincount(codes, weights=confidences)
 
-        if not weighted_counts:
+        total_weight = weighted_counts.sum()
+        if total_weight <= 0:
             return "unknown", 0.0
 
-        # Get top situation
-        overall_situation = weighted_counts.most_common(1)[0][0]
-
-        # Calculate confidence as weighted average
-        total_weight = sum(weighted_counts.values())
-        overall_confidence = weighted_counts[overall_situation] / total_weight
+        # Get top situation and its share of the total weight
+        top = int(weighted_counts.argmax())
+        overall_situation = list(index)[top]
+        overall_confidence = float(weighted_counts[top] / total_weight)
 
         return overall_situation, overall_confidence
 
@@ -351,6 +414,11 @@ class SituationClassifier:
         """
         Get duration of audio file.
 
+        The duration is read from the file header where possible; the whole
+        file is only downloaded for containers without one. Results are
+        shared with the pipeline's duration cache, keyed by URI and object
+        generation, so re-classifying an unchanged file does not probe it again.
+
         Args:
             gcs_uri: GCS URI of the audio file.
             storage_manager: Optional StorageManager for downloading.
@@ -363,19 +431,50 @@ class SituationClassifier:
 
             storage_manager = StorageManager()
 
+        try:
+            generation = storage_manager.get_file_metadata(gcs_uri).get("generation")
+        except Exception as e:
+            logger.debug("No metadata for %s: %s", gcs_uri, e)
+            generation = None
+
+        duration = duration_cache.get(gcs_uri, generation)
+        if duration is not None:
+            return duration
+
+        duration = self._probe_audio_duration(gcs_uri, storage_manager)
+        if duration is None:
+            # Fallback: assume 60 seconds, and probe again next time
+            logger.warning("Could not determine duration for %s, assuming 60s", gcs_uri)
+            return 60.0
+
+        duration_cache.put(gcs_uri, generation, duration)
+
+        return duration
+
+    def _probe_audio_duration(
+        self,
+        gcs_uri: str,
+        storage_manager: "StorageManager",
+    ) -> float | None:
+        """Read the duration of an audio file from GCS, or None if it cannot be determined."""
+        # WAV and FLAC record their length up front, so a ranged read of the
+        # header avoids downloading the whole file
+        try:
+            header = storage_manager.download_range(gcs_uri, 0, _HEADER_PROBE_BYTES - 1)
+            duration = get_header_duration(header, get_file_extension(gcs_uri))
+            if duration is not None:
+                return duration
+        except Exception as e:
+            logger.debug("Header duration probe failed for %s: %s", gcs_uri, e)
+
         # Download file temporarily
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=True) as tmp:
+        with tempfile.NamedTemporaryFile(suffix=f".{get_file_extension(gcs_uri) or 'wav'}", delete=True) as tmp:
             local_path = storage_manager.download_file(gcs_uri, tmp.name)
 
             try:
-                import librosa
-
-                duration = librosa.get_duration(filename=local_path)
-                return duration
+                return get_audio_duration(local_path)
             except Exception:
-                # Fallback: assume 60 seconds
-                logger.warning(f"Could not determine duration for {gcs_uri}, assuming 60s")
-                return 60.0
+                return None
 
 
 class MockSituationClassifier(SituationClassifier):
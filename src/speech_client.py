@@ -2,11 +2,14 @@
 Google Cloud Speech-to-Text V2 client for the Media Intelligence Pipeline.
 """
 
+import json
 import logging
 import os
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, TextIO
 
+import numpy as np
 from google.api_core import exceptions
 from google.cloud.speech_v2 import SpeechClient as GoogleSpeechClient
 from google.cloud.speech_v2.types import cloud_speech
@@ -17,10 +20,144 @@ from tenacity import (
     wait_exponential,
 )
 
+if TYPE_CHECKING:
+    from .storage_manager import StorageManager
+
 logger = logging.getLogger(__name__)
 
+# BatchRecognize accepts at most this many files per request
+MAX_BATCH_FILES = 15
+
+# Characters read at a time when streaming results written to GCS
+_RESULTS_READ_CHARS = 1024 * 1024
+
+
+class _JsonStreamReader:
+    """
+    Incremental reader for the top level of a large JSON object.
+
+    Values are decoded one at a time from a buffer refilled in chunks, so
+    memory is bounded by the largest single value rather than the document.
+    """
+
+    def __init__(self, fp: TextIO, chunk_chars: int = _RESULTS_READ_CHARS):
+        self._fp = fp
+        self._chunk_chars = chunk_chars
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def iter_array(self, key: str) -> Iterator[Any]:
+        """Yield the items of the array stored under key, skipping other members."""
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            name = self._value()
+            self._expect(":")
+            if name == key and self._peek() == "[":
+                self._pos += 1
+                if self._peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(",]") == "]":
+                            break
+            else:
+                self._value()
+            if self._expect(",}") == "}":
+                return
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping consumed text; False at end of input."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(self._chunk_chars)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it ("" at end)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\n\r":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        """Consume and return the next character, which must be one of chars."""
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError(f"Malformed JSON: expected one of {chars!r}, found {char!r}")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decode the next value, reading more input until it is complete."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number ending the buffer may continue in the next chunk
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+@dataclass(slots=True)
+class WordColumns:
+    """Word-level timings of one segment, stored as parallel arrays."""
+
+    texts: list[str]  # Word text
+    starts: np.ndarray  # float64 start times in seconds
+    ends: np.ndarray  # float64 end times in seconds
+    confidences: np.ndarray  # float64 confidences, 0.0-1.0
+    speakers: np.ndarray  # object array of speaker tags (int or None)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WordColumns):
+            return NotImplemented
+        return (
+            self.texts == other.texts
+            and np.array_equal(self.starts, other.starts)
+            and np.array_equal(self.ends, other.ends)
+            and np.array_equal(self.confidences, other.confidences)
+            and np.array_equal(self.speakers, other.speakers)
+        )
 
-@dataclass
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Convert to the list-of-dicts layout used in JSON output."""
+        return [
+            {
+                "word": text,
+                "start_time": start,
+                "end_time": end,
+                "confidence": confidence,
+                "speaker_tag": speaker,
+            }
+            for text, start, end, confidence, speaker in zip(
+                self.texts, self.starts.tolist(), self.ends.tolist(), self.confidences.tolist(), self.speakers.tolist(), strict=True
+            )
+        ]
+
+
+@dataclass(slots=True)
 class TranscriptSegment:
     """A segment of transcribed audio."""
 
@@ -30,7 +167,12 @@ class TranscriptSegment:
     speaker_tag: int | None = None  # Speaker ID (0-5)
     confidence: float = 0.0  # 0.0-1.0
     language_code: str = "en-US"  # Auto-detected or specified
-    words: list[dict[str, Any]] = field(default_factory=list)
+    word_columns: WordColumns | None = field(default=None, repr=False)
+
+    @property
+    def words(self) -> list[dict[str, Any]]:
+        """Word-level timings as per-word dictionaries."""
+        return self.word_columns.to_dicts() if self.word_columns is not None else []
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -46,6 +188,33 @@ class TranscriptSegment:
 
 
 @dataclass
+class SegmentColumns:
+    """Columnar view of transcript segments for vectorized consumers."""
+
+    starts: np.ndarray  # float64 start times in seconds
+    ends: np.ndarray  # float64 end times in seconds
+    speakers: np.ndarray  # object array of speaker tags (int or None)
+    texts: np.ndarray  # object array of segment text
+
+    @classmethod
+    def from_segments(cls, segments: list[TranscriptSegment]) -> "SegmentColumns":
+        """Build columns from segments in a single pass."""
+        n = len(segments)
+        starts = np.empty(n, dtype=np.float64)
+        ends = np.empty(n, dtype=np.float64)
+        speakers = np.empty(n, dtype=object)
+        texts = np.empty(n, dtype=object)
+
+        for i, segment in enumerate(segments):
+            starts[i] = segment.start_time
+            ends[i] = segment.end_time
+            speakers[i] = segment.speaker_tag
+            texts[i] = segment.text
+
+        return cls(starts=starts, ends=ends, speakers=speakers, texts=texts)
+
+
+@dataclass(slots=True)
 class TranscriptionResult:
     """Result of audio transcription."""
 
@@ -55,6 +224,12 @@ class TranscriptionResult:
     language_code: str
     model_used: str
     raw_response: Any | None = None
+    # Built from segments on construction when not supplied
+    columns: SegmentColumns | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.columns is None:
+            self.columns = SegmentColumns.from_segments(self.segments)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -76,17 +251,22 @@ class TranscriptionResult:
         Returns:
             Full transcript text.
         """
-        lines = []
+        parts: list[str] = []
         current_speaker = None
 
+        # Each speaker turn starts a new line; segments within a turn are
+        # separated by single spaces, so no trailing whitespace needs stripping
         for segment in self.segments:
-            if include_speakers and segment.speaker_tag is not None:
-                if segment.speaker_tag != current_speaker:
-                    current_speaker = segment.speaker_tag
-                    lines.append(f"\n[Speaker {current_speaker + 1}]")
-            lines.append(segment.text)
+            if include_speakers and segment.speaker_tag is not None and segment.speaker_tag != current_speaker:
+                current_speaker = segment.speaker_tag
+                if parts:
+                    parts.append("\n")
+                parts.append(f"[Speaker {current_speaker + 1}] ")
+            elif parts:
+                parts.append(" ")
+            parts.append(segment.text)
 
-        return " ".join(lines).strip()
+        return "".join(parts)
 
 
 class SpeechClient:
@@ -175,11 +355,6 @@ class SpeechClient:
 
         return config
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((exceptions.ServiceUnavailable, exceptions.TooManyRequests)),
-    )
     def transcribe_gcs(
         self,
         gcs_uri: str,
@@ -188,6 +363,8 @@ class SpeechClient:
         enable_diarization: bool = True,
         min_speaker_count: int = 2,
         max_speaker_count: int = 6,
+        output_gcs_prefix: str | None = None,
+        storage_manager: "StorageManager | None" = None,
         **kwargs: Any,
     ) -> TranscriptionResult:
         """
@@ -200,15 +377,69 @@ class SpeechClient:
             enable_diarization: Whether to enable speaker diarization.
             min_speaker_count: Minimum number of speakers.
             max_speaker_count: Maximum number of speakers.
+            output_gcs_prefix: If set, write results under this GCS prefix
+                instead of returning them inline with the operation.
+            storage_manager: Optional StorageManager for reading GCS results.
             **kwargs: Additional configuration options.
 
         Returns:
             TranscriptionResult with segments and metadata.
         """
-        logger.info(f"Starting transcription for {gcs_uri}")
-        logger.info(f"Model: {model}, Language: {language_code}, Diarization: {enable_diarization}")
+        return self.transcribe_gcs_batch(
+            [gcs_uri],
+            language_code=language_code,
+            model=model,
+            enable_diarization=enable_diarization,
+            min_speaker_count=min_speaker_count,
+            max_speaker_count=max_speaker_count,
+            output_gcs_prefix=output_gcs_prefix,
+            storage_manager=storage_manager,
+            **kwargs,
+        )[0]
+
+    def transcribe_gcs_batch(
+        self,
+        gcs_uris: list[str],
+        language_code: str = "en-US",
+        model: str = "long",
+        enable_diarization: bool = True,
+        min_speaker_count: int = 2,
+        max_speaker_count: int = 6,
+        output_gcs_prefix: str | None = None,
+        storage_manager: "StorageManager | None" = None,
+        **kwargs: Any,
+    ) -> list[TranscriptionResult]:
+        """
+        Transcribe several audio files from Google Cloud Storage.
+
+        Files are packed into BatchRecognize requests of up to
+        MAX_BATCH_FILES URIs each, so many files share one long-running
+        operation instead of paying for one apiece.
+
+        With output_gcs_prefix set, the service writes each file's results to
+        GCS instead of the operation response. They are streamed back one
+        result at a time and the objects deleted afterwards, so memory stays
+        bounded however long the audio is.
+
+        Args:
+            gcs_uris: GCS URIs of the audio files.
+            language_code: Language code for transcription.
+            model: Model to use (long, short, telephony, video).
+            enable_diarization: Whether to enable speaker diarization.
+            min_speaker_count: Minimum number of speakers.
+            max_speaker_count: Maximum number of speakers.
+            output_gcs_prefix: If set, write results under this GCS prefix
+                instead of returning them inline with the operation.
+            storage_manager: Optional StorageManager for reading GCS results.
+            **kwargs: Additional configuration options.
+
+        Returns:
+            One TranscriptionResult per URI, in input order.
+        """
+        logger.info("Starting transcription for %s file(s)", len(gcs_uris))
+        logger.info("Model: %s, Language: %s, Diarization: %s", model, language_code, enable_diarization)
 
-        # Build configuration
+        # Build configuration once for every request
         config = self._build_config(
             language_code=language_code,
             model=model,
@@ -218,32 +449,96 @@ class SpeechClient:
             **kwargs,
         )
 
-        # Build request
+        if output_gcs_prefix and storage_manager is None:
+            from .storage_manager import StorageManager
+
+            storage_manager = StorageManager()
+
+        results: list[TranscriptionResult] = []
+        for i in range(0, len(gcs_uris), MAX_BATCH_FILES):
+            chunk = gcs_uris[i : i + MAX_BATCH_FILES]
+            response = self._batch_recognize(config, chunk, output_gcs_prefix)
+
+            # Demultiplex per-file results
+            for uri in chunk:
+                results.append(self._parse_batch_response(response, uri, model, language_code, enable_diarization, storage_manager if output_gcs_prefix else None))
+
+        return results
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((exceptions.ServiceUnavailable, exceptions.TooManyRequests)),
+    )
+    def _batch_recognize(
+        self,
+        config: cloud_speech.RecognitionConfig,
+        gcs_uris: list[str],
+        output_gcs_prefix: str | None = None,
+    ) -> cloud_speech.BatchRecognizeResponse:
+        """
+        Run one BatchRecognize operation over a group of files.
+
+        Args:
+            config: Recognition configuration.
+            gcs_uris: GCS URIs to transcribe (at most MAX_BATCH_FILES).
+            output_gcs_prefix: GCS prefix for results; inline if None.
+
+        Returns:
+            The batch recognition response.
+        """
+        if output_gcs_prefix:
+            output_config = cloud_speech.RecognitionOutputConfig(
+                gcs_output_config=cloud_speech.GcsOutputConfig(uri=output_gcs_prefix),
+            )
+        else:
+            output_config = cloud_speech.RecognitionOutputConfig(
+                inline_response_config=cloud_speech.InlineOutputConfig(),
+            )
+
         request = cloud_speech.BatchRecognizeRequest(
             recognizer=self._get_recognizer_path(),
             config=config,
-            files=[
-                cloud_speech.BatchRecognizeFileMetadata(uri=gcs_uri),
-            ],
-            recognition_output_config=cloud_speech.RecognitionOutputConfig(
-                inline_response_config=cloud_speech.InlineOutputConfig(),
-            ),
+            files=[cloud_speech.BatchRecognizeFileMetadata(uri=uri) for uri in gcs_uris],
+            recognition_output_config=output_config,
         )
 
         # Execute batch recognition (long-running operation)
         operation = self.client.batch_recognize(request=request)
         logger.info("Waiting for transcription operation to complete...")
 
-        response = operation.result(timeout=3600)  # 1 hour timeout
+        return operation.result(timeout=3600)  # 1 hour timeout
 
-        # Parse results
-        return self._parse_batch_response(
-            response,
-            gcs_uri,
-            model,
-            language_code,
-            enable_diarization,
-        )
+    def _read_gcs_results(
+        self,
+        file_results: cloud_speech.BatchRecognizeFileResult,
+        storage_manager: "StorageManager",
+    ) -> Iterator[cloud_speech.SpeechRecognitionResult]:
+        """
+        Stream one file's recognition results from the JSON the service wrote to GCS.
+
+        Results are decoded one at a time as the object is read, and the
+        object is deleted once all of them have been consumed.
+
+        Args:
+            file_results: Per-file entry of the batch response.
+            storage_manager: StorageManager for reading the results object.
+
+        Yields:
+            Recognition results for the file.
+        """
+        result_uri = file_results.cloud_storage_result.uri or file_results.uri
+        if not result_uri:
+            return
+
+        with storage_manager.open_text(result_uri) as fp:
+            for item in _JsonStreamReader(fp).iter_array("results"):
+                yield cloud_speech.SpeechRecognitionResult.from_json(json.dumps(item), ignore_unknown_fields=True)
+
+        try:
+            storage_manager.delete_file(result_uri)
+        except Exception as e:
+            logger.warning("Failed to delete transcription results %s: %s", result_uri, e)
 
     def _parse_batch_response(
         self,
@@ -252,6 +547,7 @@ class SpeechClient:
         model: str,
         language_code: str,
         enable_diarization: bool,
+        storage_manager: "StorageManager | None" = None,
     ) -> TranscriptionResult:
         """
         Parse batch recognition response into TranscriptionResult.
@@ -262,6 +558,8 @@ class SpeechClient:
             model: Model used.
             language_code: Language code used.
             enable_diarization: Whether diarization was enabled.
+            storage_manager: StorageManager to read results written to GCS;
+                None when results are inline.
 
         Returns:
             TranscriptionResult object.
@@ -274,7 +572,7 @@ class SpeechClient:
         file_results = response.results.get(gcs_uri)
 
         if file_results is None:
-            logger.warning(f"No results found for {gcs_uri}")
+            logger.warning("No results found for %s", gcs_uri)
             return TranscriptionResult(
                 segments=[],
                 speaker_count=0,
@@ -284,31 +582,28 @@ class SpeechClient:
                 raw_response=response,
             )
 
-        transcript = file_results.transcript
+        if storage_manager is not None:
+            recognition_results = self._read_gcs_results(file_results, storage_manager)
+        else:
+            recognition_results = file_results.transcript.results
 
-        for result in transcript.results:
+        for result in recognition_results:
             if not result.alternatives:
                 continue
 
             alternative = result.alternatives[0]
 
-            # Extract word-level information with speaker tags
-            words_data = []
+            # Extract word-level information with speaker tags into
+            # preallocated columns
+            n_words = len(alternative.words)
+            word_texts: list[str] = []
+            word_starts = np.empty(n_words, dtype=np.float64)
+            word_ends = np.empty(n_words, dtype=np.float64)
+            word_confidences = np.empty(n_words, dtype=np.float64)
+            word_speakers = np.empty(n_words, dtype=object)
             segment_speaker_tag = None
-            segment_start = None
-            segment_end = None
-
-            for word_info in alternative.words:
-                word_start = word_info.start_offset.total_seconds()
-                word_end = word_info.end_offset.total_seconds()
-
-                if segment_start is None:
-                    segment_start = word_start
-                segment_end = word_end
-
-                if word_end > total_duration:
-                    total_duration = word_end
 
+            for i, word_info in enumerate(alternative.words):
                 # Get speaker tag if available
                 if enable_diarization and word_info.speaker_label:
                     try:
@@ -319,15 +614,18 @@ class SpeechClient:
                     except ValueError:
                         pass
 
-                words_data.append(
-                    {
-                        "word": word_info.word,
-                        "start_time": word_start,
-                        "end_time": word_end,
-                        "confidence": word_info.confidence,
-                        "speaker_tag": segment_speaker_tag,
-                    }
-                )
+                word_texts.append(word_info.word)
+                word_starts[i] = word_info.start_offset.total_seconds()
+                word_ends[i] = word_info.end_offset.total_seconds()
+                word_confidences[i] = word_info.confidence
+                word_speakers[i] = segment_speaker_tag
+
+            if n_words:
+                segment_start = float(word_starts[0])
+                segment_end = float(word_ends[-1])
+                total_duration = max(total_duration, float(word_ends.max()))
+            else:
+                segment_start = segment_end = None
 
             # Create segment
             segment = TranscriptSegment(
@@ -337,7 +635,13 @@ class SpeechClient:
                 speaker_tag=segment_speaker_tag,
                 confidence=alternative.confidence,
                 language_code=result.language_code or language_code,
-                words=words_data,
+                word_columns=WordColumns(
+                    texts=word_texts,
+                    starts=word_starts,
+                    ends=word_ends,
+                    confidences=word_confidences,
+                    speakers=word_speakers,
+                ),
             )
 
             if segment.text:
@@ -346,7 +650,7 @@ class SpeechClient:
         # Calculate speaker count
         speaker_count = len(speaker_tags_seen) if speaker_tags_seen else 0
 
-        logger.info(f"Transcription complete: {len(segments)} segments, " f"{speaker_count} speakers, {total_duration:.1f}s duration")
+        logger.info("Transcription complete: %s segments, %s speakers, %.1fs duration", len(segments), speaker_count, total_duration)
 
         return TranscriptionResult(
             segments=segments,
@@ -9,16 +9,30 @@ import tempfile
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from google.cloud import storage
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from .gcp_utils import generate_file_id, parse_gcs_uri
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps_json(data: Any) -> bytes | str:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        # Datetimes pass through to default=str so output matches the stdlib path
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(data, default=str, option=options)
+    return json.dumps(data, indent=2, default=str)
+
+
 class StorageManager:
     """Manager for Google Cloud Storage operations."""
 
@@ -81,7 +95,7 @@ class StorageManager:
         bucket = self.client.bucket(bucket_name)
         blob = bucket.blob(blob_path)
 
-        logger.info(f"Downloading {gcs_uri} to {local_path}")
+        logger.info("Downloading %s to %s", gcs_uri, local_path)
         blob.download_to_filename(local_path)
 
         return local_path
@@ -110,9 +124,9 @@ class StorageManager:
             try:
                 if os.path.exists(local_path):
                     os.remove(local_path)
-                    logger.debug(f"Cleaned up temp file: {local_path}")
+                    logger.debug("Cleaned up temp file: %s", local_path)
             except OSError as e:
-                logger.warning(f"Failed to clean up temp file {local_path}: {e}")
+                logger.warning("Failed to clean up temp file %s: %s", local_path, e)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -147,7 +161,7 @@ class StorageManager:
         bucket = self.client.bucket(bucket_name)
         blob = bucket.blob(blob_path)
 
-        logger.info(f"Uploading {local_path} to gs://{bucket_name}/{blob_path}")
+        logger.info("Uploading %s to gs://%s/%s", local_path, bucket_name, blob_path)
         blob.upload_from_filename(local_path, content_type=content_type)
 
         return f"gs://{bucket_name}/{blob_path}"
@@ -184,10 +198,10 @@ class StorageManager:
         bucket = self.client.bucket(bucket_name)
         blob = bucket.blob(blob_path)
 
-        json_str = json.dumps(data, indent=2, default=str)
+        payload = _dumps_json(data)
 
-        logger.info(f"Uploading JSON to gs://{bucket_name}/{blob_path}")
-        blob.upload_from_string(json_str, content_type="application/json")
+        logger.info("Uploading JSON to gs://%s/%s", bucket_name, blob_path)
+        blob.upload_from_string(payload, content_type="application/json")
 
         return f"gs://{bucket_name}/{blob_path}"
 
@@ -223,7 +237,7 @@ class StorageManager:
         bucket = self.client.bucket(bucket_name)
         blob = bucket.blob(blob_path)
 
-        logger.info(f"Uploading text to gs://{bucket_name}/{blob_path}")
+        logger.info("Uploading text to gs://%s/%s", bucket_name, blob_path)
         blob.upload_from_string(text, content_type="text/plain")
 
         return f"gs://{bucket_name}/{blob_path}"
@@ -261,6 +275,23 @@ class StorageManager:
 
         return blob.download_as_string().decode("utf-8")
 
+    def open_text(self, gcs_uri: str, chunk_size: int = 1024 * 1024) -> TextIO:
+        """
+        Open a GCS object for streaming text reads.
+
+        Args:
+            gcs_uri: GCS URI (gs://bucket/path/to/file).
+            chunk_size: Bytes fetched from GCS per underlying request.
+
+        Returns:
+            Text file object; close it (or use it as a context manager) when done.
+        """
+        bucket_name, blob_path = parse_gcs_uri(gcs_uri)
+        bucket = self.client.bucket(bucket_name)
+        blob = bucket.blob(blob_path)
+
+        return blob.open("rt", chunk_size=chunk_size, encoding="utf-8")
+
     def file_exists(self, gcs_uri: str) -> bool:
         """
         Check if a file exists in GCS.
@@ -288,7 +319,7 @@ class StorageManager:
         bucket = self.client.bucket(bucket_name)
         blob = bucket.blob(blob_path)
 
-        logger.info(f"Deleting {gcs_uri}")
+        logger.info("Deleting %s", gcs_uri)
         blob.delete()
 
     def list_files(
@@ -339,9 +370,34 @@ class StorageManager:
             "created": blob.time_created.isoformat() if blob.time_created else None,
             "updated": blob.updated.isoformat() if blob.updated else None,
             "md5_hash": blob.md5_hash,
+            "generation": blob.generation,
+            "metadata": blob.metadata or {},
             "gcs_uri": gcs_uri,
         }
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((ConnectionError, TimeoutError)),
+    )
+    def download_range(self, gcs_uri: str, start: int, end: int) -> bytes:
+        """
+        Download a byte range of a file from GCS.
+
+        Args:
+            gcs_uri: GCS URI (gs://bucket/path/to/file).
+            start: First byte offset to read.
+            end: Last byte offset to read (inclusive).
+
+        Returns:
+            Contents of the requested range.
+        """
+        bucket_name, blob_path = parse_gcs_uri(gcs_uri)
+        bucket = self.client.bucket(bucket_name)
+        blob = bucket.blob(blob_path)
+
+        return blob.download_as_bytes(start=start, end=end)
+
     def copy_file(
         self,
         source_uri: str,
@@ -369,7 +425,7 @@ class StorageManager:
 
         dest_bucket_obj = self.client.bucket(dest_bucket)
 
-        logger.info(f"Copying {source_uri} to gs://{dest_bucket}/{dest_path}")
+        logger.info("Copying %s to gs://%s/%s", source_uri, dest_bucket, dest_path)
         source_bucket.copy_blob(source_blob, dest_bucket_obj, dest_path)
 
         return f"gs://{dest_bucket}/{dest_path}"
@@ -71,7 +71,7 @@ class Transcriber:
         """Load the faster-whisper model."""
         from faster_whisper import WhisperModel
 
-        logger.info(f"Loading Whisper model: {self.config.model_size} " f"(device={self.config.device}, compute_type={self.config.compute_type})")
+        logger.info("Loading Whisper model: %s (device=%s, compute_type=%s)", self.config.model_size, self.config.device, self.config.compute_type)
 
         self.model = WhisperModel(
             self.config.model_size,
@@ -120,7 +120,7 @@ class Transcriber:
         if language == "auto":
             language = None
 
-        logger.debug(f"Transcribing {len(audio)/sample_rate:.2f}s of audio " f"(language={language}, beam_size={beam_size})")
+        logger.debug("Transcribing %.2fs of audio (language=%s, beam_size=%s)", len(audio) / sample_rate, language, beam_size)
 
         # Run transcription
         segments_gen, info = self.model.transcribe(
@@ -134,6 +134,8 @@ class Transcriber:
 
         # Convert generator to list of segments
         segments = []
+        # Checked once rather than per segment; long files yield thousands of segments
+        log_segments = logger.isEnabledFor(logging.DEBUG)
         for seg in segments_gen:
             transcript_segment = TranscriptSegment(
                 start=seg.start,
@@ -142,7 +144,8 @@ class Transcriber:
                 confidence=seg.avg_logprob if hasattr(seg, "avg_logprob") else 0.0,
             )
             segments.append(transcript_segment)
-            logger.debug(f"Segment: [{seg.start:.2f}s-{seg.end:.2f}s] {seg.text.strip()}")
+            if log_segments:
+                logger.debug("Segment: [%.2fs-%.2fs] %s", seg.start, seg.end, transcript_segment.text)
 
         metadata = {
             "language": info.language,
@@ -150,7 +153,7 @@ class Transcriber:
             "duration": info.duration,
         }
 
-        logger.info(f"Transcription complete: {len(segments)} segments, " f"language={info.language} (prob={info.language_probability:.2f})")
+        logger.info("Transcription complete: %s segments, language=%s (prob=%.2f)", len(segments), info.language, info.language_probability)
 
         return segments, metadata
 
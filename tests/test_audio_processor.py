@@ -8,6 +8,9 @@ Tests for the AudioProcessor class (GCP deployment).
 Uses pytest-mock for clean, readable mocking.
 """
 
+import os
+from pathlib import Path
+
 
 class TestAudioProcessor:
     """Tests for the GCP AudioProcessor class."""
@@ -55,6 +58,29 @@ class TestAudioProcessor:
 
         assert processor.config == custom_config
 
+    def test_resolve_params_applies_overrides(self, mocker):
+        """Test per-request overrides are resolved without mutating the loaded config."""
+        mocker.patch("src.audio_processor.StorageManager")
+        mocker.patch("src.audio_processor.SpeechClient")
+        mocker.patch("src.audio_processor.SituationClassifier")
+        mock_config = mocker.patch("src.audio_processor.load_config")
+
+        mock_config.return_value = {
+            "project_id": "test-project",
+            "speech": {"language_codes": ["en-US"], "model": "long", "diarization": {"min_speaker_count": 2}},
+        }
+
+        from src.audio_processor import AudioProcessor
+
+        processor = AudioProcessor()
+        params = processor._resolve_params({"language_code": "de-DE", "min_speakers": 3})
+
+        assert params.language_code == "de-DE"
+        assert params.min_speakers == 3
+        assert params.model == "long"
+        assert processor._resolve_params(None).language_code == "en-US"
+        assert processor.config["speech"]["diarization"] == {"min_speaker_count": 2}
+
     def test_process_file_unsupported_format(self, mocker):
         """Test processing rejects unsupported format."""
         mocker.patch("src.audio_processor.StorageManager")
@@ -151,6 +177,9 @@ class TestAudioProcessor:
         )
         mock_classifier_class.return_value = mock_classifier
 
+        from src.gcp_utils import duration_cache
+
+        duration_cache.clear()
         processor = AudioProcessor()
         result = processor.process_file(gcs_uri="gs://test-input/audio.wav", output_bucket="test-output")
 
@@ -159,6 +188,204 @@ class TestAudioProcessor:
         assert len(result.transcript_segments) == 1
         assert result.overall_situation == "meeting"
 
+    def test_process_batch_preserves_order(self, mocker):
+        """Test batch processing returns results in input order."""
+        mocker.patch("src.audio_processor.StorageManager")
+        mocker.patch("src.audio_processor.SpeechClient")
+        mocker.patch("src.audio_processor.SituationClassifier")
+        mock_config = mocker.patch("src.audio_processor.load_config")
+        mock_supported = mocker.patch("src.audio_processor.is_supported_format")
+
+        mock_config.return_value = {
+            "project_id": "test-project",
+            "input_bucket": "test-input",
+            "output_bucket": "test-output",
+            "supported_formats": [".wav"],
+        }
+        mock_supported.return_value = False
+
+        from src.audio_processor import AudioProcessor
+
+        processor = AudioProcessor()
+        uris = [f"gs://bucket/file{i}.txt" for i in range(6)]
+        results = processor.process_batch(uris, output_bucket="test-output", max_workers=3)
+
+        assert [r.gcs_input_uri for r in results] == uris
+        assert processor.process_batch([]) == []
+
+    def test_process_batch_prefetches_durations_from_headers(self, mocker):
+        """Test batch prefetch probes durations from headers without downloading files."""
+        import io
+        import wave
+
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(b"\x00\x00" * 16000 * 2)
+
+        mock_storage_class = mocker.patch("src.audio_processor.StorageManager")
+        mocker.patch("src.audio_processor.SpeechClient")
+        mocker.patch("src.audio_processor.SituationClassifier")
+        mocker.patch("src.audio_processor.load_config").return_value = {"project_id": "test-project"}
+
+        mock_storage = mock_storage_class.return_value
+        mock_storage.get_file_metadata.return_value = {"metadata": {}}
+        mock_storage.download_range.return_value = buf.getvalue()[:1024]
+
+        from src.audio_processor import AudioProcessor
+        from src.gcp_utils import duration_cache
+
+        duration_cache.clear()
+        processor = AudioProcessor()
+        processor.process_file = mocker.MagicMock(side_effect=lambda uri, *args: processor._get_duration(uri))
+
+        uris = [f"gs://bucket/file{i}.wav" for i in range(5)]
+        assert processor.process_batch(uris, max_workers=2) == [2.0] * 5
+        assert mock_storage.download_range.call_count == 5
+        mock_storage.download_file.assert_not_called()
+
+    def test_transcribe_uses_configured_gcs_output(self, mocker):
+        """Test speech.output_gcs_prefix is passed through so results are written to GCS."""
+        mock_storage_class = mocker.patch("src.audio_processor.StorageManager")
+        mock_speech_class = mocker.patch("src.audio_processor.SpeechClient")
+        mocker.patch("src.audio_processor.SituationClassifier")
+        mocker.patch("src.audio_processor.load_config").return_value = {
+            "project_id": "test-project",
+            "speech": {"output_gcs_prefix": "gs://test-output/speech/"},
+        }
+
+        from src.audio_processor import AudioProcessor
+
+        processor = AudioProcessor()
+        processor._transcribe("gs://bucket/audio.wav", processor._resolve_params({}))
+
+        kwargs = mock_speech_class.return_value.transcribe_gcs.call_args.kwargs
+        assert kwargs["output_gcs_prefix"] == "gs://test-output/speech/"
+        assert kwargs["storage_manager"] is mock_storage_class.return_value
+
+    def test_get_duration_from_header_range(self, mocker):
+        """Test duration probe reads a WAV header from a ranged read and caches it."""
+        import io
+        import wave
+
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(b"\x00\x00" * 16000 * 3)
+
+        mock_storage_class = mocker.patch("src.audio_processor.StorageManager")
+        mocker.patch("src.audio_processor.SpeechClient")
+        mocker.patch("src.audio_processor.SituationClassifier")
+        mocker.patch("src.audio_processor.load_config").return_value = {"project_id": "test-project"}
+        mock_duration = mocker.patch("src.audio_processor.get_audio_duration")
+
+        mock_storage = mock_storage_class.return_value
+        mock_storage.get_file_metadata.return_value = {"metadata": {}}
+        mock_storage.download_range.return_value = buf.getvalue()[:1024]
+
+        from src.audio_processor import AudioProcessor
+        from src.gcp_utils import duration_cache
+
+        duration_cache.clear()
+        processor = AudioProcessor()
+
+        assert processor._get_duration("gs://bucket/header.wav") == 3.0
+        assert processor._get_duration("gs://bucket/header.wav") == 3.0
+        mock_storage.download_range.assert_called_once()
+        mock_storage.download_file.assert_not_called()
+        mock_duration.assert_not_called()
+
+    def test_get_duration_reprobes_new_generation(self, mocker):
+        """Test an overwritten object (new generation) is not served a stale cached duration."""
+        mock_storage_class = mocker.patch("src.audio_processor.StorageManager")
+        mocker.patch("src.audio_processor.SpeechClient")
+        mocker.patch("src.audio_processor.SituationClassifier")
+        mocker.patch("src.audio_processor.load_config").return_value = {"project_id": "test-project"}
+
+        from src.audio_processor import AudioProcessor
+        from src.gcp_utils import duration_cache
+
+        duration_cache.clear()
+        processor = AudioProcessor()
+        uri = "gs://bucket/audio.wav"
+
+        assert processor._get_duration(uri, metadata={"generation": 1, "metadata": {"duration": "10"}}) == 10.0
+        assert processor._get_duration(uri, metadata={"generation": 1, "metadata": {"duration": "99"}}) == 10.0
+        assert processor._get_duration(uri, metadata={"generation": 2, "metadata": {"duration": "20"}}) == 20.0
+        mock_storage_class.return_value.download_range.assert_not_called()
+
+    def test_get_duration_reuses_scratch_file(self, mocker):
+        """Test full-download probes reuse one scratch file and leave it empty."""
+        mock_storage_class = mocker.patch("src.audio_processor.StorageManager")
+        mocker.patch("src.audio_processor.SpeechClient")
+        mocker.patch("src.audio_processor.SituationClassifier")
+        mocker.patch("src.audio_processor.load_config").return_value = {"project_id": "test-project"}
+        mocker.patch("src.audio_processor.get_audio_duration").return_value = 5.0
+
+        def download(gcs_uri, local_path):
+            with open(local_path, "wb") as f:
+                f.write(b"audio")
+            return local_path
+
+        mock_storage = mock_storage_class.return_value
+        mock_storage.get_file_metadata.return_value = {"metadata": {}}
+        mock_storage.download_range.return_value = b""
+        mock_storage.download_file.side_effect = download
+
+        from src.audio_processor import AudioProcessor
+        from src.gcp_utils import duration_cache
+
+        duration_cache.clear()
+        processor = AudioProcessor()
+        processor._get_duration("gs://bucket/first.mp3")
+        processor._get_duration("gs://bucket/second.mp3")
+
+        first_path, second_path = (c.args[1] for c in mock_storage.download_file.call_args_list)
+        assert first_path == second_path
+        assert os.path.getsize(first_path) == 0
+
+    def test_get_duration_falls_back_to_disk_scratch(self, mocker, tmp_path):
+        """Test probe downloads skip or fall back from the in-memory scratch dir when it is too small."""
+        import errno
+
+        mock_storage_class = mocker.patch("src.audio_processor.StorageManager")
+        mocker.patch("src.audio_processor.SpeechClient")
+        mocker.patch("src.audio_processor.SituationClassifier")
+        mocker.patch("src.audio_processor.load_config").return_value = {"project_id": "test-project"}
+        mocker.patch("src.audio_processor.get_audio_duration").return_value = 5.0
+
+        shm_dir = tmp_path / "shm"
+        shm_dir.mkdir()
+
+        def download(gcs_uri, local_path):
+            if local_path.startswith(str(shm_dir)):
+                raise OSError(errno.ENOSPC, "No space left on device")
+            return local_path
+
+        mock_storage = mock_storage_class.return_value
+        mock_storage.download_range.return_value = b""
+        mock_storage.download_file.side_effect = download
+
+        from src.audio_processor import AudioProcessor
+        from src.gcp_utils import duration_cache
+
+        duration_cache.clear()
+        processor = AudioProcessor()
+        processor._shm_scratch_dir = shm_dir
+        mocker.patch.object(AudioProcessor, "_free_bytes", return_value=1000)
+
+        # Larger than half the free space: straight to disk
+        assert processor._get_duration("gs://bucket/big.mp3", metadata={"size": 600, "metadata": {}}) == 5.0
+        # Fits, but the write fails: retried on disk
+        assert processor._get_duration("gs://bucket/small.mp3", metadata={"size": 100, "metadata": {}}) == 5.0
+
+        paths = [c.args[1] for c in mock_storage.download_file.call_args_list]
+        assert [Path(p).parent for p in paths] == [processor._scratch_dir, shm_dir, processor._scratch_dir]
+
 
 class TestProcessingResult:
     """Tests for ProcessingResult dataclass."""
@@ -205,6 +432,33 @@ class TestProcessingResult:
         assert result_dict["overall_situation"] == "meeting"
         assert len(result_dict["transcript_segments"]) == 1
         assert result_dict["error"] is None
+        assert result.to_dict()["transcript_segments"] is result_dict["transcript_segments"]
+
+    def test_get_transcript_text(self):
+        """Test transcript text includes timestamps and speaker changes."""
+        from src.audio_processor import ProcessingResult
+        from src.speech_client import TranscriptSegment
+
+        result = ProcessingResult(
+            gcs_input_uri="gs://input/audio.wav",
+            gcs_output_uri="",
+            file_id="test_123",
+            duration=4000.0,
+            transcript_segments=[
+                TranscriptSegment(text="Hello", start_time=0.0, end_time=1.0, speaker_tag=0),
+                TranscriptSegment(text="again", start_time=61.5, end_time=62.0, speaker_tag=0),
+                TranscriptSegment(text="Hi", start_time=3725.25, end_time=3726.0, speaker_tag=1),
+            ],
+            situation_predictions=[],
+            speaker_count=2,
+            overall_situation="meeting",
+            overall_situation_confidence=0.8,
+            processing_time=5.0,
+            cost_estimate={},
+        )
+
+        assert result.get_transcript_text() == ("[00:00:00.000] Speaker 1: Hello\n[00:01:01.500] again\n[01:02:05.250] Speaker 2: Hi")
+        assert result.get_transcript_text(include_speakers=False, include_timestamps=False) == "Hello\nagain\nHi"
 
     def test_to_dict_with_error(self):
         """Test ProcessingResult to_dict with error."""
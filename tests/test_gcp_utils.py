@@ -0,0 +1,170 @@
+# Copyright (c) 2025 Harrold Holdings GmbH
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file in the project root for full license information.
+
+"""
+Tests for the GCP utility functions.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+
+class TestLoadConfig:
+    """Tests for configuration loading."""
+
+    def test_cached_config_returns_independent_copies(self, tmp_path):
+        """Test repeated loads reuse the parse but never share mutable state."""
+        from src.gcp_utils import load_config
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("speech:\n  model: long\n")
+
+        first = load_config(str(config_file))
+        first["speech"]["model"] = "changed"
+
+        assert load_config(str(config_file))["speech"]["model"] == "long"
+
+    def test_reloads_when_file_changes(self, tmp_path):
+        """Test an updated config file is parsed again."""
+        from src.gcp_utils import load_config
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("speech:\n  model: long\n")
+        load_config(str(config_file))
+
+        config_file.write_text("speech:\n  model: short\n")
+        stat = config_file.stat()
+        os.utime(config_file, (stat.st_atime, stat.st_mtime + 10))
+
+        assert load_config(str(config_file))["speech"]["model"] == "short"
+
+    def test_environment_overrides(self, tmp_path):
+        """Test environment variables override file values on every call."""
+        from src.gcp_utils import load_config
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("project_id: from-file\n")
+
+        with patch.dict(os.environ, {"PROJECT_ID": "from-env"}):
+            assert load_config(str(config_file))["project_id"] == "from-env"
+
+
+class TestFormatTimestamp:
+    """Tests for timestamp formatting."""
+
+    def test_format_timestamp(self):
+        """Test seconds are rendered as HH:MM:SS.mmm."""
+        from src.gcp_utils import format_timestamp
+
+        assert format_timestamp(0.0) == "00:00:00.000"
+        assert format_timestamp(3661.5) == "01:01:01.500"
+
+    def test_vectorized_matches_scalar(self):
+        """Test the array formatter agrees with the scalar one."""
+        import numpy as np
+
+        from src.gcp_utils import format_timestamp, format_timestamps
+
+        values = [0.0, 59.9994, 59.9996, 3599.9999, 3600.0, 86399.25, 123456.789]
+        assert format_timestamps(np.array(values)) == [format_timestamp(v) for v in values]
+
+
+class TestFormatHelpers:
+    """Tests for file format and label helpers."""
+
+    def test_is_supported_format(self):
+        """Test default and explicit format checks."""
+        from src.gcp_utils import is_supported_format
+
+        assert is_supported_format("gs://bucket/path/audio.WAV")
+        assert not is_supported_format("gs://bucket/path/notes.txt")
+        assert is_supported_format("clip.mp3", ("mp3",))
+        assert not is_supported_format("clip.wav", ["mp3"])
+
+    def test_get_situation_color(self):
+        """Test label colors are case-insensitive with a white fallback."""
+        from src.gcp_utils import get_situation_color
+
+        assert get_situation_color("Airplane") == "blue"
+        assert get_situation_color("unknown") == "white"
+
+    def test_get_file_extension(self):
+        """Test extensions are taken from the final path component only."""
+        from src.gcp_utils import get_file_extension
+
+        assert get_file_extension("gs://bucket/dir.v2/audio.FLAC") == "flac"
+        assert get_file_extension("/tmp/archive.tar.gz") == "gz"
+        assert get_file_extension("gs://bucket/dir.v2/README") == ""
+        assert get_file_extension("/home/user/.bashrc") == ""
+        assert get_file_extension("file.") == ""
+
+    def test_parse_gcs_uri(self):
+        """Test GCS URIs split into bucket and blob path."""
+        from src.gcp_utils import parse_gcs_uri
+
+        assert parse_gcs_uri("gs://bucket/path/to/file.wav") == ("bucket", "path/to/file.wav")
+        for uri in ("gs://bucket", "s3://bucket/file.wav", "bucket/file.wav"):
+            with pytest.raises(ValueError):
+                parse_gcs_uri(uri)
+
+
+class TestGetAudioDuration:
+    """Tests for local audio duration lookup."""
+
+    def test_reads_header_formats_without_librosa(self, tmp_path):
+        """Test WAV durations come from soundfile without decoding."""
+        import numpy as np
+        import soundfile as sf
+
+        from src.gcp_utils import get_audio_duration
+
+        path = tmp_path / "tone.wav"
+        sf.write(path, np.zeros(24000, dtype=np.float32), 16000)
+
+        with patch.dict("sys.modules", {"librosa": None}):
+            assert get_audio_duration(str(path)) == pytest.approx(1.5)
+
+    def test_cost_model_matches_config(self):
+        """Test a pre-resolved cost model gives the same estimate as the config."""
+        from src.gcp_utils import CostModel, estimate_cost
+
+        config = {"cost": {"speech_enhanced_per_15s": 0.012}, "processing": {"segment_duration": 10}}
+
+        assert estimate_cost(95.5, cost_model=CostModel.from_config(config)) == estimate_cost(95.5, config)
+
+
+class TestDurationCache:
+    """Tests for the shared duration cache."""
+
+    def test_keyed_by_generation_with_lru_eviction(self):
+        """Test entries are per object generation and the least recently used one is evicted."""
+        from src.gcp_utils import DurationCache
+
+        cache = DurationCache(maxsize=2)
+        cache.put("gs://b/a.wav", 1, 10.0)
+        cache.put("gs://b/b.wav", 1, 20.0)
+
+        assert cache.get("gs://b/a.wav", 1) == 10.0
+        assert cache.get("gs://b/a.wav", 2) is None
+
+        cache.put("gs://b/c.wav", 1, 30.0)
+        assert cache.get("gs://b/b.wav", 1) is None
+        assert cache.get("gs://b/a.wav", 1) == 10.0
+
+
+class TestGenerateFileId:
+    """Tests for output file IDs."""
+
+    def test_format(self):
+        """Test IDs are a UTC timestamp followed by eight hex characters."""
+        import re
+
+        from src.gcp_utils import generate_file_id
+
+        file_id = generate_file_id()
+
+        assert re.fullmatch(r"\d{8}_\d{6}_[0-9a-f]{8}", file_id)
+        assert generate_file_id() != file_id
@@ -291,3 +291,101 @@ class TestEndToEndWorkflow:
             # Verify output files were created
             assert (output_dir / "test_results.json").exists()
             assert (output_dir / "test_transcript.txt").exists()
+
+
+class TestProcessDirectory:
+    """Tests for directory processing scheduling (with mocked models)."""
+
+    @patch("src.process_audio.Transcriber")
+    @patch("src.process_audio.SituationClassifier")
+    def test_serial_path_passes_preloaded_audio(self, mock_classifier, mock_transcriber):
+        """Test files run in order with audio decoded ahead of processing."""
+        from src.process_audio import AudioProcessor
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch.dict(os.environ):
+            for name in ("a.wav", "b.wav", "c.wav"):
+                create_test_wav_file(Path(tmpdir) / name, duration_seconds=0.5)
+
+            processor = AudioProcessor(num_workers=1, enable_diarization=False, enable_situation=False)
+            processor._process_file_prepared = MagicMock(side_effect=lambda path, *args, **kwargs: Path(path).name)
+
+            results = processor.process_directory(tmpdir, str(Path(tmpdir) / "output"))
+
+        assert results == ["a.wav", "b.wav", "c.wav"]
+        for call in processor._process_file_prepared.call_args_list:
+            audio, sample_rate = call.kwargs["audio"]
+            assert sample_rate == 16000
+            assert len(audio) == 8000
+
+    @patch("src.process_audio.Transcriber")
+    @patch("src.process_audio.SituationClassifier")
+    def test_large_directories_are_processed_quietly(self, mock_classifier, mock_transcriber):
+        """Test runs of more than 10 files switch to quiet per-file output."""
+        from src.process_audio import AudioProcessor
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch.dict(os.environ):
+            for i in range(11):
+                create_test_wav_file(Path(tmpdir) / f"{i:02d}.wav", duration_seconds=0.1)
+
+            processor = AudioProcessor(num_workers=1, enable_diarization=False, enable_situation=False)
+            processor._process_file_prepared = MagicMock(return_value=None)
+
+            processor.process_directory(tmpdir, str(Path(tmpdir) / "output"))
+
+        assert all(call.kwargs["quiet"] for call in processor._process_file_prepared.call_args_list)
+
+    @patch("src.process_audio.Transcriber")
+    def test_deferred_writes_finish_on_flush(self, mock_transcriber):
+        """Test deferred output files are all written once flush_outputs returns."""
+        from src.process_audio import AudioProcessor
+
+        mock_transcriber.return_value.transcribe.return_value = ([], {"language": "en"})
+        mock_transcriber.return_value.config.model_size = "base.en"
+        mock_transcriber.return_value.config.compute_type = "int8"
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch.dict(os.environ):
+            audio_path = Path(tmpdir) / "clip.wav"
+            output_dir = Path(tmpdir) / "output"
+            create_test_wav_file(audio_path, duration_seconds=0.5)
+
+            processor = AudioProcessor(num_workers=1, enable_diarization=False, enable_situation=False, quiet=True)
+            processor.process_file(str(audio_path), str(output_dir), defer_writes=True)
+            processor.flush_outputs()
+
+            assert sorted(p.name for p in output_dir.iterdir()) == ["clip_results.json", "clip_transcript.txt"]
+            assert processor._pending_writes == []
+
+    @patch("src.process_audio.setup_logging")
+    @patch("src.process_audio.Transcriber")
+    @patch("src.process_audio.SituationClassifier")
+    def test_parallel_path_loads_models_only_in_workers(self, mock_classifier, mock_transcriber, mock_setup_logging):
+        """Test worker processes configure logging and load models while the parent loads none."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.process_audio import AudioProcessor
+
+        class InlineProcessPool(ThreadPoolExecutor):
+            """Runs the worker initializer in this process, where the models are patched."""
+
+            def __init__(self, max_workers, mp_context, initializer, initargs):
+                super().__init__(max_workers=1, initializer=initializer, initargs=initargs)
+
+        mock_transcriber.return_value.transcribe.return_value = ([], {"language": "en"})
+        mock_transcriber.return_value.config.model_size = "base.en"
+        mock_transcriber.return_value.config.compute_type = "int8"
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch.dict(os.environ), patch("src.process_audio.ProcessPoolExecutor", InlineProcessPool):
+            for name in ("a.wav", "b.wav", "c.wav"):
+                create_test_wav_file(Path(tmpdir) / name, duration_seconds=0.5)
+
+            processor = AudioProcessor(num_workers=4, processes=2, enable_diarization=False, enable_situation=False, quiet=True)
+            assert processor.transcriber is None
+            mock_transcriber.assert_not_called()
+
+            results = processor.process_directory(tmpdir, str(Path(tmpdir) / "output"))
+
+            assert [Path(r.file_path).name for r in results] == ["a.wav", "b.wav", "c.wav"]
+            assert processor.transcriber is None
+            mock_transcriber.assert_called_once()
+            mock_setup_logging.assert_called_once()
+            assert len(list((Path(tmpdir) / "output").glob("*_results.json"))) == 3
@@ -59,6 +59,16 @@ class TestEnvironmentBackend:
         result = backend.delete_secret("huggingface_token")
         assert result is False
 
+    def test_refresh_picks_up_new_variables(self, mocker):
+        """Test reads use the construction-time snapshot until refreshed."""
+        mocker.patch.dict(os.environ, {}, clear=True)
+        backend = EnvironmentBackend()
+        os.environ["HUGGINGFACE_TOKEN"] = "late-token"
+
+        assert backend.get_secret("huggingface_token") is None
+        backend.refresh()
+        assert backend.get_secret("huggingface_token") == "late-token"
+
 
 class TestKeyringBackend:
     """Tests for KeyringBackend."""
@@ -257,6 +267,20 @@ class TestKeyManager:
         result = km.get_secret("huggingface_token")
         assert result == "env-token"
 
+    def test_get_secret_is_cached_until_changed(self, mocker):
+        """Test repeated reads hit the cache and writes invalidate it."""
+        backend_get = mocker.patch.object(EnvironmentBackend, "get_secret", return_value="cached-token")
+        mocker.patch.object(EnvironmentBackend, "set_secret")
+        km = KeyManager(backend="env", fallback_to_env=False)
+
+        assert km.get_secret("huggingface_token") == "cached-token"
+        assert km.get_secret("huggingface_token") == "cached-token"
+        assert backend_get.call_count == 1
+
+        km.set_secret("huggingface_token", "new-token")
+        km.get_secret("huggingface_token")
+        assert backend_get.call_count == 2
+
     def test_get_huggingface_token_convenience(self, mocker):
         """Test convenience method for HuggingFace token."""
         mocker.patch.dict(os.environ, {"HUGGINGFACE_TOKEN": "hf-token"})
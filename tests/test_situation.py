@@ -23,6 +23,7 @@ class TestSituationConfig:
         assert config.segment_duration == 30.0
         assert config.confidence_threshold == 0.3
         assert config.device == "cpu"
+        assert config.compute_type == "float32"
 
     def test_custom_values(self):
         """Test custom configuration values."""
@@ -56,6 +57,25 @@ class TestSituationMapping:
         assert LABEL_TO_SITUATION.get("vehicle") == "car"
         assert LABEL_TO_SITUATION.get("speech") == "meeting"
 
+    def test_situation_votes(self):
+        """Test labels vote directly and through substring matches."""
+        from src.situation import _situation_votes
+
+        votes = _situation_votes("car alarm")
+        assert votes[0] == ("car", 1.0)
+        assert ("car", 0.5) in votes[1:]
+        assert _situation_votes("unknown_label_xyz") == ()
+
+    def test_situation_weight_matrix(self):
+        """Test per-class weights sum each label's votes by situation."""
+        from src.situation import _SITUATION_INDEX, _situation_votes, _situation_weight_matrix
+
+        weights = _situation_weight_matrix({0: "Car alarm", 1: "Unknown_Label_XYZ"})
+
+        assert weights.shape == (2, len(_SITUATION_INDEX))
+        assert weights[0, _SITUATION_INDEX["car"]] == sum(w for s, w in _situation_votes("car alarm") if s == "car")
+        assert not weights[1].any()
+
 
 class TestSituationSegment:
     """Tests for SituationSegment dataclass."""
@@ -227,3 +247,193 @@ class TestDetermineOverallSituation:
         classifier = SituationClassifier()
         overall = classifier._determine_overall_situation([])
         assert overall == "unknown"
+
+
+class TestClassifyAudioBatching:
+    """Tests for windowing and batching in classify_audio."""
+
+    def test_windows_are_batched(self):
+        """Test windows are split, batched, and mapped back in order."""
+        import numpy as np
+
+        from src.situation import SituationClassifier, SituationConfig
+
+        with patch.object(SituationClassifier, "_load_model"):
+            classifier = SituationClassifier(SituationConfig(segment_duration=2.0, batch_size=2))
+
+        calls = []
+
+        def fake_batch(segments, sample_rate):
+            calls.append([len(s) for s in segments])
+            return [("meeting", 0.9, [{"label": "Speech", "confidence": 0.9}])] * len(segments)
+
+        classifier._classify_batch = fake_batch
+
+        # 7.5 s of audio: three full 2 s windows, one 1.5 s window
+        audio = np.tile(np.array([0.5, -0.5], dtype=np.float32), 3750)
+        segments, overall = classifier.classify_audio(audio, sample_rate=1000)
+
+        assert calls == [[2000, 2000], [2000, 1500]]
+        assert [(s.start, s.end) for s in segments] == [(0.0, 2.0), (2.0, 4.0), (4.0, 6.0), (6.0, 7.5)]
+        assert overall == "meeting"
+
+    def test_short_tail_is_skipped(self):
+        """Test a final window shorter than one second is not classified."""
+        import numpy as np
+
+        from src.situation import SituationClassifier, SituationConfig
+
+        with patch.object(SituationClassifier, "_load_model"):
+            classifier = SituationClassifier(SituationConfig(segment_duration=2.0))
+
+        classifier._classify_batch = Mock(side_effect=lambda segments, sr: [("quiet", 0.5, [])] * len(segments))
+
+        segments, _ = classifier.classify_audio(np.zeros(4500, dtype=np.float32), sample_rate=1000)
+
+        assert [(s.start, s.end) for s in segments] == [(0.0, 2.0), (2.0, 4.0)]
+
+    def test_silent_windows_skip_the_model(self):
+        """Test near-silent windows (including a DC offset) are labelled quiet without inference."""
+        import numpy as np
+
+        from src.situation import SituationClassifier, SituationConfig
+
+        with patch.object(SituationClassifier, "_load_model"):
+            classifier = SituationClassifier(SituationConfig(segment_duration=2.0))
+
+        classifier._classify_batch = Mock(side_effect=lambda segments, sr: [("meeting", 0.9, [])] * len(segments))
+
+        audio = np.full(6000, 0.2, dtype=np.float32)  # DC offset, no signal
+        audio[2000:4000] = np.tile(np.array([0.5, -0.5], dtype=np.float32), 1000)
+        segments, _ = classifier.classify_audio(audio, sample_rate=1000)
+
+        assert [s.situation for s in segments] == ["quiet", "meeting", "quiet"]
+        assert segments[0].confidence == 0.5
+        assert classifier._classify_batch.call_count == 1
+        assert len(classifier._classify_batch.call_args.args[0]) == 1
+        assert classifier.silent_windows_skipped == 2
+
+    def test_silent_windows_do_not_dominate_overall_vote(self):
+        """Test a confidently classified window outweighs an equally long silent one."""
+        import numpy as np
+
+        from src.situation import SituationClassifier, SituationConfig
+
+        with patch.object(SituationClassifier, "_load_model"):
+            classifier = SituationClassifier(SituationConfig(segment_duration=2.0))
+
+        classifier._classify_batch = Mock(side_effect=lambda segments, sr: [("meeting", 0.7, [])] * len(segments))
+
+        audio = np.zeros(4000, dtype=np.float32)
+        audio[2000:] = np.tile(np.array([0.5, -0.5], dtype=np.float32), 1000)
+        segments, overall = classifier.classify_audio(audio, sample_rate=1000)
+
+        assert [s.situation for s in segments] == ["quiet", "meeting"]
+        assert overall == "meeting"
+
+    def test_audio_is_converted_once_before_windowing(self):
+        """Test multi-channel, non-float input reaches the model as float32 mono windows."""
+        import numpy as np
+
+        from src.situation import SituationClassifier, SituationConfig
+
+        with patch.object(SituationClassifier, "_load_model"):
+            classifier = SituationClassifier(SituationConfig(segment_duration=2.0))
+
+        classifier._classify_batch = Mock(side_effect=lambda segments, sr: [("meeting", 0.9, [])] * len(segments))
+
+        stereo = np.tile(np.array([1000, -1000], dtype=np.int16), (2, 2000))
+        segments, _ = classifier.classify_audio(stereo, sample_rate=1000)
+
+        windows = classifier._classify_batch.call_args.args[0]
+        assert [(s.start, s.end) for s in segments] == [(0.0, 2.0), (2.0, 4.0)]
+        assert all(w.dtype == np.float32 and w.ndim == 1 for w in windows)
+
+    def test_int16_pcm_is_scaled_per_window(self):
+        """Test mono int16 PCM is scaled to [-1, 1) and gated at the same level as float audio."""
+        import numpy as np
+
+        from src.situation import SituationClassifier, SituationConfig, _to_float32
+
+        with patch.object(SituationClassifier, "_load_model"):
+            classifier = SituationClassifier(SituationConfig(segment_duration=2.0))
+
+        windows = []
+
+        def fake_batch(segments, sample_rate):
+            windows.extend(segments)
+            return [("meeting", 0.9, [])] * len(segments)
+
+        classifier._classify_batch = fake_batch
+
+        pcm = np.zeros(4000, dtype=np.int16)
+        pcm[2000:] = np.tile(np.array([16384, -16384], dtype=np.int16), 1000)
+        segments, _ = classifier.classify_audio(pcm, sample_rate=1000)
+
+        assert [s.situation for s in segments] == ["quiet", "meeting"]
+        assert len(windows) == 1
+        assert windows[0].dtype == np.int16  # Converted inside _classify_batch, one window at a time
+
+        converted = _to_float32(windows[0])
+        assert converted.dtype == np.float32
+        assert np.abs(converted).max() == 0.5
+
+
+class TestOnnxBackend:
+    """Tests for classification through an ONNX Runtime session."""
+
+    def test_session_logits_map_to_situations(self):
+        """Test session logits give full-softmax top-k probabilities and situations."""
+        from types import SimpleNamespace
+
+        import numpy as np
+
+        from src.situation import SituationClassifier, SituationConfig, _situation_weight_matrix
+
+        with patch.object(SituationClassifier, "_load_model"):
+            classifier = SituationClassifier(SituationConfig(backend="onnx"))
+
+        labels = ["Speech", "Car", "Bird"] + [f"Class {i}" for i in range(9)]
+        logits = np.array([[3.0, 1.0, 0.5] + [0.0] * 9, [0.0, 4.0, 1.0] + [0.0] * 9], dtype=np.float32)
+        classifier.id2label = dict(enumerate(labels))
+        classifier.situation_weights = _situation_weight_matrix(classifier.id2label)
+        classifier.feature_extractor = Mock(return_value={"input_values": np.zeros((2, 4, 4), dtype=np.float32)})
+        classifier._session = Mock()
+        classifier._session.get_inputs.return_value = [SimpleNamespace(name="input_values")]
+        classifier._session.run.return_value = [logits]
+
+        results = classifier._classify_batch([np.zeros(16000, dtype=np.float32)] * 2)
+
+        probs = np.exp(logits) / np.exp(logits).sum(axis=1, keepdims=True)
+        assert [r[0] for r in results] == ["meeting", "car"]
+        assert results[0][2][0] == {"label": "Speech", "confidence": pytest.approx(probs[0, 0])}
+        assert results[1][1] == pytest.approx(probs[1, 1])
+        assert len(results[0][2]) == 10
+
+
+class TestModelCache:
+    """Tests for sharing loaded models between classifiers."""
+
+    def test_same_settings_share_one_load(self):
+        """Test classifiers with equal settings reuse the loaded model until released."""
+        from src.situation import _MODEL_CACHE, SituationClassifier, SituationConfig, _LoadedModel
+
+        def fake_load(config):
+            loaded = _LoadedModel()
+            loaded.model, loaded.feature_extractor, loaded.fbank = Mock(), Mock(), None
+            loaded.forward, loaded.compiled, loaded.session = loaded.model, False, None
+            loaded.id2label, loaded.situation_weights = {0: "Speech"}, None
+            loaded.device, loaded.dtype = "cpu", None
+            return loaded
+
+        with patch("src.situation._load_shared_model", side_effect=fake_load) as load:
+            first = SituationClassifier(SituationConfig(model="test/cache"))
+            second = SituationClassifier(SituationConfig(model="test/cache"))
+            other = SituationClassifier(SituationConfig(model="test/cache", compute_type="int8"))
+
+            assert load.call_count == 2
+            assert second.model is first.model
+            assert other.model is not first.model
+
+            del first, second, other
+            assert ("torch", "test/cache", "cpu", "float32", False) not in _MODEL_CACHE
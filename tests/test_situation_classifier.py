@@ -132,6 +132,16 @@ class TestSituationClassifier:
         assert situation == "meeting"
         # Confidence should be weighted average
 
+    def test_aggregate_predictions_zero_confidence(self, mock_classifier):
+        """Test aggregation falls back to unknown when every segment has zero confidence."""
+        predictions = [
+            SituationPrediction(situation="unknown", confidence=0.0, start_time=0.0, end_time=30.0),
+            SituationPrediction(situation="unknown", confidence=0.0, start_time=30.0, end_time=60.0),
+        ]
+        situation, confidence = mock_classifier._aggregate_predictions(predictions)
+        assert situation == "unknown"
+        assert confidence == 0.0
+
     def test_classify_with_endpoint(self, classifier_with_endpoint):
         """Test classification with real endpoint (mocked)."""
         result = classifier_with_endpoint._predict_segment(
@@ -144,6 +154,85 @@ class TestSituationClassifier:
         assert result.situation == "meeting"
         assert result.confidence == 0.8
 
+    def test_classify_audio_batches_segments(self, classifier_with_endpoint, mocker):
+        """Test segments are sent in chunks of max_batch_size and mapped back in order."""
+        classifier_with_endpoint.max_batch_size = 4
+
+        def predict(instances):
+            situations = ["meeting" if i["start_time"] % 20 == 0 else "office" for i in instances]
+            return mocker.MagicMock(predictions=[{"confidences": {situation: 0.9}} for situation in situations])
+
+        classifier_with_endpoint._endpoint.predict.side_effect = predict
+
+        result = classifier_with_endpoint.classify_audio("gs://test-bucket/test.wav", segment_duration=10.0, total_duration=100.0)
+
+        sizes = [len(call.kwargs["instances"]) for call in classifier_with_endpoint._endpoint.predict.call_args_list]
+        assert sizes == [4, 4, 2]
+        assert [p.start_time for p in result.predictions] == [i * 10.0 for i in range(10)]
+        assert [p.situation for p in result.predictions] == ["meeting", "office"] * 5
+
+    def test_failed_batch_marks_only_its_segments_unknown(self, classifier_with_endpoint, mocker):
+        """Test a failing request does not affect segments sent in other requests."""
+        classifier_with_endpoint.max_batch_size = 2
+
+        def predict(instances):
+            if instances[0]["start_time"] >= 2:
+                raise RuntimeError("boom")
+            return mocker.MagicMock(predictions=[{"confidences": {"car": 0.7}}] * len(instances))
+
+        classifier_with_endpoint._endpoint.predict.side_effect = predict
+
+        predictions = classifier_with_endpoint._predict_segments("gs://test-bucket/test.wav", [(0, 1), (1, 2), (2, 3), (3, 4)])
+
+        assert [p.situation for p in predictions] == ["car", "car", "unknown", "unknown"]
+
+    def test_single_instance_requests_run_concurrently(self, classifier_with_endpoint, mocker):
+        """Test one-segment requests overlap across worker threads and keep segment order."""
+        import threading
+
+        classifier_with_endpoint.max_batch_size = 1
+        classifier_with_endpoint.max_workers = 3
+        barrier = threading.Barrier(3, timeout=5)
+
+        def predict(instances):
+            barrier.wait()  # Only passes once three requests are in flight together
+            situation = SITUATION_LABELS[int(instances[0]["start_time"])]
+            return mocker.MagicMock(predictions=[{"confidences": {situation: 0.9}}])
+
+        classifier_with_endpoint._endpoint.predict.side_effect = predict
+
+        predictions = classifier_with_endpoint._predict_segments("gs://test-bucket/test.wav", [(i, i + 1) for i in range(6)])
+
+        assert [p.situation for p in predictions] == SITUATION_LABELS[:6]
+
+    def test_get_audio_duration_from_header_range(self, classifier_with_endpoint, mocker):
+        """Test duration is read from a ranged header read once per object generation, without a full download."""
+        import io
+        import wave
+
+        from src.gcp_utils import duration_cache
+
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(b"\x00\x00" * 16000 * 3)
+
+        storage = mocker.MagicMock()
+        storage.get_file_metadata.return_value = {"generation": 1}
+        storage.download_range.return_value = buf.getvalue()[:1024]
+
+        duration_cache.clear()
+        assert classifier_with_endpoint._get_audio_duration("gs://test-bucket/test.wav", storage) == 3.0
+        assert classifier_with_endpoint._get_audio_duration("gs://test-bucket/test.wav", storage) == 3.0
+        storage.download_range.assert_called_once()
+
+        storage.get_file_metadata.return_value = {"generation": 2}
+        assert classifier_with_endpoint._get_audio_duration("gs://test-bucket/test.wav", storage) == 3.0
+        assert storage.download_range.call_count == 2
+        storage.download_file.assert_not_called()
+
 
 class TestSituationPrediction:
     """Tests for SituationPrediction dataclass."""
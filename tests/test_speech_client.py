@@ -1,11 +1,15 @@
 """Tests for the Speech-to-Text client."""
 
+import io
+import json
 from dataclasses import dataclass
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
+from google.cloud.speech_v2.types import cloud_speech
 
-from src.speech_client import SpeechClient, TranscriptionResult, TranscriptSegment
+from src.speech_client import SpeechClient, TranscriptionResult, TranscriptSegment, WordColumns, _JsonStreamReader
 
 
 @pytest.fixture
@@ -201,6 +205,88 @@ class TestSpeechClient:
         assert len(result.segments) == 0
         assert result.speaker_count == 0
 
+    def test_transcribe_gcs_batch_groups_files(self, speech_client, mock_speech_response):
+        """Test that many URIs share BatchRecognize requests of at most 15 files."""
+        uris = [f"gs://test-bucket/file{i}.wav" for i in range(20)]
+        file_results = next(iter(mock_speech_response.values()))
+
+        mock_operation = Mock()
+        mock_response = Mock()
+        mock_response.results = {uri: file_results for uri in uris}
+        mock_operation.result.return_value = mock_response
+
+        speech_client._client.batch_recognize.return_value = mock_operation
+
+        results = speech_client.transcribe_gcs_batch(uris)
+
+        assert len(results) == 20
+        assert all(len(r.segments) == 1 for r in results)
+        calls = speech_client._client.batch_recognize.call_args_list
+        assert [len(c.kwargs["request"].files) for c in calls] == [15, 5]
+
+    def test_transcribe_gcs_reads_results_from_gcs(self, speech_client):
+        """Test results written to a GCS prefix are streamed back per file and then deleted."""
+        results = cloud_speech.BatchRecognizeResults(
+            results=[
+                cloud_speech.SpeechRecognitionResult(
+                    alternatives=[cloud_speech.SpeechRecognitionAlternative(transcript="Hello world", confidence=0.9)],
+                    language_code="en-us",
+                )
+            ]
+        )
+        response = cloud_speech.BatchRecognizeResponse(
+            results={
+                "gs://test-bucket/test.wav": cloud_speech.BatchRecognizeFileResult(
+                    cloud_storage_result=cloud_speech.CloudStorageResult(uri="gs://test-bucket/out/test_transcript.json"),
+                )
+            }
+        )
+        mock_operation = Mock()
+        mock_operation.result.return_value = response
+        speech_client._client.batch_recognize.return_value = mock_operation
+        storage = Mock()
+        storage.open_text.return_value = io.StringIO(cloud_speech.BatchRecognizeResults.to_json(results))
+
+        result = speech_client.transcribe_gcs(
+            gcs_uri="gs://test-bucket/test.wav",
+            output_gcs_prefix="gs://test-bucket/out/",
+            storage_manager=storage,
+        )
+
+        request = speech_client._client.batch_recognize.call_args.kwargs["request"]
+        assert request.recognition_output_config.gcs_output_config.uri == "gs://test-bucket/out/"
+        storage.open_text.assert_called_once_with("gs://test-bucket/out/test_transcript.json")
+        storage.delete_file.assert_called_once_with("gs://test-bucket/out/test_transcript.json")
+        assert [s.text for s in result.segments] == ["Hello world"]
+
+
+class TestJsonStreamReader:
+    """Tests for streaming results arrays out of large JSON documents."""
+
+    @pytest.mark.parametrize("chunk_chars", [1, 5, 1 << 20])
+    def test_iter_array_matches_json_loads(self, chunk_chars):
+        """Test items come out intact whatever the chunk boundaries, skipping other members."""
+        document = {
+            "metadata": {"totalBilledDuration": "60s", "nested": [1, {"a": None}]},
+            "results": [{"alternatives": [{"transcript": f"word {i}", "confidence": 0.5 + i / 100}], "resultEndOffset": f"{i}.5s"} for i in range(20)],
+            "count": 12345,
+        }
+        text = json.dumps(document, indent=2)
+
+        items = list(_JsonStreamReader(io.StringIO(text), chunk_chars).iter_array("results"))
+
+        assert items == document["results"]
+
+    def test_iter_array_missing_or_empty(self):
+        """Test documents without results, or with an empty array, yield nothing."""
+        assert list(_JsonStreamReader(io.StringIO("{}")).iter_array("results")) == []
+        assert list(_JsonStreamReader(io.StringIO('{"results": []}')).iter_array("results")) == []
+
+    def test_truncated_document_raises(self):
+        """Test a truncated document is reported rather than silently cut short."""
+        with pytest.raises(ValueError):
+            list(_JsonStreamReader(io.StringIO('{"results": [{"a": 1}, {"b"'), 4).iter_array("results"))
+
 
 class TestTranscriptSegment:
     """Tests for TranscriptSegment dataclass."""
@@ -214,7 +300,6 @@ class TestTranscriptSegment:
             speaker_tag=1,
             confidence=0.95,
             language_code="en-US",
-            words=[{"word": "Hello", "start_time": 0.0}],
         )
 
         result = segment.to_dict()
@@ -225,6 +310,58 @@ class TestTranscriptSegment:
         assert result["speaker_tag"] == 1
         assert result["confidence"] == 0.95
 
+    def test_to_dict_expands_word_columns(self):
+        """Test columnar words are written out as per-word dictionaries."""
+        segment = TranscriptSegment(
+            start_time=0.0,
+            end_time=1.0,
+            text="Hello world",
+            word_columns=WordColumns(
+                texts=["Hello", "world"],
+                starts=np.array([0.0, 0.5]),
+                ends=np.array([0.5, 1.0]),
+                confidences=np.array([0.95, 0.9]),
+                speakers=np.array([1, None], dtype=object),
+            ),
+        )
+
+        assert segment.to_dict()["words"] == [
+            {"word": "Hello", "start_time": 0.0, "end_time": 0.5, "confidence": 0.95, "speaker_tag": 1},
+            {"word": "world", "start_time": 0.5, "end_time": 1.0, "confidence": 0.9, "speaker_tag": None},
+        ]
+
+    def test_parsed_segment_exposes_words(self, speech_client, mock_speech_response):
+        """Test segments parsed from an API response expose their words."""
+        response = Mock()
+        response.results = mock_speech_response
+
+        result = speech_client._parse_batch_response(response, "gs://test-bucket/test.wav", "long", "en-US", enable_diarization=True)
+
+        segment = result.segments[0]
+        assert [w["word"] for w in segment.words] == ["Hello", "world", "how", "are", "you"]
+        assert segment.words[1] == {"word": "world", "start_time": 0.5, "end_time": 1.0, "confidence": 0.92, "speaker_tag": 1}
+        assert segment.to_dict()["words"] == segment.words
+
+    def test_segments_with_different_words_are_not_equal(self):
+        """Test word timings take part in segment equality."""
+
+        def make_segment(word_ends):
+            return TranscriptSegment(
+                start_time=0.0,
+                end_time=1.0,
+                text="Hello world",
+                word_columns=WordColumns(
+                    texts=["Hello", "world"],
+                    starts=np.array([0.0, 0.5]),
+                    ends=np.array(word_ends),
+                    confidences=np.array([0.95, 0.9]),
+                    speakers=np.array([1, None], dtype=object),
+                ),
+            )
+
+        assert make_segment([0.5, 1.0]) == make_segment([0.5, 1.0])
+        assert make_segment([0.5, 1.0]) != make_segment([0.4, 1.0])
+
 
 class TestTranscriptionResult:
     """Tests for TranscriptionResult dataclass."""
@@ -273,6 +410,25 @@ class TestTranscriptionResult:
         assert "Hello." in transcript
         assert "Hi there." in transcript
 
+    def test_get_full_transcript_spacing(self):
+        """Test speaker turns start new lines without stray spaces."""
+        segments = [
+            TranscriptSegment(start_time=0.0, end_time=1.0, text="Hello.", speaker_tag=0),
+            TranscriptSegment(start_time=1.0, end_time=2.0, text="Anyone there?", speaker_tag=0),
+            TranscriptSegment(start_time=2.0, end_time=3.0, text="Hi.", speaker_tag=1),
+        ]
+
+        result = TranscriptionResult(
+            segments=segments,
+            speaker_count=2,
+            total_duration=3.0,
+            language_code="en-US",
+            model_used="long",
+        )
+
+        assert result.get_full_transcript() == "[Speaker 1] Hello. Anyone there?\n[Speaker 2] Hi."
+        assert result.get_full_transcript(include_speakers=False) == "Hello. Anyone there? Hi."
+
     def test_get_full_transcript_without_speakers(self):
         """Test full transcript generation without speaker labels."""
         segments = [
@@ -315,3 +471,21 @@ class TestTranscriptionResult:
         assert data["total_duration"] == 60.0
         assert data["language_code"] == "en-US"
         assert data["model_used"] == "long"
+
+    def test_columns_built_from_segments(self):
+        """Test columnar view mirrors segment fields."""
+        result = TranscriptionResult(
+            segments=[
+                TranscriptSegment(start_time=0.0, end_time=1.5, text="Hello.", speaker_tag=0),
+                TranscriptSegment(start_time=1.5, end_time=3.0, text="Hi.", speaker_tag=None),
+            ],
+            speaker_count=1,
+            total_duration=3.0,
+            language_code="en-US",
+            model_used="long",
+        )
+
+        assert result.columns.starts.tolist() == [0.0, 1.5]
+        assert result.columns.ends.tolist() == [1.5, 3.0]
+        assert result.columns.speakers.tolist() == [0, None]
+        assert result.columns.texts.tolist() == ["Hello.", "Hi."]
@@ -283,3 +283,17 @@ class TestGCSURIParsing:
 
         with pytest.raises(ValueError):
             manager._parse_gcs_uri("s3://wrong-protocol/file.wav")
+
+
+class TestJSONSerialization:
+    """Tests for JSON payload serialization."""
+
+    def test_dumps_json_round_trip(self):
+        """Test serialized payload decodes to the stdlib-equivalent structure."""
+        from datetime import datetime
+
+        from src.storage_manager import _dumps_json
+
+        data = {"segments": [{"text": "Hello", "start": 0.5}], "created": datetime(2025, 1, 1, 12, 0), 1: "one"}
+
+        assert json.loads(_dumps_json(data)) == json.loads(json.dumps(data, default=str))